@@ -0,0 +1,53 @@
+import argparse
+import os
+import tempfile
+from time import perf_counter
+
+from kxrlib.io import KResourceDir
+
+EXTENSIONS = ["nut", "png", "txt", "kmd", "ogg", "dds", "mot"]
+
+
+def populate_tree(root: str, num_files: int, files_per_dir: int = 200):
+    for i in range(num_files):
+        dir_path = os.path.join(root, f"group_{i // (files_per_dir * 10)}", f"dir_{i // files_per_dir}")
+
+        if i % files_per_dir == 0:
+            os.makedirs(dir_path, exist_ok=True)
+
+        with open(os.path.join(dir_path, f"file_{i}.{EXTENSIONS[i % len(EXTENSIONS)]}"), "wb") as file:
+            file.write(b"\0" * (i % 64))
+
+
+def bench_scan(src_dir: str, max_workers: int, repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = perf_counter()
+        KResourceDir.from_dir_recursion(src_dir, max_workers=max_workers)
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure source tree scanning time")
+    parser.add_argument("source_dir", nargs="?", help="Existing directory to scan (a synthetic tree is generated if omitted)")
+    parser.add_argument("-f", "--files", type=int, default=50000, help="Number of files in the synthetic tree")
+    parser.add_argument("-n", "--repeat", type=int, default=3, help="Runs per case")
+    parser.add_argument("-j", "--jobs", type=int, nargs="*", default=[0, 4, 8], help="Thread counts to compare (0 = sequential)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src_dir = args.source_dir
+
+        if src_dir is None:
+            src_dir = os.path.join(tmp_dir, "src")
+            populate_tree(src_dir, args.files)
+
+        for max_workers in args.jobs:
+            print(f"max_workers={max_workers:<3} : {bench_scan(src_dir, max_workers, args.repeat) * 1000:9.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    "main.py -h": [sys.executable, os.path.join(ROOT_DIR, "main.py"), "-h"],
+    "from kxrlib import KxrFile": [sys.executable, "-c", "from kxrlib import KxrFile"],
+    "import kxrlib": [sys.executable, "-c", "import kxrlib"],
+    "python (baseline)": [sys.executable, "-c", "pass"]
+}
+
+
+def check_lazy_attributes() -> list[str]:
+    """Imports every lazy top-level attribute in a fresh interpreter, so circular imports hidden by import order show up."""
+    sys.path.insert(0, ROOT_DIR)
+    import kxrlib
+
+    failures = []
+
+    for name in kxrlib._LAZY_ATTRIBUTES:
+        completed = subprocess.run([sys.executable, "-c", f"from kxrlib import {name}"], cwd=ROOT_DIR, capture_output=True, text=True)
+
+        if completed.returncode != 0:
+            failures.append(f"{name}: {completed.stderr.strip().splitlines()[-1]}")
+
+    return failures
+
+
+def bench_startup(repeat: int = 20) -> dict[str, list[float]]:
+    results = {}
+
+    for name, command in CASES.items():
+        timings = []
+
+        for _ in range(repeat):
+            start = perf_counter()
+            subprocess.run(command, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, check=True)
+            timings.append(perf_counter() - start)
+
+        results[name] = timings
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CLI and import startup time")
+    parser.add_argument("-n", "--repeat", type=int, default=20, help="Runs per case")
+    args = parser.parse_args()
+
+    failures = check_lazy_attributes()
+
+    if failures:
+        sys.exit("Lazy imports failed:\n" + "\n".join(failures))
+
+    results = bench_startup(args.repeat)
+
+    width = max(len(name) for name in results)
+
+    for name, timings in results.items():
+        print(f"{name:<{width}} : min {min(timings) * 1000:7.2f}ms | median {statistics.median(timings) * 1000:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,61 @@
-from .io import ByteBuffer
-from .io import DataFormat
-from .io import KResource
-from .io import KResourceFile
-from .io import KResourceDir
-from .io import KFile
-from .io import KxrFile
-from .io import KxrHeaderEntry
-from .io import FileType
-from .io import FileCriteria
-
-from .packaging import KxrPacker
-from .packaging import KxrUnpacker
-
-from .utils import pack_kxr
-from .utils import unpack_kxr
-
-__all__ = [
+from importlib import import_module
+
+TYPE_CHECKING = False  # avoids importing typing at startup
+
+if TYPE_CHECKING:
+    from .io import ByteBuffer, DataFormat, KResource, KResourceFile, KResourceDir, KFile, KxrFile, KxrHeaderEntry, KxrOverlay, FileType, FileCriteria
+    from .metrics import Stage, StageMetrics
+    from .events import EventBus, ProgressRenderer, BatchedLogWriter, JsonLinesSink
+    from .packaging import KxrPacker, KxrUnpacker
+    from .utils import pack_kxr, unpack_kxr
+
+_LAZY_ATTRIBUTES = {
     # io
-    "ByteBuffer",
-    "DataFormat",
-    "KResource",
-    "KResourceFile",
-    "KResourceDir",
-    "KFile",
-    "KxrFile",
-    "KxrHeaderEntry",
-    "FileType",
-    "FileCriteria",
+    "ByteBuffer": ".io",
+    "DataFormat": ".io",
+    "KResource": ".io",
+    "KResourceFile": ".io",
+    "KResourceDir": ".io",
+    "KFile": ".io",
+    "KxrFile": ".io",
+    "KxrHeaderEntry": ".io",
+    "KxrOverlay": ".io",
+    "FileType": ".io",
+    "FileCriteria": ".io",
+
+    # metrics
+    "Stage": ".metrics",
+    "StageMetrics": ".metrics",
+
+    # events
+    "EventBus": ".events",
+    "ProgressRenderer": ".events",
+    "BatchedLogWriter": ".events",
+    "JsonLinesSink": ".events",
 
     # packaging
-    "KxrPacker",
-    "KxrUnpacker",
+    "KxrPacker": ".packaging",
+    "KxrUnpacker": ".packaging",
 
     # utils
-    "pack_kxr",
-    "unpack_kxr"
-]
+    "pack_kxr": ".utils",
+    "unpack_kxr": ".utils"
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
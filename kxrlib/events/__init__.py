@@ -0,0 +1,17 @@
+from .event import Event
+from .event_type import EventType
+from .event_consumer import EventConsumer
+from .event_bus import EventBus
+from .progress_renderer import ProgressRenderer
+from .batched_log_writer import BatchedLogWriter
+from .json_lines_sink import JsonLinesSink
+
+__all__ = [
+    "Event",
+    "EventType",
+    "EventConsumer",
+    "EventBus",
+    "ProgressRenderer",
+    "BatchedLogWriter",
+    "JsonLinesSink"
+]
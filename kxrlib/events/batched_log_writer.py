@@ -0,0 +1,49 @@
+import logging
+from logging import Logger
+
+from .event import Event
+from .event_type import EventType
+from .event_consumer import EventConsumer
+
+
+class BatchedLogWriter(EventConsumer):
+    def __init__(self, logger: Logger, batch_size: int = 1000, level: int = logging.INFO):
+        if batch_size < 1:
+            raise ValueError(f"Keyword argument 'batch_size' must be at least 1, not {batch_size}")
+
+        self.logger = logger
+        self.batch_size = batch_size
+        self.level = level
+
+        self._batch: list[Event] = []
+
+    def handle(self, event: Event):
+        if event.type is EventType.FILE_PROCESSED or event.type is EventType.DIR_PROCESSED:
+            self._batch.append(event)
+
+            if len(self._batch) >= self.batch_size:
+                self.flush()
+        elif event.type is EventType.END:
+            self.flush()
+
+    def flush(self):
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        lines = [
+            f"Processed \"{event.path}\": "
+            f"offset={event.offset} "
+            f"size={event.size} "
+            f"zipped={event.zipped}"
+            for event in batch
+        ]
+
+        self.logger.log(self.level, f"Processed {len(batch)} entries:\n" + "\n".join(lines))
+
+    def close(self):
+        self.flush()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .event_type import EventType
+
+
+@dataclass(slots=True)
+class Event:
+    type: EventType
+    operation: str
+    path: str | None = None
+    offset: int | None = None
+    size: int | None = None
+    zipped: bool | None = None
+    current: int = 0
+    total: int = 0
+    data_size: int = 0
+    time: float = 0.0
+
+    @property
+    def as_dict(self) -> dict[str, str | int | float | bool | None]:
+        return {
+            "type": self.type.value,
+            "operation": self.operation,
+            "path": self.path,
+            "offset": self.offset,
+            "size": self.size,
+            "zipped": self.zipped,
+            "current": self.current,
+            "total": self.total,
+            "data_size": self.data_size,
+            "time": self.time
+        }
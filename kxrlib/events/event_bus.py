@@ -0,0 +1,32 @@
+from .event import Event
+from .event_consumer import EventConsumer
+
+
+class EventBus:
+    def __init__(self, consumers: list[EventConsumer] | None = None):
+        self._consumers: list[EventConsumer] = []
+
+        if consumers is not None:
+            for consumer in consumers:
+                self.subscribe(consumer)
+
+    def subscribe(self, consumer: EventConsumer):
+        if not isinstance(consumer, EventConsumer):
+            raise TypeError(f"Argument 'consumer' must be {EventConsumer}, not {type(consumer)}")
+
+        self._consumers.append(consumer)
+
+    def unsubscribe(self, consumer: EventConsumer):
+        self._consumers.remove(consumer)
+
+    def publish(self, event: Event):
+        for consumer in self._consumers:
+            consumer.handle(event)
+
+    def close(self):
+        for consumer in self._consumers:
+            consumer.close()
+
+    @property
+    def active(self) -> bool:
+        return bool(self._consumers)
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from .event import Event
+
+
+class EventConsumer(ABC):
+    @abstractmethod
+    def handle(self, event: Event):
+        ...
+
+    def close(self):
+        pass
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class EventType(Enum):
+    BEGIN = "begin"
+    FILE_PROCESSED = "file_processed"
+    DIR_PROCESSED = "dir_processed"
+    END = "end"
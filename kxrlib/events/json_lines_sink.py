@@ -0,0 +1,30 @@
+import io
+import json
+from typing import TextIO
+
+from .event import Event
+from .event_consumer import EventConsumer
+
+
+class JsonLinesSink(EventConsumer):
+    def __init__(self, file: str | TextIO, buffer_size: int = 1024 ** 2):
+        if isinstance(file, str):
+            self._stream = open(file, "w", buffering=buffer_size, encoding="utf-8")
+            self._owns_stream = True
+        elif isinstance(file, io.TextIOBase):
+            self._stream = file
+            self._owns_stream = False
+        else:
+            raise TypeError(f"Argument 'file' must be one of {(str, TextIO)}, not {type(file)}")
+
+        self._encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def handle(self, event: Event):
+        self._stream.write(self._encode(event.as_dict))
+        self._stream.write("\n")
+
+    def close(self):
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
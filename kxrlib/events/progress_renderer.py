@@ -0,0 +1,65 @@
+import sys
+from time import perf_counter
+from typing import TextIO
+
+from kxrlib.console import format_time, generate_progress_bar
+from .event import Event
+from .event_type import EventType
+from .event_consumer import EventConsumer
+
+
+class ProgressRenderer(EventConsumer):
+    def __init__(self, max_fps: float = 10.0, stream: TextIO | None = None):
+        if max_fps <= 0:
+            raise ValueError(f"Keyword argument 'max_fps' must be greater than 0, not {max_fps}")
+
+        self.stream = stream if stream is not None else sys.stdout
+        self.interval = 1 / max_fps
+
+        self._is_tty = self.stream.isatty()
+        self._start_time = 0.0
+        self._last_render = 0.0
+
+    def handle(self, event: Event):
+        match event.type:
+            case EventType.BEGIN:
+                self._start_time = perf_counter()
+                self._last_render = 0.0
+
+                if event.total:
+                    self.stream.write("\n")
+
+            case EventType.FILE_PROCESSED:
+                if not self._is_tty:
+                    return
+
+                now = perf_counter()
+
+                if now - self._last_render >= self.interval:
+                    self._last_render = now
+                    self._render(event, now)
+
+            case EventType.END:
+                if event.total:
+                    self._render(event, perf_counter())
+                    self.stream.write("\n")
+                    self.stream.flush()
+
+    def _render(self, event: Event, now: float):
+        current = event.current / event.total if event.total else 1.0
+
+        megabytes = event.data_size / (1024 ** 2)
+
+        formatted_elapsed_time = format_time(now - self._start_time)
+
+        bar = generate_progress_bar(current)
+
+        progress_string = (
+            f"\r{event.operation.capitalize()}ing file: ({event.current}/{event.total}) | "
+            f"Data {event.operation}ed: {megabytes:.2f}MB | "
+            f"Time elapsed: {formatted_elapsed_time} | "
+            f"{bar} {round(current * 100, 2)}%"
+        )
+
+        self.stream.write(progress_string)
+        self.stream.flush()
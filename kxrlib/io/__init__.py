@@ -1,10 +1,18 @@
 from .byte_buffer import ByteBuffer, DataFormat
-from .resource import KResource, KResourceFile, KResourceDir
+from .resource import KResource, KResourceFile, KResourceDir, KMemoryFile, KGeneratedFile
 from .kfile import KFile
 from .kxr_file import KxrFile
 from .kxr_header_entry import KxrHeaderEntry
 from .open_mode import OpenMode
 from .file_type import FileType, FileCriteria
+from .access_trace import AccessTrace
+from .kxr_blob import KxrBlob
+from .kxr_overlay import KxrOverlay
+from .kxr_index_cache import KxrIndexCache
+from .entry_filter import EntryFilter
+from .kxr_append_writer import KxrAppendWriter
+from .kxr_header_scanner import KxrHeaderScanner
+from .kxr_manifest import iter_manifest, read_manifest
 
 __all__ = [
     "ByteBuffer",
@@ -12,10 +20,36 @@ __all__ = [
     "KResource",
     "KResourceFile",
     "KResourceDir",
+    "KTarMemberFile",
+    "KZipMemberFile",
+    "KMemoryFile",
+    "KGeneratedFile",
     "KFile",
     "KxrFile",
     "KxrHeaderEntry",
     "OpenMode",
     "FileType",
-    "FileCriteria"
+    "FileCriteria",
+    "AccessTrace",
+    "KxrBlob",
+    "KxrOverlay",
+    "KxrIndexCache",
+    "EntryFilter",
+    "KxrAppendWriter",
+    "KxrHeaderScanner",
+    "iter_manifest",
+    "read_manifest"
 ]
+
+
+def __getattr__(name: str):
+    if name in ("KTarMemberFile", "KZipMemberFile"):
+        from . import resource
+
+        return getattr(resource, name)
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
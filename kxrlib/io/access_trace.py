@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .kxr_file import KxrFile
+
+
+class AccessTrace:
+    """
+    [Access trace format]
+     - UTF-8 text, one entry path (relative to the KXR root) per line, in the order get_content was called
+    """
+
+    def __init__(self, paths: list[str] | None = None):
+        self.paths: list[str] = paths if paths is not None else []
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths)
+
+    def record(self, path: str):
+        self.paths.append(path)
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(f"{entry_path}\n" for entry_path in self.paths)
+
+    def seek_distance(self, kxr_file: KxrFile) -> dict[str, int]:
+        if kxr_file.root is None:
+            raise ValueError(f"Kxr file must be opened to measure seek distance: {kxr_file}")
+
+        stats = {
+            "reads": 0,
+            "seeks": 0,
+            "seek_distance": 0,
+            "missing": 0
+        }
+
+        position: int | None = None
+
+        for path in self.paths:
+            entry = kxr_file.root.get_entry(path)
+
+            if entry is None or entry.is_dir:
+                stats["missing"] += 1
+                continue
+
+            if position is not None and entry.offset != position:
+                stats["seeks"] += 1
+                stats["seek_distance"] += abs(entry.offset - position)
+
+            stats["reads"] += 1
+            position = entry.offset + entry.size
+
+        return stats
+
+    @property
+    def ranks(self) -> dict[str, int]:
+        ranks = {}
+
+        for path in self.paths:
+            ranks.setdefault(path, len(ranks))
+
+        return ranks
+
+    @classmethod
+    def load(cls, path: str) -> AccessTrace:
+        with open(path, "r", encoding="utf-8") as file:
+            return cls([line.rstrip("\n") for line in file if line.strip()])
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import re
+import sys
+from array import array
+from struct import Struct
+
+from .data_format import DataFormat
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+INT_TYPECODE = "i" if array("i").itemsize == 4 else "l"
+
+# {data format: (struct char, array typecode, numpy dtype)}, all big-endian like the scalar Reader/Writer
+ARRAY_FORMATS: dict[DataFormat, tuple[str, str, str]] = {
+    DataFormat.INT: ("i", INT_TYPECODE, ">i4"),
+    DataFormat.SHORT: ("h", "h", ">i2"),
+    DataFormat.BYTE: ("B", "B", "u1"),
+    DataFormat.HALF: ("e", "f", ">f2"),
+    DataFormat.FLOAT: ("f", "f", ">f4"),
+    DataFormat.DOUBLE: ("d", "d", ">f8")
+}
+
+RECORD_FIELD = re.compile(r"(\d*)(.)")
+
+
+def array_format(data_format: DataFormat) -> tuple[str, str, str]:
+    if data_format not in ARRAY_FORMATS:
+        raise ValueError(f"Data format '{data_format.value}' has no fixed-size array representation, must be one of {[member.value for member in ARRAY_FORMATS]}")
+
+    return ARRAY_FORMATS[data_format]
+
+
+def item_size(data_format: DataFormat) -> int:
+    return Struct(">" + array_format(data_format)[0]).size
+
+
+def unpack_array(data: bytes | memoryview, data_format: DataFormat) -> array:
+    """
+    Decodes big-endian items into an array.array in one call. Half floats have no array typecode,
+    so they go through struct and are widened to 'f'.
+    """
+    char, typecode, _ = array_format(data_format)
+
+    if data_format is DataFormat.HALF:
+        return array(typecode, Struct(f">{len(data) // 2}e").unpack(data))
+
+    values = array(typecode)
+    values.frombytes(data)
+
+    if sys.byteorder == "little" and values.itemsize > 1:
+        values.byteswap()
+
+    return values
+
+
+def pack_array(values, data_format: DataFormat) -> bytes:
+    char, typecode, dtype = array_format(data_format)
+
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return numpy.ascontiguousarray(values, dtype=dtype).tobytes()
+
+    if data_format is DataFormat.HALF:
+        values = list(values)
+
+        return Struct(f">{len(values)}e").pack(*values)
+
+    values = array(typecode, values)
+
+    if sys.byteorder == "little" and values.itemsize > 1:
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def record_struct(layout: str | Struct) -> Struct:
+    """
+    Record layouts use the DataFormat chars of get/put ('s' short, 'h' half, ...) with optional repeat counts,
+    e.g. "3f2hi", and are read big-endian, unaligned. Anything else (unsigned fields, padding) needs an explicit Struct.
+    """
+    if isinstance(layout, Struct):
+        return layout
+    if not isinstance(layout, str):
+        raise TypeError(f"Argument 'layout' must be one of {(str, Struct)}, not {type(layout)}")
+
+    chars = []
+
+    for match in RECORD_FIELD.finditer(layout.replace(" ", "")):
+        repeat, char = match.groups()
+
+        data_format = next((member for member in ARRAY_FORMATS if member.value == char), None)
+
+        if data_format is None:
+            raise ValueError(f"Record layout '{layout}' contains '{char}', must only contain {[member.value for member in ARRAY_FORMATS]} with optional repeat counts")
+
+        chars.append(repeat + ARRAY_FORMATS[data_format][0])
+
+    if not chars:
+        raise ValueError("Record layout must not be empty")
+
+    return Struct(">" + "".join(chars))
@@ -1,13 +1,14 @@
 import zlib
 from io import BytesIO
+from struct import Struct
 
 from .data_format import DataFormat
 from .reader import reader
 from .writer import writer
 from .types import DataType
-
-MODULO = 2**32
-MASK = MODULO - 1
+from .crypt import crypt_into
+from .packed import encode_packed_array, decode_packed_array
+from .arrays import numpy, array_format, item_size, unpack_array, pack_array, record_struct
 
 
 class ByteBuffer:
@@ -60,28 +61,106 @@ class ByteBuffer:
 
         self._write(data_format, data)
 
-    def crypt(self, magic: int):
-        data_array = bytearray(self.buffer)
-        i = 0
+    def get_array(self, data_format: DataFormat | str, count: int, as_numpy: bool = False):
+        """
+        Reads count big-endian items of a fixed-size format in one call, as an array.array,
+        or with as_numpy as a NumPy view over the buffer itself (no copy; the buffer cannot be
+        resized while the view is alive).
+        """
+        data_format = self._array_data_format(data_format)
+        view = self._take(item_size(data_format) * self._check_count(count))
+
+        if as_numpy:
+            if numpy is None:
+                raise ModuleNotFoundError("NumPy is required for Argument 'as_numpy'")
+
+            return numpy.frombuffer(view, dtype=array_format(data_format)[2], count=count)
+
+        with view:
+            return unpack_array(view, data_format)
+
+    def put_array(self, data_format: DataFormat | str, values):
+        data_format = self._array_data_format(data_format)
+
+        self._write_raw(pack_array(values, data_format))
+
+    def get_packed_array(self, count: int, as_numpy: bool = False):
+        """Decodes count consecutive packed values in one pass, as array.array('Q') or, with as_numpy, a uint64 array."""
+        self._check_count(count)
+
+        pos = self.pos
+        end = len(self) if self.capacity == -1 else min(len(self), self.capacity)
+
+        with self._buffer.getbuffer() as view:
+            values, consumed = decode_packed_array(view[pos:end], count, as_numpy)
+
+        self.pos = pos + consumed
+
+        return values
+
+    def put_packed_array(self, values):
+        self._write_raw(encode_packed_array(values))
+
+    def get_records(self, layout: str | Struct, count: int) -> list[tuple]:
+        """
+        Reads count consecutive fixed-layout records in one call. layout is a string of DataFormat chars
+        with optional repeat counts (e.g. "3f2hi": 3 floats, 2 half floats, 1 int) or an explicit Struct.
+        """
+        record = record_struct(layout)
+
+        with self._take(record.size * self._check_count(count)) as view:
+            return list(record.iter_unpack(view))
+
+    def get_record_array(self, dtype, count: int):
+        """NumPy structured view of count consecutive records, e.g. dtype [("pos", ">f4", 3), ("uv", ">f2", 2)]."""
+        if numpy is None:
+            raise ModuleNotFoundError("NumPy is required for structured record arrays")
+
+        dtype = numpy.dtype(dtype)
 
-        while i < len(data_array):
-            if (i % 4 == 0) and (i > 0):
-                magic = ((magic * 2) & MASK) | (((~((magic >> 3) ^ magic)) & MASK) >> 0x0D) & 1
+        return numpy.frombuffer(self._take(dtype.itemsize * self._check_count(count)), dtype=dtype, count=count)
 
-            if (i + 4) < len(data_array):
-                data_segment = int.from_bytes(data_array[i:i + 4], byteorder="little")
-                data_segment ^= magic
+    def _take(self, size: int) -> memoryview:
+        """Advances past size bytes and returns them as a view over the underlying buffer."""
+        pos = self.pos
 
-                data_array[i:i + 4] = data_segment.to_bytes(4, byteorder="little")
-                i += 4
-            else:
-                magic_mod = magic >> (8 * (i % 4)) & 0xFF
+        if self.capacity != -1 and pos + size > self.capacity:
+            raise BufferError("Reading the data would cause a buffer overflow")
+        if pos + size > len(self):
+            raise EOFError(f"Expected {size} bytes at position {pos}, only {len(self) - pos} remain")
+
+        self.pos = pos + size
+
+        return self._buffer.getbuffer()[pos:pos + size]
+
+    def _write_raw(self, data: bytes):
+        if self.capacity != -1 and self.pos + len(data) > self.capacity:
+            raise BufferError("Writing the data would cause a buffer overflow")
+
+        self._buffer.write(data)
+
+    @staticmethod
+    def _check_count(count: int) -> int:
+        if not isinstance(count, int):
+            raise TypeError(f"Argument 'count' must be {int}, not {type(count)}")
+        if count < 0:
+            raise ValueError(f"Argument 'count' must not be negative, got {count}")
 
-                single_byte = data_array[i]
-                single_byte ^= magic_mod
+        return count
+
+    @staticmethod
+    def _array_data_format(data_format: DataFormat | str) -> DataFormat:
+        if not isinstance(data_format, DataFormat) and not isinstance(data_format, str):
+            raise TypeError(f"Argument 'data_format' must be one of {(DataFormat, str)}, not {type(data_format)}")
+        if isinstance(data_format, str) and data_format not in DataFormat.chars():
+            raise ValueError(f"Argument 'data_format' as {str} must be one of {DataFormat.chars()}, not '{data_format}'")
+
+        return DataFormat(data_format) if isinstance(data_format, str) else data_format
+
+    def crypt(self, magic: int):
+        data_array = bytearray(self.buffer)
 
-                data_array[i] = single_byte
-                i += 1
+        crypt_into(data_array, magic)
 
         self.buffer = bytes(data_array)
 
@@ -0,0 +1,37 @@
+from struct import pack
+
+MODULO = 2**32
+MASK = MODULO - 1
+
+STEP_BITS = 14
+STEP_MASK = (1 << STEP_BITS) - 1
+STEP_SHIFTS = range(STEP_BITS, 0, -1)
+
+
+def keystream(magic: int, size: int) -> bytes:
+    """
+    The magic advances once per 4-byte word and each word is XORed with it in little-endian order,
+    so the keystream only depends on the starting magic and a prefix of it decrypts a prefix of the data.
+
+    Each advance shifts in the inverse of bits 16 and 13, so the next 14 shifted-in bits only depend
+    on the current magic: one step produces the magics of 14 words at once.
+    """
+    magic &= MASK
+    num_words = (size + 3) // 4
+    magics = []
+
+    for _ in range((num_words + STEP_BITS - 1) // STEP_BITS):
+        extended = (magic << STEP_BITS) | (~((magic >> 3) ^ magic) & STEP_MASK)
+        magics.extend([(extended >> shift) & MASK for shift in STEP_SHIFTS])
+        magic = extended & MASK
+
+    return pack(f"<{num_words}I", *magics[:num_words])[:size]
+
+
+def crypt_into(data: bytearray, magic: int):
+    size = len(data)
+
+    if not size:
+        return
+
+    data[:] = (int.from_bytes(data, "little") ^ int.from_bytes(keystream(magic, size), "little")).to_bytes(size, "little")
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import re
+import sys
+from array import array
+from functools import cache
+from struct import Struct
+
+from .arrays import numpy
+
+# Packed values are unsigned LEB128: 7 bits per byte, least significant group first,
+# the high bit of a byte set while more bytes follow; values are bounded to 64 bits
+MAX_PACKED_SIZE = 10
+MAX_PACKED_VALUE = (1 << 64) - 1
+
+PACKED_VALUE = re.compile(rb"[\x80-\xff]{0,%d}[\x00-\x7f]" % (MAX_PACKED_SIZE - 1))
+OVERLONG_PACKED_VALUE = re.compile(rb"[\x80-\xff]{%d}" % MAX_PACKED_SIZE)
+LOW_BITS = bytes(byte & 0x7F for byte in range(256))
+
+# Squeezes the 7 payload bits of every byte of a little-endian int together, in 4 steps whatever the length
+COMPACT_STEPS = (
+    (0x007F007F007F007F007F007F007F007F, 0x7F007F007F007F007F007F007F007F00, 1),
+    (0x00003FFF00003FFF00003FFF00003FFF, 0x3FFF00003FFF00003FFF00003FFF0000, 2),
+    (0x000000000FFFFFFF000000000FFFFFFF, 0x0FFFFFFF000000000FFFFFFF00000000, 4),
+    (0x000000000000000000FFFFFFFFFFFFFF, 0x00FFFFFFFFFFFFFF0000000000000000, 8)
+)
+
+DECODE_BLOCK_SIZE = 4096
+
+
+def encode_packed(value: int) -> bytes:
+    if value < 0:
+        raise ValueError(f"Packed values must not be negative, got {value}")
+    if value > MAX_PACKED_VALUE:
+        raise OverflowError("Packed value does not fit in 64 bits")
+    if value < 0x80:
+        return bytes((value,))
+
+    encoded = bytearray()
+
+    while value >= 0x80:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    encoded.append(value)
+
+    return bytes(encoded)
+
+
+def encode_packed_array(values) -> bytes:
+    return b"".join([encode_packed(int(value)) for value in values])
+
+
+def decode_packed_array(data: bytes | memoryview, count: int, as_numpy: bool = False):
+    """
+    Decodes count consecutive packed values from the start of data in one pass.
+    Returns (values, bytes consumed); values are uint64, as a NumPy array with as_numpy
+    or an array.array('Q') otherwise. Raises like the scalar reader: ValueError for a value
+    longer than MAX_PACKED_SIZE, OverflowError past 64 bits and EOFError for truncated data.
+    """
+    if as_numpy:
+        if numpy is None:
+            raise ModuleNotFoundError("NumPy is required for Argument 'as_numpy'")
+
+        if count <= 0:
+            return numpy.zeros(0, dtype="u8"), 0
+
+        return _decode_numpy(data, count)
+
+    values = array("Q")
+
+    if count <= 0:
+        return values, 0
+
+    data = bytes(data[:count * MAX_PACKED_SIZE])
+    encoded = PACKED_VALUE.findall(data)[:count]
+    consumed = sum(map(len, encoded))
+
+    if data[:consumed] != b"".join(encoded):
+        raise ValueError(f"Packed value longer than {MAX_PACKED_SIZE} bytes")
+    if len(encoded) < count:
+        # Only count * MAX_PACKED_SIZE bytes are searched, so an overlong value shows up as an unterminated run
+        if OVERLONG_PACKED_VALUE.match(data, consumed):
+            raise ValueError(f"Packed value longer than {MAX_PACKED_SIZE} bytes")
+
+        raise EOFError(f"Expected {count} packed values, only {len(encoded)} terminate within {len(data)} bytes")
+
+    for block_start in range(0, count, DECODE_BLOCK_SIZE):
+        values.extend(_decode_block(encoded[block_start:block_start + DECODE_BLOCK_SIZE]))
+
+    return values, consumed
+
+
+def _decode_block(encoded: list[bytes]) -> array:
+    """
+    Pads every value to a 16 byte slot of one big little-endian int and compacts all slots at once,
+    so the per-value work stays in struct and bytes methods.
+    """
+    block_struct, block_masks = _block_codec()
+    slots = len(encoded)
+    padded = (block_struct if slots == DECODE_BLOCK_SIZE else Struct("16s" * slots)).pack(*encoded)
+    value = int.from_bytes(padded.translate(LOW_BITS), "little")
+
+    for low_mask, high_mask, shift in block_masks:
+        value = (value & low_mask) | ((value & high_mask) >> shift)
+
+    words = array("Q")
+    words.frombytes(value.to_bytes(len(padded), "little"))
+
+    if sys.byteorder == "big":
+        words.byteswap()
+    if any(words[1::2]):
+        raise OverflowError("Packed value does not fit in 64 bits")
+
+    return words[::2]
+
+
+@cache
+def _block_codec() -> tuple[Struct, tuple[tuple[int, int, int], ...]]:
+    """COMPACT_STEPS masks repeated over a whole block, built on first use to keep imports cheap."""
+    return Struct("16s" * DECODE_BLOCK_SIZE), tuple(
+        (int.from_bytes(low_mask.to_bytes(16, "little") * DECODE_BLOCK_SIZE, "little"), int.from_bytes(high_mask.to_bytes(16, "little") * DECODE_BLOCK_SIZE, "little"), shift)
+        for low_mask, high_mask, shift in COMPACT_STEPS
+    )
+
+
+def _decode_numpy(data: bytes | memoryview, count: int):
+    raw = numpy.frombuffer(data, dtype="u1")[:count * MAX_PACKED_SIZE]
+    ends = numpy.flatnonzero(raw < 0x80)[:count]
+    end = int(ends[-1]) + 1 if len(ends) else 0
+
+    starts = numpy.zeros(len(ends), dtype=numpy.intp)
+    starts[1:] = ends[:-1] + 1
+
+    lengths = ends - starts + 1
+
+    # Checked before EOFError like the other decoder: a value cut off by the search window may still be overlong
+    if (lengths > MAX_PACKED_SIZE).any() or (len(ends) < count and len(raw) - end >= MAX_PACKED_SIZE):
+        raise ValueError(f"Packed value longer than {MAX_PACKED_SIZE} bytes")
+    if len(ends) < count:
+        raise EOFError(f"Expected {count} packed values, only {len(ends)} terminate within {len(raw)} bytes")
+    if (raw[ends[lengths == MAX_PACKED_SIZE]] > 1).any():
+        raise OverflowError("Packed value does not fit in 64 bits")
+
+    groups = (raw[:end] & 0x7F).astype("u8")
+    shifts = (numpy.arange(end) - numpy.repeat(starts, lengths)).astype("u8") * 7
+
+    return numpy.bitwise_or.reduceat(groups << shifts, starts), end
+
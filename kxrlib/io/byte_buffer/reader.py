@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Callable
 from functools import wraps
 
 from .data_format import DataFormat
+from .packed import MAX_PACKED_SIZE, MAX_PACKED_VALUE
 from .types import DataType
 
 if TYPE_CHECKING:
@@ -77,8 +78,27 @@ class Reader:
         data = self._read_from_bbuf(length)
         return unpack(fmt.format(length), data)[0].decode()
 
-    def _read_packed(self) -> ...:
-        raise NotImplementedError
+    def _read_packed(self) -> int:
+        value = 0
+        shift = 0
+
+        for _ in range(MAX_PACKED_SIZE):
+            data = self._read_from_bbuf(1)
+
+            if not data:
+                raise EOFError("Buffer ended inside a packed value")
+
+            value |= (data[0] & 0x7F) << shift
+
+            if data[0] < 0x80:
+                if value > MAX_PACKED_VALUE:
+                    raise OverflowError("Packed value does not fit in 64 bits")
+
+                return value
+
+            shift += 7
+
+        raise ValueError(f"Packed value longer than {MAX_PACKED_SIZE} bytes")
 
 
 def reader(_read: Callable[[ByteBuffer, int], DataType]) -> Callable:
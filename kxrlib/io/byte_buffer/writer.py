@@ -5,6 +5,7 @@ from typing import Callable, TYPE_CHECKING
 from functools import wraps
 
 from .data_format import DataFormat
+from .packed import encode_packed
 from .types import DataType
 
 if TYPE_CHECKING:
@@ -76,12 +77,16 @@ class Writer:
 
     def _write_string(self, data: str):
         fmt = ">h{}s"
-        string_length = len(data)
-        data = pack(fmt.format(string_length), string_length, data.encode())
+        encoded = data.encode()
+        string_length = len(encoded)
+        data = pack(fmt.format(string_length), string_length, encoded)
         self._write_to_bbuf(data)
 
-    def _write_packed(self, data: ...):
-        raise NotImplementedError
+    def _write_packed(self, data: int):
+        if not isinstance(data, int):
+            raise TypeError(f"Argument 'data' must be {int}, not {type(data)}")
+
+        self._write_to_bbuf(encode_packed(data))
 
 
 def writer(_write: Callable[[ByteBuffer, bytes], None]) -> Callable:
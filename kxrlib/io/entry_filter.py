@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import re
+from fnmatch import translate
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .kxr_header_entry import KxrHeaderEntry
+
+
+class EntryFilter:
+    """
+    [Entry filter]
+     - patterns are fnmatch-style globs matched against '/'-separated paths relative to the KXR root
+     - include:     a file is selected if it, or one of its parent folders, matches a pattern (all files if empty)
+     - exclude:     a matching file is skipped; a matching folder is pruned with its whole subtree
+    """
+
+    def __init__(self, include: list[str] | None = None, exclude: list[str] | None = None):
+        self.include = list(include) if include else []
+        self.exclude = list(exclude) if exclude else []
+
+        self._include_re = self._compile(self.include)
+        self._exclude_re = self._compile(self.exclude)
+
+    def select(self, root: KxrHeaderEntry) -> dict[KxrHeaderEntry, list[KxrHeaderEntry]]:
+        selection: dict[KxrHeaderEntry, list[KxrHeaderEntry]] = {}
+
+        self._select(root, "", self._include_re is None, selection)
+
+        return selection
+
+    def _select(self, entry: KxrHeaderEntry, prefix: str, included: bool, selection: dict[KxrHeaderEntry, list[KxrHeaderEntry]]) -> bool:
+        selected_children = []
+
+        for name, child in entry.children.items():
+            path = f"{prefix}{name}"
+
+            if self._exclude_re is not None and self._exclude_re.match(path):
+                continue
+
+            child_included = included or self._include_re.match(path) is not None
+
+            if child.is_dir:
+                if self._select(child, f"{path}/", child_included, selection):
+                    selected_children.append(child)
+            elif child_included:
+                selected_children.append(child)
+
+        if selected_children:
+            selection[entry] = selected_children
+
+        return bool(selected_children)
+
+    @staticmethod
+    def summarize(selection: dict[KxrHeaderEntry, list[KxrHeaderEntry]]) -> dict[str, int]:
+        stats = {
+            "num_folders": 0,
+            "num_files": 0,
+            "num_zipped_files": 0
+        }
+
+        for children in selection.values():
+            for child in children:
+                if child.is_dir:
+                    stats["num_folders"] += 1
+                else:
+                    stats["num_files"] += 1
+
+                    if child.zipped:
+                        stats["num_zipped_files"] += 1
+
+        return stats
+
+    @staticmethod
+    def _compile(patterns: list[str]) -> re.Pattern | None:
+        if not patterns:
+            return None
+
+        return re.compile("|".join(f"(?:{translate(pattern.replace(chr(92), '/').strip('/'))})" for pattern in patterns))
+
+    @property
+    def active(self) -> bool:
+        return bool(self.include or self.exclude)
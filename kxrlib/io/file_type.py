@@ -42,9 +42,38 @@ class FileType(Enum):
         self.criteria = file_criteria
 
     @classmethod
-    def from_extension(cls, extension: str) -> FileType:
-        for name, member in cls.__members__.items():
-            if name.lower() == extension.lower():
-                return member
+    def from_extension(cls, extension: str | None) -> FileType:
+        if not extension:
+            return FileType.UNKNOWN
+
+        return _EXTENSION_MAP.get(extension.lower(), FileType.UNKNOWN)
+
+    @classmethod
+    def from_signature(cls, data: bytes) -> FileType:
+        for markers, file_type in _SIGNATURES:
+            if all(data.startswith(marker, offset) for offset, marker in markers):
+                return file_type
+
+        head = data.lstrip(b"\xef\xbb\xbf \t\r\n")[:14].lower()
+
+        if head.startswith((b"<!doctype html", b"<html")):
+            return FileType.HTML
 
         return FileType.UNKNOWN
+
+
+_EXTENSION_MAP: dict[str, FileType] = {member.value: member for member in FileType}
+
+SNIFF_SIZE = 64  # decoded bytes from_signature() needs to see
+
+_SIGNATURES: list[tuple[tuple[tuple[int, bytes | tuple[bytes, ...]], ...], FileType]] = [
+    (((0, b"\x89PNG\r\n\x1a\n"),), FileType.PNG),
+    (((0, b"\xff\xd8\xff"),), FileType.JPG),
+    (((0, b"DDS "),), FileType.DDS),
+    (((0, b"OggS"),), FileType.OGG),
+    (((0, b"RIFF"), (8, b"WAVE")), FileType.WAV),
+    (((0, b"FORM"), (8, (b"AIFF", b"AIFC"))), FileType.AIFF),
+    (((0, b"PVR\x03"),), FileType.PVR),
+    (((44, b"PVR!"),), FileType.PVR),
+    (((0, b"\xfa\xfaRIQS"),), FileType.NUT)
+]
@@ -58,6 +58,13 @@ class KFile:
     def seek(self, offset: int):
         self._io.seek(offset)
 
+    def truncate(self, size: int):
+        self._io.truncate(size)
+
+    def preallocate(self, offset: int, length: int):
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(self._io.fileno(), offset, length)
+
     def makedirs(self):
         os.makedirs(self.path, exist_ok=True)
 
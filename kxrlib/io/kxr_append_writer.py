@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from kxrlib.metrics.stage import Stage
+from .byte_buffer import ByteBuffer
+
+if TYPE_CHECKING:
+    from .kxr_file import KxrFile
+
+DEFAULT_BUFFER_SIZE = 8 * 1024 ** 2
+
+
+class KxrAppendWriter:
+    """
+    Append-only writer for the data region of a Kxr file being packed.
+    Blobs are gathered in memory and written with one seek and one write per flush;
+    the next offset is tracked here and always equals kxr_file.datasize.
+
+    [Metrics]
+     - the caller records Stage.ARCHIVE_WRITE per appended blob, with its bytes and FileType;
+       a flush triggered by append is timed as part of that blob
+     - an explicit flush (including the final one on exit) only adds its time, without bytes or FileType
+    """
+
+    def __init__(self, kxr_file: KxrFile, buffer_size: int = DEFAULT_BUFFER_SIZE, preallocate: int = 0):
+        if not kxr_file.opened or kxr_file.is_readonly:
+            raise PermissionError(f"Kxr file must be opened for writing: {kxr_file}")
+
+        self.kxr_file = kxr_file
+        self.buffer_size = buffer_size
+        self.offset = kxr_file.datasize
+
+        self._start = self.offset
+        self._chunks: list[bytes] = []
+        self._buffered = 0
+
+        if preallocate > 0:
+            kxr_file.preallocate(self.offset, preallocate)
+
+    async def append(self, data: bytes) -> int:
+        offset = self.offset
+
+        self._chunks.append(data)
+        self._buffered += len(data)
+        self.offset += len(data)
+
+        if self._buffered >= self.buffer_size:
+            await self._flush()
+
+        return offset
+
+    async def flush(self):
+        if not self._chunks:
+            return
+
+        metrics = self.kxr_file.metrics
+        start = perf_counter() if metrics is not None else 0.0
+
+        await self._flush()
+
+        if metrics is not None:
+            # The bytes were already recorded per blob
+            metrics.record(Stage.ARCHIVE_WRITE, start, 0)
+
+    async def _flush(self):
+        data = self._chunks[0] if len(self._chunks) == 1 else b"".join(self._chunks)
+
+        await self.kxr_file.write_to_kxr(self._start, ByteBuffer.from_bytes(data))
+
+        self._start = self.offset
+        self._chunks = []
+        self._buffered = 0
+
+    async def __aenter__(self) -> KxrAppendWriter:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.flush()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from .byte_buffer import ByteBuffer
+
+
+@dataclass(slots=True)
+class KxrBlob:
+    path: str
+    offset: int
+    size: int
+    zipped: bool
+
+    def read(self, file: BinaryIO) -> bytes:
+        file.seek(self.offset)
+
+        data = file.read(self.size)
+
+        if len(data) != self.size:
+            raise EOFError(f"Expected {self.size} bytes at offset {self.offset}, read {len(data)}")
+
+        return data
+
+    def read_prefix(self, file: BinaryIO, size: int) -> bytes:
+        file.seek(self.offset)
+
+        return file.read(min(size, self.size))
+
+    def decode(self, data: bytes, passhash: int) -> bytes:
+        if self.zipped:
+            return zlib.decompress(data)
+        else:
+            bbuf = ByteBuffer.from_bytes(data)
+            bbuf.crypt(passhash ^ self.offset)
+
+            return bbuf.buffer
+
+    def decode_prefix(self, data: bytes, passhash: int, size: int) -> bytes:
+        """Decodes at most `size` leading bytes from a prefix of the stored blob."""
+        if self.zipped:
+            return zlib.decompressobj().decompress(data, size)
+        else:
+            return self.decode(data[:size], passhash)
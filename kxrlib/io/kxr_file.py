@@ -1,17 +1,34 @@
+from __future__ import annotations
+
 import asyncio
 import re
+from struct import Struct
+from time import perf_counter
+from typing import TYPE_CHECKING
 
 from kxrlib.console import generate_statistics_block
+from kxrlib.metrics.stage import Stage
+from .access_trace import AccessTrace
 from .byte_buffer import ByteBuffer
+from .byte_buffer.crypt import crypt_into
+from .kxr_blob import KxrBlob
+from .kxr_index_cache import KxrIndexCache
+from .kxr_read_pool import KxrReadPool
 from .kfile import KFile
 from .kxr_header_entry import KxrHeaderEntry, EntryType
+from .kxr_header_scanner import KxrHeaderScanner
 from .open_mode import OpenMode
 from .opener_ctx import OpenerContextManager
 
+if TYPE_CHECKING:
+    from kxrlib.metrics import StageMetrics
+
 DEFAULT_OPEN_MODE = OpenMode.READ_BINARY
 
 KXR_NAME = r"^([a-zA-Z0-9_]+?)(?:-\w{4})?\.kxr$"
 
+PREAMBLE = Struct(">4siii")
+
 
 class KxrFile:
     """
@@ -25,7 +42,7 @@ class KxrFile:
      - datasize to headersize:  headerdata
     """
 
-    def __init__(self, file: str | KFile):
+    def __init__(self, file: str | KFile, trace: AccessTrace | None = None, index_cache: KxrIndexCache | str | None = None, readers: int = 0, lazy: bool = False):
         self._kfile = file if isinstance(file, KFile) else KFile(file)
 
         if self._kfile.is_dir:
@@ -36,6 +53,14 @@ class KxrFile:
         self.datasize = 0
         self.headersize = 0
         self.changed = asyncio.Event()
+        self.metrics: StageMetrics | None = None
+        self.trace = trace
+        self.index_cache = index_cache if not isinstance(index_cache, str) else KxrIndexCache(index_cache)
+        self.readers = readers
+        self.lazy = lazy
+        self.lazy_header: tuple[bytes, dict[int, tuple[int, int]]] | None = None
+        self._read_pool: KxrReadPool | None = None
+        self._saved_header: tuple[int, bytes] | None = None
         self._lock = asyncio.Lock()
 
     def open(self, mode: str | OpenMode = DEFAULT_OPEN_MODE) -> OpenerContextManager:
@@ -45,6 +70,9 @@ class KxrFile:
         if self.opened:
             raise PermissionError("Kxr file is already opened")
 
+        self._saved_header = None
+        self.lazy_header = None
+
         if self._kfile.exists:
             await self._kfile.open(mode)
             bbuf = await self._kfile.read(16)
@@ -58,10 +86,19 @@ class KxrFile:
 
             self.root = KxrHeaderEntry(self, entry_type=EntryType.ROOT)
 
-            hbbuf = await self.read_from_kxr(self.datasize, self.headersize)
-            hbbuf.crypt(self.passhash ^ self.datasize)
+            records = self.index_cache.load(self) if self.index_cache is not None else None
 
-            self.root.recursive_read_entries(hbbuf)
+            if records is not None:
+                self.root.read_records(records)
+            else:
+                await self._read_header()
+
+                if self.index_cache is not None and not self.lazy:
+                    self.index_cache.store(self, self.root.records())
+
+            if self.readers > 0 and self.is_readonly:
+                self._read_pool = KxrReadPool(self.path, self.readers)
+                self._read_pool.open()
         else:
             await self._kfile.open("w+b")
 
@@ -70,6 +107,28 @@ class KxrFile:
 
             await self.save()
 
+    async def _read_header(self):
+        metrics = self.metrics
+        start = perf_counter() if metrics is not None else 0.0
+
+        hbbuf = await self.read_from_kxr(self.datasize, self.headersize)
+
+        if metrics is not None:
+            start = metrics.record(Stage.ARCHIVE_READ, start, hbbuf.size)
+
+        hbbuf.crypt(self.passhash ^ self.datasize)
+
+        if metrics is not None:
+            metrics.record(Stage.CRYPT, start, hbbuf.size)
+
+        self._saved_header = (self.datasize, hbbuf.buffer)
+
+        if self.lazy:
+            self.lazy_header = (hbbuf.buffer, KxrHeaderScanner(hbbuf.buffer).skip_scan())
+            self.root.read_lazy(hbbuf.buffer)
+        else:
+            self.root.recursive_read_entries(hbbuf)
+
     async def close(self):
         if not self.opened:
             return
@@ -77,12 +136,19 @@ class KxrFile:
         if self.changed.is_set() and not self.is_readonly:
             await self.save()
 
+        if self._read_pool is not None:
+            self._read_pool.close()
+            self._read_pool = None
+
         await self._kfile.close()
 
     async def read_from_kxr(self, offset: int, size: int) -> ByteBuffer:
         if not self.opened:
             raise PermissionError("Kxr file must be opened to read from it")
 
+        if self._read_pool is not None:
+            return ByteBuffer.from_bytes(await self._read_pool.read(offset, size))
+
         async with self._lock:
             self._kfile.seek(offset)
 
@@ -97,27 +163,35 @@ class KxrFile:
 
             await self._kfile.write(bbuf)
 
+            if self._saved_header is not None and offset + bbuf.size > self._saved_header[0]:
+                self._saved_header = None
+
             self.changed.set()
 
-    async def save(self):
-        bbuf = ByteBuffer()
-        hbbuf = ByteBuffer()
+    def preallocate(self, offset: int, length: int):
+        if not self.opened or self.is_readonly:
+            raise PermissionError("Kxr file must be opened for writing to preallocate space")
 
-        for char in "kxrf":
-            bbuf.put("b", char.encode())
-        bbuf.put("i", self.passhash)
-        bbuf.put("i", self.datasize)
+        self._kfile.preallocate(offset, length)
 
-        self.root.recursive_write_entries(hbbuf)
+    async def save(self):
+        hbuf = self.root.encode()
+        header = (self.datasize, bytes(hbuf))
 
-        hbbuf.crypt(self.passhash ^ self.datasize)
-        self.headersize = hbbuf.size
+        if header == self._saved_header:
+            self.changed.clear()
+            return
+
+        crypt_into(hbuf, self.passhash ^ self.datasize)
+        self.headersize = len(hbuf)
 
-        bbuf.put("i", self.headersize)
+        await self.write_to_kxr(0, ByteBuffer.from_bytes(PREAMBLE.pack(b"kxrf", self.passhash, self.datasize, self.headersize)))
+        await self.write_to_kxr(self.datasize, ByteBuffer.from_bytes(bytes(hbuf)))
 
-        await self.write_to_kxr(0, bbuf)
-        await self.write_to_kxr(self.datasize, hbbuf)
+        async with self._lock:
+            self._kfile.truncate(self.datasize + self.headersize)
 
+        self._saved_header = header
         self.changed.clear()
 
     def generate_header_summary_block(self, summary: dict[str, int] | None = None) -> str:
@@ -139,6 +213,23 @@ class KxrFile:
 
         return generate_statistics_block(title, desc_strings, value_strings)
 
+    def blobs(self) -> list[KxrBlob]:
+        if self.root is None:
+            raise ValueError(f"No root header entry is assigned to Kxr file yet: {self}")
+
+        blobs = []
+        stack = [self.root]
+
+        while stack:
+            entry = stack.pop()
+
+            if entry.is_dir:
+                stack.extend(reversed(entry.children.values()))
+            else:
+                blobs.append(KxrBlob(entry.relative_path, entry.offset, entry.size, entry.zipped))
+
+        return blobs
+
     async def delete(self):
         async with self._lock:
             await self._kfile.delete()
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 import os
+from struct import Struct
+from time import perf_counter
 from typing import TYPE_CHECKING
 from enum import Enum
 
+from kxrlib.metrics.stage import Stage
 from .byte_buffer import ByteBuffer
+from .file_type import FileType, SNIFF_SIZE
+from .kxr_blob import KxrBlob
 from .resource import KResourceDir, KResourceFile
 
 if TYPE_CHECKING:
     from .kxr_file import KxrFile
+    from .kxr_append_writer import KxrAppendWriter
+
+SNIFF_READ_SIZE = 4096
+
+NAME_SIZE = Struct(">h")
+DIR_RECORD = Struct(">iiBh")
+FILE_RECORD = Struct(">iiBii")
 
 
 class EntryType(Enum):
@@ -52,7 +64,8 @@ class KxrHeaderEntry:
         self._size: int | None = None
 
         self._parent: KxrHeaderEntry | None = None
-        self.children: dict[str, KxrHeaderEntry] = {}
+        self._children: dict[str, KxrHeaderEntry] = {}
+        self._lazy_pos: int | None = None
 
     def recursive_read_entries(self, hbbuf: ByteBuffer):
         name = hbbuf.get("t")
@@ -78,43 +91,179 @@ class KxrHeaderEntry:
             self.offset = hbbuf.get("i")
             self.size = hbbuf.get("i")
 
-    def recursive_write_entries(self, hbbuf: ByteBuffer):
-        hbbuf.put("t", self.name)
-        hbbuf.put("i", self.created)
-        hbbuf.put("i", self.updated)
-        hbbuf.put("b", self.flags.to_bytes(1))
+    def read_records(self, records: list[tuple[str, int, int, int, int, int]]):
+        stack: list[list] = []
+        entry = self
 
-        if self.is_dir:
-            hbbuf.put("s", len(self.children))
+        for name, created, updated, flags, first, second in records:
+            if stack:
+                entry = KxrHeaderEntry(self.kxr_file)
+                entry.name = name
 
-            if self.children:
-                for child_entry in self.children.values():
-                    child_entry.recursive_write_entries(hbbuf)
-        else:
-            hbbuf.put("i", self.offset)
-            hbbuf.put("i", self.size)
+                stack[-1][0].add_entry(entry)
+                stack[-1][1] -= 1
+
+                entry.is_dir = flags & 1 != 0
+                entry.locked = flags & 2 != 0
+                entry.zipped = flags & 4 != 0
+            else:
+                entry.name = name if name else self.kxr_file.matched_name
+
+            entry.created = created
+            entry.updated = updated
+
+            if entry.is_dir:
+                stack.append([entry, first])
+            else:
+                entry.offset = first
+                entry.size = second
+
+            while stack and stack[-1][1] == 0:
+                stack.pop()
+
+    def read_lazy(self, header: bytes | bytearray):
+        """Reads only the root record; its children are parsed from the kxr file's lazy header on first access."""
+        pos = NAME_SIZE.size + NAME_SIZE.unpack_from(header, 0)[0]
+        name = header[NAME_SIZE.size:pos].decode()
+
+        self.name = name if name else self.kxr_file.matched_name
+        self.created, self.updated, _, _ = DIR_RECORD.unpack_from(header, pos)
+        self._lazy_pos = pos + DIR_RECORD.size
+
+    def _materialize(self):
+        header, index = self.kxr_file.lazy_header
+        pos = self._lazy_pos
+        self._lazy_pos = None
+
+        for _ in range(index[pos][0]):
+            name_length = NAME_SIZE.unpack_from(header, pos)[0]
+            pos += NAME_SIZE.size
+
+            entry = KxrHeaderEntry(self.kxr_file, name=header[pos:pos + name_length].decode())
+            pos += name_length
+
+            if header[pos + 8] & 1:
+                entry.created, entry.updated, flags, _ = DIR_RECORD.unpack_from(header, pos)
+                pos += DIR_RECORD.size
+
+                entry._lazy_pos = pos
+                pos = index[pos][1]
+            else:
+                entry.created, entry.updated, flags, entry.offset, entry._size = FILE_RECORD.unpack_from(header, pos)
+                pos += FILE_RECORD.size
+
+            entry.is_dir = flags & 1 != 0
+            entry.locked = flags & 2 != 0
+            entry.zipped = flags & 4 != 0
+
+            self._children[entry.name] = entry
+            entry.parent = self
+
+    def records(self) -> list[tuple[str, int, int, int, int, int]]:
+        records = []
+        stack = [self]
+
+        while stack:
+            entry = stack.pop()
+            flags = entry.flags
+
+            if entry.is_dir:
+                records.append((entry.name, entry.created, entry.updated, flags, len(entry.children), 0))
+
+                stack.extend(reversed(entry.children.values()))
+            else:
+                records.append((entry.name, entry.created, entry.updated, flags, entry.offset, entry.size))
+
+        return records
+
+    def encode(self) -> bytearray:
+        """Serializes the subtree in header format into a buffer sized exactly up front."""
+        records = self.records()
+        names = [record[0].encode() for record in records]
+
+        hbuf = bytearray(sum(
+            NAME_SIZE.size + len(name) + (DIR_RECORD.size if record[3] & 1 else FILE_RECORD.size)
+            for name, record in zip(names, records)
+        ))
+        pos = 0
+
+        for name, (_, created, updated, flags, first, second) in zip(names, records):
+            NAME_SIZE.pack_into(hbuf, pos, len(name))
+            pos += NAME_SIZE.size
+
+            hbuf[pos:pos + len(name)] = name
+            pos += len(name)
+
+            if flags & 1:
+                DIR_RECORD.pack_into(hbuf, pos, created, updated, flags, first)
+                pos += DIR_RECORD.size
+            else:
+                FILE_RECORD.pack_into(hbuf, pos, created, updated, flags, first, second)
+                pos += FILE_RECORD.size
+
+        return hbuf
 
     def add_entry(self, entry: KxrHeaderEntry):
         self.children[entry.name] = entry
         entry.parent = self
 
+    def get_entry(self, relative_path: str) -> KxrHeaderEntry | None:
+        entry = self
+
+        for name in relative_path.replace("\\", "/").split("/"):
+            if not name:
+                continue
+
+            entry = entry.children.get(name)
+
+            if entry is None:
+                return None
+
+        return entry
+
     async def get_content(self) -> ByteBuffer:
         if self.is_dir:
             raise IsADirectoryError(f"Must not be a directory to get content from: {self}")
 
+        metrics = self.kxr_file.metrics
+        start = perf_counter() if metrics is not None else 0.0
+
+        if self.kxr_file.trace is not None:
+            self.kxr_file.trace.record(self.relative_path)
+
         bbuf = await self.kxr_file.read_from_kxr(self.offset, self.size)
 
         if not bbuf:
             raise ValueError(f"No data was read: offset='{self.offset}', size='{self.size}' kxr_file={self.kxr_file}")
 
+        if metrics is not None:
+            start = metrics.record(Stage.ARCHIVE_READ, start, bbuf.size, self.type)
+
         if self.zipped:
             bbuf.decompress()
+
+            if metrics is not None:
+                metrics.record(Stage.DECOMPRESS, start, bbuf.size, self.type)
         else:
             bbuf.crypt(self.kxr_file.passhash ^ self.offset)
 
+            if metrics is not None:
+                metrics.record(Stage.CRYPT, start, bbuf.size, self.type)
+
         return bbuf
 
-    async def put_content(self, name: str, bbuf: ByteBuffer, needs_zipping: bool = True):
+    async def peek(self, size: int = SNIFF_SIZE, read_size: int = SNIFF_READ_SIZE) -> bytes:
+        if self.is_dir:
+            raise IsADirectoryError(f"Must not be a directory to peek at content: {self}")
+
+        bbuf = await self.kxr_file.read_from_kxr(self.offset, min(read_size, self.size))
+
+        return KxrBlob(self.relative_path, self.offset, self.size, self.zipped).decode_prefix(bbuf.buffer, self.kxr_file.passhash, size)
+
+    async def sniff(self) -> FileType:
+        return FileType.from_signature(await self.peek())
+
+    async def put_content(self, name: str, bbuf: ByteBuffer, needs_zipping: bool = True, writer: KxrAppendWriter | None = None, precompressed: bool = False):
         if not self.is_dir:
             raise NotADirectoryError(f"Must be a directory to create content in: {self}")
 
@@ -125,16 +274,38 @@ class KxrHeaderEntry:
             entry.name = name
             self.add_entry(entry)
 
-        if needs_zipping:
+        metrics = self.kxr_file.metrics
+        start = perf_counter() if metrics is not None else 0.0
+
+        if precompressed:
+            if not needs_zipping:
+                raise ValueError("Precompressed content can only be stored zipped")
+        elif needs_zipping:
+            size = bbuf.size
             bbuf.compress()
+
+            if metrics is not None:
+                start = metrics.record(Stage.COMPRESS, start, size, entry.type)
         else:
             bbuf.crypt(self.kxr_file.passhash ^ self.kxr_file.datasize)
 
+            if metrics is not None:
+                start = metrics.record(Stage.CRYPT, start, bbuf.size, entry.type)
+
         entry.offset = self.kxr_file.datasize
         entry.size = bbuf.size
         entry.zipped = needs_zipping
 
-        await self.kxr_file.write_to_kxr(entry.offset, bbuf)
+        if writer is not None:
+            if writer.offset != entry.offset:
+                raise ValueError(f"Append writer is at offset {writer.offset}, but the data region ends at {entry.offset}")
+
+            await writer.append(bbuf.buffer)
+        else:
+            await self.kxr_file.write_to_kxr(entry.offset, bbuf)
+
+        if metrics is not None:
+            metrics.record(Stage.ARCHIVE_WRITE, start, bbuf.size, entry.type)
 
         self.kxr_file.datasize += bbuf.size
 
@@ -151,6 +322,10 @@ class KxrHeaderEntry:
 
                 entry.populate(child)
 
+    @property
+    def type(self) -> FileType:
+        return FileType.from_extension(os.path.splitext(self.name)[1].lstrip("."))
+
     @property
     def is_root(self) -> bool:
         return self._type is EntryType.ROOT
@@ -197,9 +372,9 @@ class KxrHeaderEntry:
     @property
     def flags(self) -> int:
         return (
-            1 if self.is_dir else 0 |
-            2 if self.locked else 0 |
-            4 if self.zipped else 0
+            (1 if self.is_dir else 0) |
+            (2 if self.locked else 0) |
+            (4 if self.zipped else 0)
         )
 
     @property
@@ -226,6 +401,17 @@ class KxrHeaderEntry:
 
         self._size = size
 
+    @property
+    def children(self) -> dict[str, KxrHeaderEntry]:
+        if self._lazy_pos is not None:
+            self._materialize()
+
+        return self._children
+
+    @property
+    def materialized(self) -> bool:
+        return self._lazy_pos is None
+
     @property
     def parent(self) -> KxrHeaderEntry | None:
         return self._parent
@@ -246,6 +432,15 @@ class KxrHeaderEntry:
         else:
             return os.path.join(self.parent.path, self.name)
 
+    @property
+    def relative_path(self) -> str:
+        if self.parent is None:
+            return ""
+        elif self.parent.parent is None:
+            return self.name
+        else:
+            return os.path.join(self.parent.relative_path, self.name)
+
     @property
     def tree(self) -> dict[str, KxrHeaderEntry | dict]:
         if not self.is_dir:
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import struct
+from typing import Iterator
+
+from .byte_buffer.crypt import crypt_into
+from .kxr_header_entry import NAME_SIZE, DIR_RECORD, FILE_RECORD
+
+PREAMBLE = struct.Struct(">4siii")
+NUM_CHILDREN = struct.Struct(">h")
+
+ManifestRow = tuple[str, int, int, int, int, int]
+
+
+class KxrHeaderScanner:
+    """
+    Walks a decrypted header record by record with struct.unpack_from, keeping only a stack of
+    (path prefix, children left) for the open folders, so no KxrHeaderEntry tree is built.
+
+    [Manifest row]
+     - (path, offset, size, flags, created, updated) for every file, path '/'-separated and relative to the root
+    """
+
+    def __init__(self, header: bytes | bytearray):
+        self.header = header
+
+    @classmethod
+    def from_file(cls, path: str) -> KxrHeaderScanner:
+        with open(path, "rb") as file:
+            magic, passhash, datasize, headersize = PREAMBLE.unpack(file.read(PREAMBLE.size))
+
+            if magic != b"kxrf":
+                raise ValueError("Invalid Kxr file header")
+
+            file.seek(datasize)
+            header = bytearray(file.read(headersize))
+
+        if len(header) != headersize:
+            raise EOFError(f"Expected a {headersize} byte header at offset {datasize}, read {len(header)}")
+
+        crypt_into(header, passhash ^ datasize)
+
+        return cls(header)
+
+    def skip_scan(self) -> dict[int, tuple[int, int]]:
+        """
+        {position of a folder's first child record: (number of children, position after the folder's subtree)},
+        for the root and every folder. Only name lengths and flags are looked at.
+        """
+        header = self.header
+        name_size = NAME_SIZE.size
+        dir_size = DIR_RECORD.size
+        file_size = FILE_RECORD.size
+        unpack_name_size = NAME_SIZE.unpack_from
+        unpack_num_children = NUM_CHILDREN.unpack_from
+
+        index: dict[int, tuple[int, int]] = {}
+
+        pos = name_size + unpack_name_size(header, 0)[0] + dir_size
+        num_children = unpack_num_children(header, pos - NUM_CHILDREN.size)[0]
+
+        stack: list[list[int]] = [[pos, num_children, num_children]]
+
+        while stack:
+            top = stack[-1]
+
+            if top[1] == 0:
+                stack.pop()
+                index[top[0]] = (top[2], pos)
+                continue
+
+            top[1] -= 1
+
+            pos += name_size + unpack_name_size(header, pos)[0]
+
+            if header[pos + 8] & 1:
+                pos += dir_size
+                num_children = unpack_num_children(header, pos - NUM_CHILDREN.size)[0]
+
+                stack.append([pos, num_children, num_children])
+            else:
+                pos += file_size
+
+        return index
+
+    def __iter__(self) -> Iterator[ManifestRow]:
+        header = self.header
+        name_size = NAME_SIZE.size
+        dir_unpack, dir_size = DIR_RECORD.unpack_from, DIR_RECORD.size
+        file_unpack, file_size = FILE_RECORD.unpack_from, FILE_RECORD.size
+
+        pos = name_size + NAME_SIZE.unpack_from(header, 0)[0]
+        _, _, _, num_children = dir_unpack(header, pos)
+        pos += dir_size
+
+        stack: list[list] = [["", num_children]]
+
+        while stack:
+            if stack[-1][1] == 0:
+                stack.pop()
+                continue
+
+            stack[-1][1] -= 1
+            prefix = stack[-1][0]
+
+            name_length = NAME_SIZE.unpack_from(header, pos)[0]
+            pos += name_size
+            name = header[pos:pos + name_length].decode()
+            pos += name_length
+
+            if header[pos + 8] & 1:
+                _, _, _, num_children = dir_unpack(header, pos)
+                pos += dir_size
+
+                stack.append([f"{prefix}{name}/", num_children])
+            else:
+                created, updated, flags, offset, size = file_unpack(header, pos)
+                pos += file_size
+
+                yield f"{prefix}{name}", offset, size, flags, created, updated
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .kxr_file import KxrFile
+
+INDEX_MAGIC = b"kxri"
+INDEX_VERSION = 1
+
+IndexRecord = tuple[str, int, int, int, int, int]
+
+
+class KxrIndexCache:
+    """
+    [Index cache file format]
+     - 0 to 3:      "kxri"
+     - 4:           version
+     - 5 to end:    marshal((key, records))
+     - - key:       (path, st_size, st_mtime_ns, passhash, datasize, headersize)
+     - - records:   pre-order (name, created, updated, flags, numchildren | offset, 0 | size) per header entry
+    """
+
+    def __init__(self, cache_dir: str):
+        if not isinstance(cache_dir, str):
+            raise TypeError(f"Argument 'cache_dir' must be {str}, not {type(cache_dir)}")
+
+        self.cache_dir = cache_dir
+
+    def load(self, kxr_file: KxrFile) -> list[IndexRecord] | None:
+        cache_path = self.cache_path(kxr_file)
+
+        try:
+            with open(cache_path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        if data[:4] != INDEX_MAGIC or data[4:5] != bytes([INDEX_VERSION]):
+            return None
+
+        try:
+            key, records = marshal.loads(data[5:])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+        if key != self.key(kxr_file):
+            return None
+
+        return records
+
+    def store(self, kxr_file: KxrFile, records: list[IndexRecord]):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        cache_path = self.cache_path(kxr_file)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+
+        with open(temp_path, "wb") as file:
+            file.write(INDEX_MAGIC)
+            file.write(bytes([INDEX_VERSION]))
+            file.write(marshal.dumps((self.key(kxr_file), records)))
+
+        os.replace(temp_path, cache_path)
+
+    def cache_path(self, kxr_file: KxrFile) -> str:
+        digest = hashlib.sha1(os.path.abspath(kxr_file.path).encode()).hexdigest()
+
+        return os.path.join(self.cache_dir, f"{digest[:20]}.kxri")
+
+    @staticmethod
+    def key(kxr_file: KxrFile) -> tuple[str, int, int, int, int, int]:
+        stat_result = os.stat(kxr_file.path)
+
+        return (
+            os.path.abspath(kxr_file.path),
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+            kxr_file.passhash,
+            kxr_file.datasize,
+            kxr_file.headersize
+        )
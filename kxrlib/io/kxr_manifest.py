@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+from .kxr_header_scanner import KxrHeaderScanner, ManifestRow
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MANIFEST_FIELDS = ("path", "offset", "size", "flags", "created", "updated")
+
+
+def iter_manifest(kxr_path: str) -> Iterator[ManifestRow]:
+    return iter(KxrHeaderScanner.from_file(kxr_path))
+
+
+def read_manifest(kxr_path: str):
+    """
+    Every file entry of the archive as a NumPy structured array with MANIFEST_FIELDS,
+    or as a list of row tuples when NumPy is not installed.
+    """
+    rows = list(iter_manifest(kxr_path))
+
+    if numpy is None:
+        return rows
+
+    path_length = max((len(row[0]) for row in rows), default=1)
+
+    return numpy.array(rows, dtype=[
+        ("path", f"U{path_length}"),
+        ("offset", "i8"),
+        ("size", "i8"),
+        ("flags", "u1"),
+        ("created", "i8"),
+        ("updated", "i8")
+    ])
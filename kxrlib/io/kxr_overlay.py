@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from .byte_buffer import ByteBuffer
+from .kfile import KFile
+from .kxr_file import KxrFile
+from .kxr_header_entry import KxrHeaderEntry
+from .opener_ctx import OpenerContextManager
+
+
+class KxrOverlay:
+    """
+    [Overlay mount]
+     - kxr_files are mounted in order; an entry in a later archive overrides the same path in earlier ones
+     - index:   {normalized relative path: (archive index, header entry)} for every file entry, built from headers only
+    """
+
+    def __init__(self, files: list[str | KFile | KxrFile], readers: int = 0):
+        if not isinstance(files, list):
+            raise TypeError(f"Argument 'files' must be {list}, not {type(files)}")
+
+        self.kxr_files: list[KxrFile] = [file if isinstance(file, KxrFile) else KxrFile(file, readers=readers) for file in files]
+        self.index: dict[str, tuple[int, KxrHeaderEntry]] = {}
+
+    def open(self) -> OpenerContextManager:
+        return OpenerContextManager(self._open(), self.close)
+
+    async def _open(self):
+        if self.opened:
+            raise PermissionError("Kxr overlay is already opened")
+
+        # KxrFile.open creates missing files, so check all of them before opening any
+        for kxr_file in self.kxr_files:
+            if not kxr_file.exists:
+                raise FileNotFoundError(f"Kxr file not found: '{kxr_file.path}'")
+
+        self.index.clear()
+
+        try:
+            for archive_index, kxr_file in enumerate(self.kxr_files):
+                await kxr_file.open("rb")
+
+                self._index_entries(archive_index, kxr_file.root, "")
+        except BaseException:
+            # The context manager's exit does not run when opening fails
+            await self.close()
+            raise
+
+    async def close(self):
+        for kxr_file in self.kxr_files:
+            await kxr_file.close()
+
+        self.index.clear()
+
+    def _index_entries(self, archive_index: int, entry: KxrHeaderEntry, prefix: str):
+        for name, child in entry.children.items():
+            path = f"{prefix}{name}"
+
+            if child.is_dir:
+                self._index_entries(archive_index, child, f"{path}/")
+            else:
+                self.index[path] = (archive_index, child)
+
+    def resolve(self, path: str) -> KxrHeaderEntry | None:
+        indexed = self.index.get(self._normalize(path))
+
+        return indexed[1] if indexed is not None else None
+
+    def source_of(self, path: str) -> KxrFile | None:
+        indexed = self.index.get(self._normalize(path))
+
+        return self.kxr_files[indexed[0]] if indexed is not None else None
+
+    async def get_content(self, path: str) -> ByteBuffer:
+        entry = self.resolve(path)
+
+        if entry is None:
+            raise FileNotFoundError(f"No mounted Kxr file contains an entry at: '{path}'")
+
+        return await entry.get_content()
+
+    def __contains__(self, path: str) -> bool:
+        return self._normalize(path) in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return path.replace("\\", "/").strip("/")
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self.index)
+
+    @property
+    def opened(self) -> bool:
+        return any(kxr_file.opened for kxr_file in self.kxr_files)
+
+    @property
+    def overlay_summary(self) -> dict[str, int]:
+        summary = {kxr_file.name: 0 for kxr_file in self.kxr_files}
+
+        for archive_index, _ in self.index.values():
+            summary[self.kxr_files[archive_index].name] += 1
+
+        return summary
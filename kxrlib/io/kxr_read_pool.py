@@ -0,0 +1,84 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+HAS_PREAD = hasattr(os, "pread")
+
+
+class KxrReadPool:
+    """
+    Read-only descriptors for one file, leased one per read and served from a thread pool,
+    so independent reads do not queue behind a shared file position.
+    Uses os.pread where available; elsewhere each leased descriptor seeks on its own.
+    """
+
+    def __init__(self, path: str, size: int):
+        if size < 1:
+            raise ValueError(f"Argument 'size' must be at least 1, not {size}")
+
+        self.path = path
+        self.size = size
+
+        self._fds: list[int] = []
+        self._idle: asyncio.Queue[int] | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def open(self):
+        if self.opened:
+            raise PermissionError(f"Read pool is already opened: {self.path}")
+
+        self._fds = [os.open(self.path, OPEN_FLAGS) for _ in range(self.size)]
+        self._idle = asyncio.Queue()
+
+        for fd in self._fds:
+            self._idle.put_nowait(fd)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="kxr-read")
+
+    def close(self):
+        if not self.opened:
+            return
+
+        self._executor.shutdown(wait=True)
+
+        for fd in self._fds:
+            os.close(fd)
+
+        self._fds = []
+        self._idle = None
+        self._executor = None
+
+    async def read(self, offset: int, size: int) -> bytes:
+        if not self.opened:
+            raise PermissionError("Read pool must be opened to read from it")
+
+        fd = await self._idle.get()
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, _read_at, fd, offset, size)
+        finally:
+            self._idle.put_nowait(fd)
+
+    @property
+    def opened(self) -> bool:
+        return self._executor is not None
+
+
+def _read_at(fd: int, offset: int, size: int) -> bytes:
+    chunks = []
+
+    if not HAS_PREAD:
+        os.lseek(fd, offset, os.SEEK_SET)
+
+    while size > 0:
+        chunk = os.pread(fd, size, offset) if HAS_PREAD else os.read(fd, size)
+
+        if not chunk:
+            break
+
+        chunks.append(chunk)
+        offset += len(chunk)
+        size -= len(chunk)
+
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
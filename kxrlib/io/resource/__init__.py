@@ -1,9 +1,28 @@
 from .kresource import KResource
 from .kresource_file import KResourceFile
 from .kresource_dir import KResourceDir
+from .kmemory_file import KMemoryFile, KGeneratedFile
 
 __all__ = [
     "KResource",
     "KResourceFile",
-    "KResourceDir"
+    "KResourceDir",
+    "KTarMemberFile",
+    "KZipMemberFile",
+    "KMemoryFile",
+    "KGeneratedFile"
 ]
+
+
+def __getattr__(name: str):
+    # Archive members pull in tarfile and zipfile, so they are only imported when used
+    if name in ("KTarMemberFile", "KZipMemberFile"):
+        from . import karchive_file
+
+        return getattr(karchive_file, name)
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
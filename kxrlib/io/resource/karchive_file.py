@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import struct
+import tarfile
+import time
+import zipfile
+import zlib
+
+from kxrlib.io.byte_buffer import ByteBuffer
+from .kresource_file import KResourceFile
+
+ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
+ZIP_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+ZLIB_HEADER = b"\x78\x9c"
+CHUNK_SIZE = 1024 ** 2
+
+
+class KTarMemberFile(KResourceFile):
+    def __init__(self, tar: tarfile.TarFile, member: tarfile.TarInfo, name: str):
+        self._tar = tar
+        self._member = member
+
+        self._init_file(name, member.size, member.mtime)
+
+    async def read(self, size: int = -1) -> ByteBuffer:
+        with self._tar.extractfile(self._member) as file:
+            return ByteBuffer.from_bytes(file.read(size))
+
+    async def write(self, bbuf: ByteBuffer):
+        raise PermissionError(f"Archive members are read-only: {self.name}")
+
+
+class KZipMemberFile(KResourceFile):
+    """
+    Members stored with deflate can be handed to the packer as zlib streams without recompressing:
+    the raw deflate data is wrapped in a zlib header and an Adler-32 trailer, which is computed
+    (and the member's CRC-32 checked) by decompressing the member once in chunks.
+    """
+
+    def __init__(self, zip_file: zipfile.ZipFile, info: zipfile.ZipInfo, name: str):
+        self._zip = zip_file
+        self._info = info
+
+        self._init_file(name, info.file_size, time.mktime(info.date_time + (0, 0, -1)))
+
+    async def read(self, size: int = -1) -> ByteBuffer:
+        with self._zip.open(self._info) as file:
+            return ByteBuffer.from_bytes(file.read(size))
+
+    async def read_precompressed(self) -> ByteBuffer | None:
+        if self._info.compress_type != zipfile.ZIP_DEFLATED or self._info.flag_bits & 0x1:
+            return None
+
+        deflated = self._read_raw()
+
+        if deflated is None:
+            return None
+
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        adler = zlib.adler32(b"")
+        crc = zlib.crc32(b"")
+        size = 0
+
+        for i in range(0, len(deflated), CHUNK_SIZE):
+            chunk = decompressor.decompress(deflated[i:i + CHUNK_SIZE])
+
+            adler = zlib.adler32(chunk, adler)
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+
+        chunk = decompressor.flush()
+        adler = zlib.adler32(chunk, adler)
+        crc = zlib.crc32(chunk, crc)
+        size += len(chunk)
+
+        if not decompressor.eof or crc != self._info.CRC or size != self._info.file_size:
+            return None
+
+        return ByteBuffer.from_bytes(ZLIB_HEADER + deflated + adler.to_bytes(4, "big"))
+
+    def _read_raw(self) -> bytes | None:
+        # Own handle on the archive rather than the ZipFile's internal one, so reads don't move its position
+        if not isinstance(self._zip.filename, str):
+            return None
+
+        with open(self._zip.filename, "rb") as file:
+            file.seek(self._info.header_offset)
+            signature, name_length, extra_length = ZIP_LOCAL_HEADER.unpack(file.read(ZIP_LOCAL_HEADER.size))
+
+            if signature != ZIP_LOCAL_HEADER_SIGNATURE:
+                return None
+
+            file.seek(name_length + extra_length, 1)
+
+            return file.read(self._info.compress_size)
+
+    async def write(self, bbuf: ByteBuffer):
+        raise PermissionError(f"Archive members are read-only: {self.name}")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import inspect
+import time
+from typing import Awaitable, Callable
+
+from kxrlib.io.byte_buffer import ByteBuffer
+from .kresource_file import KResourceFile
+
+Producer = Callable[[], bytes | Awaitable[bytes]]
+
+
+class KMemoryFile(KResourceFile):
+    def __init__(self, name: str, data: bytes, mtime: float | None = None):
+        if not isinstance(data, bytes):
+            raise TypeError(f"Argument 'data' must be {bytes}, not {type(data)}")
+
+        self._data = data
+
+        self._init_file(name, len(data), mtime if mtime is not None else time.time())
+
+    async def read(self, size: int = -1) -> ByteBuffer:
+        return ByteBuffer.from_bytes(self._data if size < 0 else self._data[:size])
+
+    async def write(self, bbuf: ByteBuffer):
+        self._data = bbuf.buffer
+        self.size = len(self._data)
+
+
+class KGeneratedFile(KResourceFile):
+    """
+    Content comes from a producer that is only called when the file is read, e.g. by the packer.
+    The producer may be a plain function or return an awaitable; size is a hint until then.
+    """
+
+    def __init__(self, name: str, producer: Producer, size: int = 0, mtime: float | None = None):
+        if not callable(producer):
+            raise TypeError(f"Argument 'producer' must be callable, not {type(producer)}")
+
+        self._producer = producer
+
+        self._init_file(name, size, mtime if mtime is not None else time.time())
+
+    async def read(self, size: int = -1) -> ByteBuffer:
+        data = self._producer()
+
+        if inspect.isawaitable(data):
+            data = await data
+
+        if not isinstance(data, bytes):
+            raise TypeError(f"Producer of '{self.name}' must return {bytes}, not {type(data)}")
+
+        self.size = len(data)
+
+        return ByteBuffer.from_bytes(data if size < 0 else data[:size])
+
+    async def write(self, bbuf: ByteBuffer):
+        raise PermissionError(f"Generated files are read-only: {self.name}")
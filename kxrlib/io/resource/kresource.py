@@ -22,6 +22,15 @@ class KResource(ABC):
         else:
             return os.path.join(self.parent.path, self.name)
 
+    @property
+    def relative_path(self) -> str:
+        if self.parent is None:
+            return ""
+        elif self.parent.parent is None:
+            return self.name
+        else:
+            return os.path.join(self.parent.relative_path, self.name)
+
     @property
     def parent(self) -> KResource | None:
         return self._parent
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import os
-from typing import Literal
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Literal, TYPE_CHECKING
 
 from kxrlib.console import generate_statistics_block
 from kxrlib.io.kfile import KFile
 from .kresource import KResource
 from .kresource_file import KResourceFile
+from .kmemory_file import KMemoryFile, KGeneratedFile, Producer
+
+if TYPE_CHECKING:
+    import tarfile
+    import zipfile
+
+ARCHIVE_EXTENSIONS = (".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tar", ".zip")
 
 
 class KResourceDir(KResource):
@@ -14,6 +22,7 @@ class KResourceDir(KResource):
         super().__init__(name)
 
         self._children: dict[str, KResource] = {}
+        self._archive: tarfile.TarFile | zipfile.ZipFile | None = None
 
         if children_list is not None:
             self.children = children_list
@@ -109,7 +118,7 @@ class KResourceDir(KResource):
         return total_packed_size if total_packed_size > 0 else None
 
     @classmethod
-    def from_dir_recursion(cls, src_dir: str | KFile):
+    def from_dir_recursion(cls, src_dir: str | KFile, max_workers: int = 0) -> KResourceDir:
         src_dir = src_dir if isinstance(src_dir, KFile) else KFile(src_dir)
 
         if not src_dir.exists:
@@ -117,16 +126,172 @@ class KResourceDir(KResource):
         if not src_dir.is_dir:
             raise NotADirectoryError(f"Argument 'src_dir' must be a directory: {src_dir}")
 
-        children_list = []
+        if max_workers > 0:
+            return cls._scan_parallel(src_dir.path, max_workers)
+        else:
+            return cls._scan_sequential(src_dir.path)
+
+    @classmethod
+    def from_archive(cls, src_archive: str | KFile) -> KResourceDir:
+        """
+        Builds the tree from a tar or zip archive without extracting it. Members are read from
+        the archive when packed, so it stays open until close() is called on the returned dir.
+        """
+        # Imported here: tarfile and zipfile (with bz2, lzma, shutil) are slow to load and only needed for archives
+        import tarfile
+        import zipfile
+        from .karchive_file import KTarMemberFile, KZipMemberFile
+
+        src_archive = src_archive if isinstance(src_archive, KFile) else KFile(src_archive)
+
+        if not os.path.isfile(src_archive.path):
+            raise FileNotFoundError(f"Argument 'src_archive' must be an existing file: {src_archive}")
+
+        name = src_archive.name
+
+        for extension in ARCHIVE_EXTENSIONS:
+            if name.lower().endswith(extension):
+                name = name[:-len(extension)]
+                break
+
+        tree: dict[str, dict | KResourceFile] = {}
+
+        if zipfile.is_zipfile(src_archive.path):
+            archive = zipfile.ZipFile(src_archive.path)
+
+            for info in archive.infolist():
+                cls._add_tree_member(tree, info.filename, None if info.is_dir() else lambda leaf: KZipMemberFile(archive, info, leaf))
+        elif tarfile.is_tarfile(src_archive.path):
+            archive = tarfile.open(src_archive.path, "r:*")
+
+            for member in archive.getmembers():
+                if member.isdir():
+                    cls._add_tree_member(tree, member.name, None)
+                elif member.isfile():
+                    cls._add_tree_member(tree, member.name, lambda leaf: KTarMemberFile(archive, member, leaf))
+        else:
+            raise ValueError(f"Argument 'src_archive' must be a tar or zip archive: {src_archive}")
+
+        resource_dir = cls._build_tree(name, tree)
+        resource_dir._archive = archive
+
+        return resource_dir
+
+    @classmethod
+    def from_mapping(cls, name: str, files: dict[str, KResourceFile | bytes | Producer]) -> KResourceDir:
+        """
+        Builds a tree from '/'-separated relative paths. Values may be resource files of any kind,
+        bytes (KMemoryFile) or producers (KGeneratedFile). A resource file must already be named
+        like the last part of its path.
+        """
+        tree: dict[str, dict | KResourceFile] = {}
+
+        for path, content in files.items():
+            cls._add_tree_member(tree, path, lambda leaf: cls._as_resource_file(leaf, content))
+
+        return cls._build_tree(name, tree)
+
+    def add(self, resource: KResource):
+        if resource.name in self._children:
+            raise FileExistsError(f"Resource dir already has a child named '{resource.name}': {self}")
+
+        self._children[resource.name] = resource
+        resource.parent = self
+
+    @staticmethod
+    def _as_resource_file(name: str, content: KResourceFile | bytes | Producer) -> KResourceFile:
+        if isinstance(content, KResourceFile):
+            if content.name != name:
+                raise ValueError(f"Resource file '{content.name}' must be named like its path's last part: '{name}'")
+
+            return content
+        elif isinstance(content, bytes):
+            return KMemoryFile(name, content)
+        else:
+            return KGeneratedFile(name, content)
+
+    @staticmethod
+    def _add_tree_member(tree: dict, member_name: str, make_file):
+        parts = [part for part in member_name.replace("\\", "/").split("/") if part and part != "."]
 
-        for file in os.listdir(src_dir.path):
-            file_path = os.path.join(src_dir.path, file)
+        if ".." in parts:
+            raise ValueError(f"Path must not point outside the tree: '{member_name}'")
 
-            if os.path.isfile(file_path):
-                child = KResourceFile(file_path)
+        if make_file is None:
+            leaf_dirs, leaf = parts, None
+        else:
+            leaf_dirs, leaf = parts[:-1], parts[-1]
+
+        for part in leaf_dirs:
+            tree = tree.setdefault(part, {})
+
+        if leaf is not None:
+            tree[leaf] = make_file(leaf)
+
+    @classmethod
+    def _build_tree(cls, name: str, tree: dict) -> KResourceDir:
+        return cls(name, children_list=[
+            cls._build_tree(child_name, child) if isinstance(child, dict) else child
+            for child_name, child in tree.items()
+        ])
+
+    def close(self):
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    @classmethod
+    def _scan_sequential(cls, path: str) -> KResourceDir:
+        children_list = []
+
+        for item in cls._scan_dir(path):
+            if isinstance(item, str):
+                children_list.append(cls._scan_sequential(item))
             else:
-                child = KResourceDir.from_dir_recursion(file_path)
+                children_list.append(item)
+
+        return cls(os.path.basename(path), children_list=children_list)
+
+    @classmethod
+    def _scan_parallel(cls, path: str, max_workers: int) -> KResourceDir:
+        scanned: dict[str, list[KResourceFile | str]] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: dict[Future, str] = {executor.submit(cls._scan_dir, path): path}
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    dir_path = pending.pop(future)
+                    items = future.result()
+
+                    scanned[dir_path] = items
+
+                    for item in items:
+                        if isinstance(item, str):
+                            pending[executor.submit(cls._scan_dir, item)] = item
+
+        return cls._assemble(path, scanned)
+
+    @classmethod
+    def _assemble(cls, path: str, scanned: dict[str, list[KResourceFile | str]]) -> KResourceDir:
+        children_list = [
+            cls._assemble(item, scanned) if isinstance(item, str) else item
+            for item in scanned[path]
+        ]
+
+        return cls(os.path.basename(path), children_list=children_list)
+
+    @staticmethod
+    def _scan_dir(path: str) -> list[KResourceFile | str]:
+        items = []
 
-            children_list.append(child)
+        with os.scandir(path) as it:
+            for dir_entry in it:
+                if dir_entry.is_dir():
+                    items.append(dir_entry.path)
+                else:
+                    items.append(KResourceFile(dir_entry.path, stat_result=dir_entry.stat()))
 
-        return cls(src_dir.name, children_list=children_list)
+        return items
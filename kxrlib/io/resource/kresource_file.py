@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import stat
+
 from kxrlib.io.byte_buffer import ByteBuffer
 from kxrlib.io.kfile import KFile
 from kxrlib.io.file_type import FileType
@@ -7,23 +10,37 @@ from .kresource import KResource
 
 
 class KResourceFile(KResource):
-    def __init__(self, file: str | KFile):
+    def __init__(self, file: str | KFile, stat_result: os.stat_result | None = None):
         self._kfile = file if isinstance(file, KFile) else KFile(file)
 
-        if not self._kfile.exists:
-            raise FileNotFoundError(f"Argument 'file' must be an existing file: {file}")
-        if self._kfile.is_dir:
+        if stat_result is None:
+            try:
+                stat_result = os.stat(self._kfile.path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Argument 'file' must be an existing file: {file}")
+
+        if stat.S_ISDIR(stat_result.st_mode):
             raise IsADirectoryError(f"Argument 'file' must not be a directory: {file}")
 
-        super().__init__(self._kfile.name)
+        self._init_file(self._kfile.name, stat_result.st_size, stat_result.st_mtime)
+
+    def _init_file(self, name: str, size: int, mtime: float):
+        super().__init__(name)
 
-        self._type = FileType.from_extension(self._kfile.extension)
+        self._type = FileType.from_extension(os.path.splitext(name)[1].lstrip("."))
         self._packed_size: int | None = None
 
+        self.size: int = size
+        self.mtime: float = mtime
+
     async def read(self, size: int = -1) -> ByteBuffer:
         async with self._kfile.open("rb"):
             return await self._kfile.read(size)
 
+    async def read_precompressed(self) -> ByteBuffer | None:
+        """A zlib stream of the content that can be stored as is, or None if it has to be compressed."""
+        return None
+
     async def write(self, bbuf: ByteBuffer):
         async with self._kfile.open("wb"):
             await self._kfile.write(bbuf)
@@ -6,10 +6,13 @@ import sys
 def logger_setup(module: str, level: int = logging.DEBUG, log_to_file: bool = True) -> logging.Logger:
     module_name = module.split(".")[-1]
 
-    os.makedirs("logs", exist_ok=True)
-
     logger = logging.getLogger(module)
 
+    if logger.handlers:
+        return logger
+
+    os.makedirs("logs", exist_ok=True)
+
     formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
     if log_to_file:
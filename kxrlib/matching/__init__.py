@@ -0,0 +1,7 @@
+from .fingerprint import Fingerprint
+from .fingerprint_index import FingerprintIndex
+
+__all__ = [
+    "Fingerprint",
+    "FingerprintIndex"
+]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import zlib
+from hashlib import blake2b
+from dataclasses import dataclass
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MAGIC_SIZE = 4
+BLOCK_SIZE = 64
+MAX_FEATURES = 1024
+MIN_FEATURES = 4
+TEXT_PROBE_SIZE = 1024
+
+SIMHASH_BITS = 64
+
+# BIT_TABLES[bit] maps every byte to 1 if it has that bit set, else 0
+BIT_TABLES = [bytes((byte >> bit) & 1 for byte in range(256)) for bit in range(8)]
+
+ALGORITHM = "xxh64" if xxhash is not None else "crc32"
+
+
+@dataclass(slots=True)
+class Fingerprint:
+    path: str
+    size: int
+    magic: bytes
+    digest: int
+    simhash: int
+
+    @classmethod
+    def from_bytes(cls, path: str, data: bytes) -> Fingerprint:
+        return cls(path, len(data), data[:MAGIC_SIZE], content_digest(data), simhash(data))
+
+    @classmethod
+    def from_record(cls, record: list) -> Fingerprint:
+        path, size, magic, digest, simhash_ = record
+
+        return cls(path, size, bytes.fromhex(magic), digest, simhash_)
+
+    def distance(self, other: Fingerprint) -> int:
+        return (self.simhash ^ other.simhash).bit_count()
+
+    @property
+    def record(self) -> list:
+        return [self.path, self.size, self.magic.hex(), self.digest, self.simhash]
+
+
+def content_digest(data: bytes) -> int:
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(data)
+    else:
+        return zlib.crc32(data)
+
+
+def features(data: bytes) -> list[bytes]:
+    """
+    Text is split into lines so that insertions only disturb the lines they touch;
+    anything else is split into fixed-size blocks. Long inputs keep only the features
+    whose checksum falls into a fixed residue class, so the sample does not shift on edits.
+    Each feature is a 64-bit hash as an 8 byte big-endian digest.
+    """
+    if b"\0" not in data[:TEXT_PROBE_SIZE]:
+        chunks = [line for line in data.splitlines() if line.strip()]
+    else:
+        chunks = [data[i:i + BLOCK_SIZE] for i in range(0, len(data), BLOCK_SIZE)]
+
+    if len(chunks) > MAX_FEATURES:
+        mask = (1 << ((len(chunks) - 1) // MAX_FEATURES).bit_length()) - 1
+        chunks = [chunk for chunk in chunks if zlib.crc32(chunk) & mask == 0]
+
+    return [blake2b(chunk, digest_size=SIMHASH_BITS // 8).digest() for chunk in chunks]
+
+
+def simhash(data: bytes) -> int:
+    """0 means the content is too small to carry a meaningful similarity hash."""
+    hashes = features(data)
+
+    if len(hashes) < MIN_FEATURES:
+        return 0
+
+    threshold = len(hashes) / 2
+    value = 0
+
+    for bit, count in enumerate(bit_counts(b"".join(hashes))):
+        if count > threshold:
+            value |= 1 << bit
+
+    return value
+
+
+def bit_counts(digests: bytes) -> list[int]:
+    """
+    For concatenated 8 byte big-endian digests, how many have each of the 64 bits set (index 0 is the
+    least significant bit). Counted per byte column with translate/count, or with NumPy when installed.
+    """
+    digest_size = SIMHASH_BITS // 8
+
+    if numpy is not None:
+        bits = numpy.unpackbits(numpy.frombuffer(digests, dtype="u1").reshape(-1, digest_size), axis=1, bitorder="little")
+
+        return bits.sum(axis=0).reshape(digest_size, 8)[::-1].ravel().tolist()
+
+    counts = []
+
+    for column in reversed(range(digest_size)):
+        column_bytes = digests[column::digest_size]
+        counts.extend(column_bytes.translate(table).count(1) for table in BIT_TABLES)
+
+    return counts
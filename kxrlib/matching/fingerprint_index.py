@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .fingerprint import Fingerprint, ALGORITHM, SIMHASH_BITS
+
+CHUNK_BYTES = 8 * 1024 ** 2
+CHUNK_FILES = 512
+
+DEFAULT_MAX_DISTANCE = 6
+
+
+class FingerprintIndex:
+    """
+    [Index layout]
+     - exact:   {(size, digest): [fingerprint]}
+     - bands:   {(band, bits): [fingerprint]}, the simhash split into max_distance + 1 bands;
+                two hashes within max_distance bits of each other always share at least one band
+
+    [Index file format]
+     - JSON: {"algorithm": "crc32" | "xxh64", "entries": [[path, size, magic hex, digest, simhash]]}
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        if not 0 <= max_distance < SIMHASH_BITS:
+            raise ValueError(f"Argument 'max_distance' must be between 0 and {SIMHASH_BITS - 1}, not {max_distance}")
+
+        self.max_distance = max_distance
+        self.fingerprints: list[Fingerprint] = []
+
+        self._exact: dict[tuple[int, int], list[Fingerprint]] = {}
+        self._bands: dict[tuple[int, int], list[Fingerprint]] = {}
+
+        num_bands = max_distance + 1
+        width = SIMHASH_BITS // num_bands
+
+        self._band_shifts = [band * width for band in range(num_bands)]
+        self._band_masks = [(1 << (width if band < num_bands - 1 else SIMHASH_BITS - band * width)) - 1 for band in range(num_bands)]
+
+    def add(self, fingerprint: Fingerprint):
+        self.fingerprints.append(fingerprint)
+        self._exact.setdefault((fingerprint.size, fingerprint.digest), []).append(fingerprint)
+
+        if fingerprint.simhash:
+            for key in self._band_keys(fingerprint.simhash):
+                self._bands.setdefault(key, []).append(fingerprint)
+
+    def lookup_exact(self, fingerprint: Fingerprint) -> list[Fingerprint]:
+        return self._exact.get((fingerprint.size, fingerprint.digest), [])
+
+    def lookup_similar(self, fingerprint: Fingerprint) -> list[tuple[int, Fingerprint]]:
+        """Candidates with the same magic within max_distance bits, closest (then closest in size) first."""
+        if not fingerprint.simhash:
+            return []
+
+        seen = set()
+        candidates = []
+
+        for key in self._band_keys(fingerprint.simhash):
+            for candidate in self._bands.get(key, ()):
+                if id(candidate) in seen or candidate.magic != fingerprint.magic:
+                    continue
+
+                seen.add(id(candidate))
+                distance = fingerprint.distance(candidate)
+
+                if distance <= self.max_distance:
+                    candidates.append((distance, candidate))
+
+        candidates.sort(key=lambda item: (item[0], abs(item[1].size - fingerprint.size)))
+
+        return candidates
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"algorithm": ALGORITHM, "entries": [fingerprint.record for fingerprint in self.fingerprints]}, file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str, max_distance: int = DEFAULT_MAX_DISTANCE) -> FingerprintIndex:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+        if data.get("algorithm") != ALGORITHM:
+            raise ValueError(f"Fingerprint index '{path}' was built with '{data.get('algorithm')}', but '{ALGORITHM}' is in use")
+
+        index = cls(max_distance)
+
+        for record in data["entries"]:
+            index.add(Fingerprint.from_record(record))
+
+        return index
+
+    @classmethod
+    async def from_dir(cls, root: str, max_distance: int = DEFAULT_MAX_DISTANCE, max_workers: int | None = None) -> FingerprintIndex:
+        index = cls(max_distance)
+        loop = asyncio.get_running_loop()
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [loop.run_in_executor(executor, fingerprint_files, root, chunk) for chunk in cls._chunk(root)]
+
+            for records in await asyncio.gather(*futures):
+                for record in records:
+                    index.add(Fingerprint.from_record(record))
+
+        return index
+
+    def _band_keys(self, simhash: int) -> list[tuple[int, int]]:
+        return [(band, simhash >> shift & mask) for band, (shift, mask) in enumerate(zip(self._band_shifts, self._band_masks))]
+
+    @staticmethod
+    def _chunk(root: str) -> list[list[str]]:
+        chunks = []
+        chunk = []
+        chunk_bytes = 0
+
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+
+                chunk.append(os.path.relpath(path, root))
+                chunk_bytes += os.path.getsize(path)
+
+                if chunk_bytes >= CHUNK_BYTES or len(chunk) >= CHUNK_FILES:
+                    chunks.append(chunk)
+                    chunk = []
+                    chunk_bytes = 0
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+
+def fingerprint_files(root: str, paths: list[str]) -> list[list]:
+    records = []
+
+    for path in paths:
+        with open(os.path.join(root, path), "rb") as file:
+            data = file.read()
+
+        records.append(Fingerprint.from_bytes(path.replace(os.sep, "/"), data).record)
+
+    return records
@@ -0,0 +1,7 @@
+from .stage import Stage
+from .stage_metrics import StageMetrics
+
+__all__ = [
+    "Stage",
+    "StageMetrics"
+]
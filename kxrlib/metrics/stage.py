@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class Stage(Enum):
+    SOURCE_READ = "Source read"
+    ARCHIVE_READ = "Archive read"
+    CRYPT = "Crypt"
+    COMPRESS = "Compress"
+    DECOMPRESS = "Decompress"
+    ARCHIVE_WRITE = "Archive write"
+    OUTPUT_WRITE = "Output write"
+
+    def __str__(self) -> str:
+        return self.value
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable
+
+from kxrlib.console import generate_statistics_block
+from kxrlib.io.file_type import FileType
+from .stage import Stage
+
+StageHook = Callable[[Stage, float, int, FileType | None], None]
+
+# Plain file bytes entering a pack or leaving an unpack; only one of them is recorded per run
+CONTENT_STAGES = (Stage.SOURCE_READ, Stage.OUTPUT_WRITE)
+
+
+class StageMetrics:
+    """
+    [Stage metrics]
+     - times:       cumulative seconds per stage
+     - bytes:       cumulative bytes per stage
+     - type_times:  per FileType breakdown of times
+     - type_bytes:  per FileType breakdown of bytes
+     - hook:        optional callback(stage, elapsed, size, file_type) fired on every record
+
+    [File type block]
+     - time:        seconds summed over every stage
+     - size:        content bytes, i.e. CONTENT_STAGES (source read when packing, output write when unpacking);
+                    per-stage bytes of every type are in as_dict
+    """
+
+    def __init__(self, hook: StageHook | None = None):
+        self.hook = hook
+
+        self.times: dict[Stage, float] = dict.fromkeys(Stage, 0.0)
+        self.bytes: dict[Stage, int] = dict.fromkeys(Stage, 0)
+        self.type_times: dict[FileType, dict[Stage, float]] = {}
+        self.type_bytes: dict[FileType, dict[Stage, int]] = {}
+
+    def record(self, stage: Stage, start: float, size: int, file_type: FileType | None = None) -> float:
+        now = perf_counter()
+        elapsed = now - start
+
+        self.times[stage] += elapsed
+        self.bytes[stage] += size
+
+        if file_type is not None:
+            type_times = self.type_times.get(file_type)
+
+            if type_times is None:
+                type_times = self.type_times[file_type] = dict.fromkeys(Stage, 0.0)
+                self.type_bytes[file_type] = dict.fromkeys(Stage, 0)
+
+            type_times[stage] += elapsed
+            self.type_bytes[file_type][stage] += size
+
+        if self.hook is not None:
+            self.hook(stage, elapsed, size, file_type)
+
+        return now
+
+    def generate_metrics_block(self) -> str:
+        stage_desc_strings = [str(stage) for stage in Stage]
+        stage_value_strings = [self._format_value(self.times[stage], self.bytes[stage]) for stage in Stage]
+
+        stage_block = generate_statistics_block("STAGE METRICS", stage_desc_strings, stage_value_strings)
+
+        if not self.type_times:
+            return stage_block
+
+        type_desc_strings = []
+        type_value_strings = []
+
+        for file_type, type_times in sorted(self.type_times.items(), key=lambda item: sum(item[1].values()), reverse=True):
+            type_bytes = self.type_bytes[file_type]
+
+            type_desc_strings.append(file_type.value if file_type is not FileType.UNKNOWN else "(unknown)")
+            type_value_strings.append(self._format_value(sum(type_times.values()), sum(type_bytes[stage] for stage in CONTENT_STAGES)) + " content")
+
+        type_block = generate_statistics_block("FILE TYPE METRICS", type_desc_strings, type_value_strings)
+
+        return f"{stage_block}\n{type_block}"
+
+    @staticmethod
+    def _format_value(seconds: float, size: int) -> str:
+        return f"{seconds:.3f}s | {size / (1024 ** 2):.2f}MB"
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.times.values())
+
+    @property
+    def as_dict(self) -> dict[str, dict]:
+        return {
+            "stages": {
+                str(stage): {"seconds": self.times[stage], "bytes": self.bytes[stage]}
+                for stage in Stage
+            },
+            "file_types": {
+                file_type.value: {
+                    str(stage): {"seconds": type_times[stage], "bytes": self.type_bytes[file_type][stage]}
+                    for stage in Stage
+                }
+                for file_type, type_times in self.type_times.items()
+            }
+        }
@@ -1,7 +1,19 @@
 from .kxr_packer import KxrPacker
 from .kxr_unpacker import KxrUnpacker
+from .layout_strategy import LayoutStrategy
+from .kxr_verifier import KxrVerifier
+from .kxr_differ import KxrDiffer
+from .kxr_name_matcher import KxrNameMatcher
+from .kxr_sniffer import KxrSniffer
+from .kxr_tar_streamer import KxrTarStreamer
 
 __all__ = [
     "KxrPacker",
-    "KxrUnpacker"
+    "KxrUnpacker",
+    "LayoutStrategy",
+    "KxrVerifier",
+    "KxrDiffer",
+    "KxrNameMatcher",
+    "KxrSniffer",
+    "KxrTarStreamer"
 ]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from kxrlib.io import KxrFile, KxrBlob
+
+CHUNK_ENTRIES = 256
+
+
+class KxrDiffer:
+    """
+    [Diff report]
+     - added / removed:     [{path, size, zipped}]
+     - modified:            [{path, reason, old_size, new_size}], reason is one of "size", "content"
+     - unchanged:           number of entries whose content is identical
+
+    A different size is only decisive for unzipped entries: the stored size of a zipped entry depends on
+    the compression settings it was packed with, so those are compared by content unless size_only is set.
+    """
+
+    def __init__(self, old_kxr_file: KxrFile, new_kxr_file: KxrFile, max_workers: int | None = None, size_only: bool = False):
+        self.old_kxr_file = old_kxr_file
+        self.new_kxr_file = new_kxr_file
+        self.max_workers = max_workers
+        self.size_only = size_only
+
+    async def diff(self) -> dict[str, str | int | list]:
+        async with self.old_kxr_file.open("rb"), self.new_kxr_file.open("rb"):
+            old_blobs = {blob.path: blob for blob in self.old_kxr_file.blobs()}
+            new_blobs = {blob.path: blob for blob in self.new_kxr_file.blobs()}
+
+        added = [self._describe(new_blobs[path]) for path in new_blobs if path not in old_blobs]
+        removed = [self._describe(old_blobs[path]) for path in old_blobs if path not in new_blobs]
+
+        modified = []
+        ambiguous = []
+
+        for path, old_blob in old_blobs.items():
+            new_blob = new_blobs.get(path)
+
+            if new_blob is None:
+                continue
+
+            if self._size_is_decisive(old_blob, new_blob) and old_blob.size != new_blob.size:
+                modified.append(self._describe_change(old_blob, new_blob, "size"))
+            else:
+                ambiguous.append((old_blob, new_blob))
+
+        for old_blob, new_blob, changed in await self._compare_content(ambiguous):
+            if changed:
+                modified.append(self._describe_change(old_blob, new_blob, "content"))
+
+        modified.sort(key=lambda item: item["path"])
+
+        return {
+            "old": self.old_kxr_file.path,
+            "new": self.new_kxr_file.path,
+            "added": added,
+            "removed": removed,
+            "modified": modified,
+            "unchanged": len(old_blobs) - len(removed) - len(modified)
+        }
+
+    def _size_is_decisive(self, old_blob: KxrBlob, new_blob: KxrBlob) -> bool:
+        if old_blob.zipped != new_blob.zipped:
+            return False
+
+        return not old_blob.zipped or self.size_only
+
+    async def _compare_content(self, pairs: list[tuple[KxrBlob, KxrBlob]]) -> list[tuple[KxrBlob, KxrBlob, bool]]:
+        if not pairs:
+            return []
+
+        loop = asyncio.get_running_loop()
+        pairs.sort(key=lambda pair: pair[1].offset)
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                loop.run_in_executor(
+                    executor,
+                    compare_blobs,
+                    self.old_kxr_file.path,
+                    self.old_kxr_file.passhash,
+                    self.new_kxr_file.path,
+                    self.new_kxr_file.passhash,
+                    pairs[i:i + CHUNK_ENTRIES]
+                )
+                for i in range(0, len(pairs), CHUNK_ENTRIES)
+            ]
+
+            results = []
+
+            for chunk_results in await asyncio.gather(*futures):
+                results.extend(chunk_results)
+
+        return results
+
+    @staticmethod
+    def _describe(blob: KxrBlob) -> dict[str, str | int | bool]:
+        return {"path": blob.path, "size": blob.size, "zipped": blob.zipped}
+
+    @staticmethod
+    def _describe_change(old_blob: KxrBlob, new_blob: KxrBlob, reason: str) -> dict[str, str | int]:
+        return {"path": new_blob.path, "reason": reason, "old_size": old_blob.size, "new_size": new_blob.size}
+
+
+def compare_blobs(old_path: str, old_passhash: int, new_path: str, new_passhash: int, pairs: list[tuple[KxrBlob, KxrBlob]]) -> list[tuple[KxrBlob, KxrBlob, bool]]:
+    results = []
+
+    with open(old_path, "rb") as old_file, open(new_path, "rb") as new_file:
+        for old_blob, new_blob in pairs:
+            old_data = old_blob.read(old_file)
+            new_data = new_blob.read(new_file)
+
+            same_encoding = old_blob.zipped == new_blob.zipped and (
+                old_blob.zipped or old_passhash ^ old_blob.offset == new_passhash ^ new_blob.offset
+            )
+
+            if same_encoding and old_data == new_data:
+                changed = False
+            elif same_encoding and not old_blob.zipped:
+                changed = True
+            else:
+                changed = old_blob.decode(old_data, old_passhash) != new_blob.decode(new_data, new_passhash)
+
+            results.append((old_blob, new_blob, changed))
+
+    return results
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from kxrlib.io import KxrFile, KxrBlob
+from kxrlib.matching import Fingerprint, FingerprintIndex
+
+CHUNK_ENTRIES = 256
+
+
+class KxrNameMatcher:
+    """
+    [Name map format]
+     - JSON: {archive relative path: restored relative path}, "/"-separated
+     - KxrUnpacker(name_map=...) writes matched entries to the restored path
+     - restored paths must stay inside the output: no absolute paths, drive letters or '..' parts
+    """
+
+    def __init__(self, kxr_file: KxrFile, index: FingerprintIndex, max_workers: int | None = None):
+        self.kxr_file = kxr_file
+        self.index = index
+        self.max_workers = max_workers
+
+    async def match(self) -> dict[str, dict | list | int]:
+        async with self.kxr_file.open("rb"):
+            blobs = self.kxr_file.blobs()
+
+        fingerprints = await self.fingerprint(blobs)
+
+        name_map = {}
+        used = set()
+        remaining = []
+
+        for fingerprint in fingerprints:
+            candidate = next((candidate for candidate in self.index.lookup_exact(fingerprint) if candidate.path not in used), None)
+
+            if candidate is not None:
+                name_map[fingerprint.path] = candidate.path
+                used.add(candidate.path)
+            else:
+                remaining.append(fingerprint)
+
+        exact = len(name_map)
+
+        pairs = [
+            (distance, abs(candidate.size - fingerprint.size), fingerprint, candidate)
+            for fingerprint in remaining
+            for distance, candidate in self.index.lookup_similar(fingerprint)
+        ]
+        pairs.sort(key=lambda item: (item[0], item[1], item[2].path))
+
+        for _, _, fingerprint, candidate in pairs:
+            if fingerprint.path in name_map or candidate.path in used:
+                continue
+
+            name_map[fingerprint.path] = candidate.path
+            used.add(candidate.path)
+
+        return {
+            "name_map": name_map,
+            "exact": exact,
+            "similar": len(name_map) - exact,
+            "unmatched": [fingerprint.path for fingerprint in remaining if fingerprint.path not in name_map]
+        }
+
+    async def fingerprint(self, blobs: list[KxrBlob]) -> list[Fingerprint]:
+        loop = asyncio.get_running_loop()
+        blobs = sorted(blobs, key=lambda blob: blob.offset)
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                loop.run_in_executor(executor, fingerprint_blobs, self.kxr_file.path, self.kxr_file.passhash, blobs[i:i + CHUNK_ENTRIES])
+                for i in range(0, len(blobs), CHUNK_ENTRIES)
+            ]
+
+            fingerprints = []
+
+            for records in await asyncio.gather(*futures):
+                fingerprints.extend(Fingerprint.from_record(record) for record in records)
+
+        return fingerprints
+
+    @staticmethod
+    def save_name_map(name_map: dict[str, str], path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(name_map, file, indent=2)
+
+    @staticmethod
+    def load_name_map(path: str) -> dict[str, str]:
+        with open(path, "r", encoding="utf-8") as file:
+            name_map = json.load(file)
+
+        if not isinstance(name_map, dict):
+            raise ValueError(f"Name map must be a JSON object: '{path}'")
+
+        return {archive_path: KxrNameMatcher.safe_relative_path(restored_path) for archive_path, restored_path in name_map.items()}
+
+    @staticmethod
+    def safe_relative_path(path: str) -> str:
+        """Normalizes path to '/'-separated parts, raising ValueError if it could resolve outside its base directory."""
+        if not isinstance(path, str):
+            raise ValueError(f"Restored path must be {str}, not {type(path)}")
+
+        normalized = path.replace("\\", "/")
+        parts = [part for part in normalized.split("/") if part and part != "."]
+
+        if normalized.startswith("/") or re.match(r"^[a-zA-Z]:", normalized) or ".." in parts or not parts:
+            raise ValueError(f"Unsafe restored path: '{path}'")
+
+        return "/".join(parts)
+
+
+def fingerprint_blobs(kxr_path: str, passhash: int, blobs: list[KxrBlob]) -> list[list]:
+    records = []
+
+    with open(kxr_path, "rb") as file:
+        for blob in blobs:
+            data = blob.decode(blob.read(file), passhash)
+
+            records.append(Fingerprint.from_bytes(blob.path.replace("\\", "/"), data).record)
+
+    return records
@@ -1,23 +1,59 @@
 import asyncio
-from typing import Generator
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
 from logging import Logger
 
 from kxrlib.logger import NullLogger
-from kxrlib import KxrFile, KResourceDir, KxrHeaderEntry, KResource, KResourceFile
-from kxrlib.console import generate_begin_end_blocks, format_time, generate_progress_bar
+from kxrlib.metrics import Stage, StageMetrics
+from kxrlib.events import Event, EventType, EventBus, ProgressRenderer, BatchedLogWriter
+from kxrlib import KxrFile, KResourceDir, KxrHeaderEntry, KResourceFile, ByteBuffer
+from kxrlib.io import AccessTrace, KxrAppendWriter
+from kxrlib.console import generate_begin_end_blocks, format_time
+from .layout_strategy import LayoutStrategy
+from .zlib_search import compress_smallest
 
 
 class KxrPacker:
-    def __init__(self, kxr_file: KxrFile, resource_dir: KResourceDir, logger: Logger | None = None):
+    def __init__(
+            self,
+            kxr_file: KxrFile,
+            resource_dir: KResourceDir,
+            logger: Logger | None = None,
+            metrics: StageMetrics | None = None,
+            events: EventBus | None = None,
+            layout: LayoutStrategy | str = LayoutStrategy.FILESYSTEM,
+            trace: AccessTrace | None = None,
+            preallocate: bool = False,
+            optimize_size: bool = False,
+            max_workers: int | None = None
+    ):
+        layout = layout if isinstance(layout, LayoutStrategy) else LayoutStrategy(layout)
+
+        if layout is LayoutStrategy.TRACE and trace is None:
+            raise ValueError(f"Keyword argument 'trace' is required for layout strategy '{layout}'")
+
         self.kxr_file = kxr_file
         self.resource_dir = resource_dir
         self.logger = logger if logger is not None else NullLogger()
+        self.metrics = metrics
+        self.events = events if events is not None else EventBus([ProgressRenderer(), BatchedLogWriter(self.logger)])
+
+        self.layout = layout
+        self.trace = trace
+        self.preallocate = preallocate
+        self.optimize_size = optimize_size
+        self.max_workers = max_workers
+
+        self.kxr_file.metrics = metrics
 
         self.resource_summary: dict[str, int] = self.resource_dir.resource_summary
-        self.progress_generator: Generator[float, None, None] = ((i + 1) / self.total_files for i in range(self.total_files))
 
         self.start_time: float | None = None
+        self.files_packed: int = 0
         self.data_packed: int = 0
+        self.bytes_saved: int = 0
 
     async def pack(self):
         if self.kxr_file.exists:
@@ -36,67 +72,167 @@ class KxrPacker:
 
             self.logger.info(f"Input: {self.resource_dir}")
             self.logger.info(f"Output: \"{self.kxr_file.path}\"")
+            self.logger.info(f"Layout: {self.layout}")
+            self.logger.info(f"Optimize size: {self.optimize_size}")
 
             self.start_time = asyncio.get_running_loop().time()
 
+            self._publish(EventType.BEGIN)
+
             self.kxr_file.root.populate(self.resource_dir)
 
-            await self._recursive_pack(self.resource_dir, self.kxr_file.root)
+            files = self._layout_files()
+            preallocate = sum(resource_file.size for resource_file, _ in files) if self.preallocate else 0
+
+            async with KxrAppendWriter(self.kxr_file, preallocate=preallocate) as writer:
+                if self.optimize_size:
+                    await self._pack_optimized(files, writer)
+                else:
+                    for resource_file, entry in files:
+                        await self._pack_file(resource_file, entry, writer)
+                        self._publish_file(resource_file)
+
+            if self.events.active:
+                self._publish_dirs(self.resource_dir)
+
+            self._publish(EventType.END)
 
             formatted_elapsed_time = format_time(asyncio.get_running_loop().time() - self.start_time)
             self.logger.info(f"Time elapsed: {formatted_elapsed_time}")
 
+            if self.optimize_size:
+                self.logger.info(f"Bytes saved: {self.bytes_saved}")
+
+            if self.metrics is not None:
+                for line in self.metrics.generate_metrics_block().split("\n"):
+                    self.logger.info(line)
+
             for line in end_block_lines:
                 self.logger.info(line)
 
-    async def _recursive_pack(self, resource_dir: KResourceDir, entry: KxrHeaderEntry):
+    def _layout_files(self) -> list[tuple[KResourceFile, KxrHeaderEntry]]:
+        files: list[tuple[KResourceFile, KxrHeaderEntry]] = []
+
+        self._collect_files(self.resource_dir, self.kxr_file.root, files, group_by_dir=self.layout is not LayoutStrategy.FILESYSTEM)
+
+        match self.layout:
+            case LayoutStrategy.FILE_TYPE:
+                files.sort(key=lambda item: item[0].type.value)
+
+            case LayoutStrategy.TRACE:
+                ranks = self.trace.ranks
+                unranked = len(ranks)
+
+                files.sort(key=lambda item: ranks.get(item[0].relative_path, unranked))
+
+        return files
+
+    def _collect_files(self, resource_dir: KResourceDir, entry: KxrHeaderEntry, files: list[tuple[KResourceFile, KxrHeaderEntry]], group_by_dir: bool):
+        subdirs = []
+
         for child in resource_dir.children.values():
-            await self._process_resource(child, entry)
+            if isinstance(child, KResourceFile):
+                files.append((child, entry))
+            elif isinstance(child, KResourceDir):
+                if group_by_dir:
+                    subdirs.append(child)
+                else:
+                    self._collect_files(child, entry.children[child.name], files, group_by_dir)
+
+        for subdir in subdirs:
+            self._collect_files(subdir, entry.children[subdir.name], files, group_by_dir)
+
+    def _publish_dirs(self, resource_dir: KResourceDir):
+        for child in resource_dir.children.values():
+            if isinstance(child, KResourceDir):
+                self._publish_dirs(child)
 
-    async def _process_resource(self, resource: KResource, entry: KxrHeaderEntry):
-        if isinstance(resource, KResourceFile):
-            await self._pack_file(resource, entry)
-        elif isinstance(resource, KResourceDir):
-            await self._recursive_pack(resource, entry.children[resource.name])
+                self._publish(EventType.DIR_PROCESSED, child.path, None, child.packed_size, child.needs_zipping)
 
-        self.logger.info(
-            f"Processed \"{resource.path}\": "
-            f"offset={self.kxr_file.datasize - resource.packed_size if isinstance(resource, KResourceFile) else None} "
-            f"size={resource.packed_size} "
-            f"zipped={resource.needs_zipping}"
-        )
+    async def _pack_file(self, resource_file: KResourceFile, entry: KxrHeaderEntry, writer: KxrAppendWriter | None = None):
+        metrics = self.metrics
+        start = perf_counter() if metrics is not None else 0.0
 
-    async def _pack_file(self, resource_file: KResourceFile, entry: KxrHeaderEntry):
-        self._update_progress(next(self.progress_generator))
+        needs_zipping = resource_file.type.criteria.needs_zipping
+        bbuf = await resource_file.read_precompressed() if needs_zipping else None
+        precompressed = bbuf is not None
 
-        bbuf = await resource_file.read()
+        if not precompressed:
+            bbuf = await resource_file.read()
 
-        await entry.put_content(resource_file.name, bbuf, resource_file.type.criteria.needs_zipping)
+        if metrics is not None:
+            metrics.record(Stage.SOURCE_READ, start, bbuf.size, resource_file.type)
+
+        await entry.put_content(resource_file.name, bbuf, needs_zipping, writer=writer, precompressed=precompressed)
 
         resource_file.packed_size = bbuf.size
+        self.files_packed += 1
         self.data_packed += bbuf.size
 
-    def _update_progress(self, current: float):
-        if current * self.total_files == 1:
-            print()
+    async def _pack_optimized(self, files: list[tuple[KResourceFile, KxrHeaderEntry]], writer: KxrAppendWriter):
+        """
+        Zipped entries are compressed with every candidate setting in worker processes while later sources
+        are read; results are stored in layout order, with at most a bounded window of entries in flight.
+        """
+        loop = asyncio.get_running_loop()
+
+        max_workers = self.max_workers or os.cpu_count() or 1
+        window = 2 * max_workers
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending: deque[tuple[KResourceFile, KxrHeaderEntry, ByteBuffer, asyncio.Future | None]] = deque()
+
+            for resource_file, entry in files:
+                bbuf = await self._read_source(resource_file)
+                future = loop.run_in_executor(executor, compress_smallest, bbuf.buffer) if resource_file.needs_zipping else None
+
+                pending.append((resource_file, entry, bbuf, future))
+
+                if len(pending) >= window:
+                    await self._store_optimized(*pending.popleft(), writer)
+
+            while pending:
+                await self._store_optimized(*pending.popleft(), writer)
+
+    async def _store_optimized(self, resource_file: KResourceFile, entry: KxrHeaderEntry, bbuf: ByteBuffer, future: asyncio.Future | None, writer: KxrAppendWriter):
+        if future is not None:
+            metrics = self.metrics
+            start = perf_counter() if metrics is not None else 0.0
+            size = bbuf.size
+
+            stream, default_size = await future
 
-        megabytes = self.data_packed / (1024 ** 2)
+            if metrics is not None:
+                metrics.record(Stage.COMPRESS, start, size, resource_file.type)
 
-        formatted_elapsed_time = format_time(asyncio.get_running_loop().time() - self.start_time)
+            bbuf = ByteBuffer.from_bytes(stream)
+            self.bytes_saved += default_size - len(stream)
+
+        await entry.put_content(resource_file.name, bbuf, resource_file.needs_zipping, writer=writer, precompressed=future is not None)
+
+        resource_file.packed_size = bbuf.size
+        self.files_packed += 1
+        self.data_packed += bbuf.size
+
+        self._publish_file(resource_file)
+
+    async def _read_source(self, resource_file: KResourceFile) -> ByteBuffer:
+        metrics = self.metrics
+        start = perf_counter() if metrics is not None else 0.0
+
+        bbuf = await resource_file.read()
 
-        bar = generate_progress_bar(current)
+        if metrics is not None:
+            metrics.record(Stage.SOURCE_READ, start, bbuf.size, resource_file.type)
 
-        progress_string = (
-            f"\rPacking file: ({int(current * self.total_files)}/{self.total_files}) | "
-            f"Data packed: {megabytes:.2f}MB | "
-            f"Time elapsed: {formatted_elapsed_time} | "
-            f"{bar} {round(current * 100, 2)}%"
-        )
+        return bbuf
 
-        print(progress_string, end="", flush=True)
+    def _publish_file(self, resource_file: KResourceFile):
+        if self.events.active:
+            self._publish(EventType.FILE_PROCESSED, resource_file.path, self.kxr_file.datasize - resource_file.packed_size, resource_file.packed_size, resource_file.needs_zipping)
 
-        if current * self.total_files == self.total_files:
-            print()
+    def _publish(self, event_type: EventType, path: str | None = None, offset: int | None = None, size: int | None = None, zipped: bool | None = None):
+        self.events.publish(Event(event_type, "pack", path, offset, size, zipped, self.files_packed, self.total_files, self.data_packed, perf_counter()))
 
     @property
     def total_files(self) -> int:
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from kxrlib.io import KxrFile, KxrBlob, FileType
+from kxrlib.io.file_type import SNIFF_SIZE
+from kxrlib.io.kxr_header_entry import SNIFF_READ_SIZE
+
+CHUNK_ENTRIES = 1024
+
+
+class KxrSniffer:
+    """
+    Classifies every entry by its leading bytes. Only a short prefix of each blob is read,
+    and zipped blobs are decompressed just far enough to see the signature.
+    Entries that fail to decompress are classified as unknown and listed in errors.
+    """
+
+    def __init__(self, kxr_file: KxrFile, max_workers: int | None = None):
+        self.kxr_file = kxr_file
+        self.max_workers = max_workers
+        self.errors: dict[str, str] = {}
+
+    async def sniff(self) -> dict[str, FileType]:
+        async with self.kxr_file.open("rb"):
+            blobs = sorted(self.kxr_file.blobs(), key=lambda blob: blob.offset)
+
+        loop = asyncio.get_running_loop()
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                loop.run_in_executor(executor, sniff_blobs, self.kxr_file.path, self.kxr_file.passhash, blobs[i:i + CHUNK_ENTRIES])
+                for i in range(0, len(blobs), CHUNK_ENTRIES)
+            ]
+
+            types = {}
+            self.errors.clear()
+
+            for results in await asyncio.gather(*futures):
+                for path, extension, error in results:
+                    types[path] = FileType.from_extension(extension)
+
+                    if error is not None:
+                        self.errors[path] = error
+
+        return types
+
+
+def sniff_blobs(kxr_path: str, passhash: int, blobs: list[KxrBlob]) -> list[tuple[str, str, str | None]]:
+    results = []
+
+    with open(kxr_path, "rb") as file:
+        for blob in blobs:
+            try:
+                data = blob.decode_prefix(blob.read_prefix(file, SNIFF_READ_SIZE), passhash, SNIFF_SIZE)
+            except zlib.error as e:
+                # A corrupt or truncated entry must not cost the rest of the chunk its results
+                results.append((blob.path, FileType.UNKNOWN.value, str(e)))
+                continue
+
+            results.append((blob.path, FileType.from_signature(data).value, None))
+
+    return results
@@ -0,0 +1,148 @@
+import asyncio
+import io
+import tarfile
+from time import perf_counter
+from logging import Logger
+from typing import BinaryIO
+
+from kxrlib.logger import NullLogger
+from kxrlib.metrics import Stage, StageMetrics
+from kxrlib.events import Event, EventType, EventBus, ProgressRenderer, BatchedLogWriter
+from kxrlib import KxrFile, KxrHeaderEntry
+from kxrlib.io import EntryFilter
+from kxrlib.console import generate_begin_end_blocks, format_time
+from .kxr_name_matcher import KxrNameMatcher
+
+FILE_MODE = 0o644
+DIR_MODE = 0o755
+
+
+class KxrTarStreamer:
+    """
+    Streams the entries of a Kxr file into an uncompressed tar stream ("w|"), in header order.
+    Only one decoded entry is held in memory at a time and nothing is written to disk besides the stream itself.
+    """
+
+    def __init__(
+            self,
+            kxr_file: KxrFile,
+            fileobj: BinaryIO,
+            logger: Logger | None = None,
+            metrics: StageMetrics | None = None,
+            events: EventBus | None = None,
+            entry_filter: EntryFilter | None = None,
+            name_map: dict[str, str] | None = None
+    ):
+        self.kxr_file = kxr_file
+        self.fileobj = fileobj
+        self.logger = logger if logger is not None else NullLogger()
+        self.metrics = metrics
+        self.events = events if events is not None else EventBus([ProgressRenderer(), BatchedLogWriter(self.logger)])
+
+        self.entry_filter = entry_filter if entry_filter is not None and entry_filter.active else None
+        self.name_map = name_map
+
+        self.kxr_file.metrics = metrics
+
+        self.header_summary: dict[str, int] = (
+            self.entry_filter.summarize(self.entry_filter.select(self.kxr_file.root))
+            if self.entry_filter is not None else
+            self.kxr_file.header_summary
+        )
+
+        self._selection: dict[KxrHeaderEntry, list[KxrHeaderEntry]] | None = None
+
+        self.start_time: float | None = None
+        self.files_unpacked: int = 0
+        self.data_unpacked: int = 0
+
+    async def stream(self):
+        async with self.kxr_file.open("rb"):
+            header_summary_block_lines = self.kxr_file.generate_header_summary_block(self.header_summary).split("\n")
+
+            begin_block_lines, end_block_lines = [block.split("\n") for block in generate_begin_end_blocks("UNPACK TAR", len(max(header_summary_block_lines, key=len)))]
+
+            for line in begin_block_lines:
+                self.logger.info(line)
+
+            for line in header_summary_block_lines:
+                self.logger.info(line)
+
+            self.logger.info(f"Input: \"{self.kxr_file.path}\"")
+            self.logger.info(f"Output: {getattr(self.fileobj, 'name', self.fileobj)}")
+
+            self.start_time = asyncio.get_running_loop().time()
+
+            if self.entry_filter is not None:
+                self._selection = self.entry_filter.select(self.kxr_file.root)
+
+            self._publish(EventType.BEGIN)
+
+            with tarfile.open(fileobj=self.fileobj, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+                await self._recursive_stream(self.kxr_file.root, tar)
+
+            self._publish(EventType.END)
+
+            formatted_elapsed_time = format_time(asyncio.get_running_loop().time() - self.start_time)
+            self.logger.info(f"Time elapsed: {formatted_elapsed_time}")
+
+            if self.metrics is not None:
+                for line in self.metrics.generate_metrics_block().split("\n"):
+                    self.logger.info(line)
+
+            for line in end_block_lines:
+                self.logger.info(line)
+
+    async def _recursive_stream(self, entries: KxrHeaderEntry, tar: tarfile.TarFile):
+        children = entries.children.values() if self._selection is None else self._selection.get(entries, [])
+
+        for child in children:
+            if not child.is_dir:
+                await self._stream_file(child, tar)
+
+                if self.events.active:
+                    self._publish(EventType.FILE_PROCESSED, child.path, child.offset, child.size, child.zipped)
+            else:
+                if not self.name_map:
+                    tar.addfile(self._tar_info(child, child.relative_path.replace("\\", "/"), tarfile.DIRTYPE))
+
+                await self._recursive_stream(child, tar)
+
+                if self.events.active:
+                    self._publish(EventType.DIR_PROCESSED, child.path, child.offset, child.size, child.zipped)
+
+    async def _stream_file(self, entry: KxrHeaderEntry, tar: tarfile.TarFile):
+        bbuf = await entry.get_content()
+
+        relative_path = entry.relative_path.replace("\\", "/")
+        name = KxrNameMatcher.safe_relative_path(self.name_map.get(relative_path, relative_path) if self.name_map else relative_path)
+
+        metrics = self.metrics
+        start = perf_counter() if metrics is not None else 0.0
+
+        tar_info = self._tar_info(entry, name, tarfile.REGTYPE)
+        tar_info.size = bbuf.size
+
+        tar.addfile(tar_info, io.BytesIO(bbuf.buffer))
+
+        if metrics is not None:
+            metrics.record(Stage.OUTPUT_WRITE, start, bbuf.size, entry.type)
+
+        self.files_unpacked += 1
+        self.data_unpacked += bbuf.size
+
+    @staticmethod
+    def _tar_info(entry: KxrHeaderEntry, name: str, tar_type: bytes) -> tarfile.TarInfo:
+        tar_info = tarfile.TarInfo(name)
+        tar_info.type = tar_type
+        tar_info.mode = DIR_MODE if tar_type == tarfile.DIRTYPE else FILE_MODE
+        tar_info.mtime = max(entry.updated or entry.created or 0, 0)
+
+        return tar_info
+
+    def _publish(self, event_type: EventType, path: str | None = None, offset: int | None = None, size: int | None = None, zipped: bool | None = None):
+        self.events.publish(Event(event_type, "unpack", path, offset, size, zipped, self.files_unpacked, self.total_files, self.data_unpacked, perf_counter()))
+
+    @property
+    def total_files(self) -> int:
+        return self.header_summary["num_files"]
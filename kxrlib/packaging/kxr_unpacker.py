@@ -1,23 +1,50 @@
 import asyncio
 import os
-from typing import Generator
+from time import perf_counter
 from logging import Logger
 
 from kxrlib.logger import NullLogger
+from kxrlib.metrics import Stage, StageMetrics
+from kxrlib.events import Event, EventType, EventBus, ProgressRenderer, BatchedLogWriter
 from kxrlib import KxrFile, KFile, KxrHeaderEntry
-from kxrlib.console import generate_begin_end_blocks, format_time, generate_progress_bar
+from kxrlib.io import EntryFilter
+from kxrlib.console import generate_begin_end_blocks, format_time
+from .kxr_name_matcher import KxrNameMatcher
 
 
 class KxrUnpacker:
-    def __init__(self, kxr_file: KxrFile, output_dir: KFile, logger: Logger | None = None):
+    def __init__(
+            self,
+            kxr_file: KxrFile,
+            output_dir: KFile,
+            logger: Logger | None = None,
+            metrics: StageMetrics | None = None,
+            events: EventBus | None = None,
+            entry_filter: EntryFilter | None = None,
+            name_map: dict[str, str] | None = None
+    ):
         self.kxr_file = kxr_file
         self.output_dir = output_dir
         self.logger = logger if logger is not None else NullLogger()
+        self.metrics = metrics
+        self.events = events if events is not None else EventBus([ProgressRenderer(), BatchedLogWriter(self.logger)])
 
-        self.header_summary: dict[str, int] = self.kxr_file.header_summary
-        self.progress_generator: Generator[float, None, None] = ((i + 1) / self.total_files for i in range(self.total_files))
+        self.entry_filter = entry_filter if entry_filter is not None and entry_filter.active else None
+
+        self.name_map = {archive_path: KxrNameMatcher.safe_relative_path(restored_path) for archive_path, restored_path in name_map.items()} if name_map else name_map
+
+        self.kxr_file.metrics = metrics
+
+        self.header_summary: dict[str, int] = (
+            self.entry_filter.summarize(self.entry_filter.select(self.kxr_file.root))
+            if self.entry_filter is not None else
+            self.kxr_file.header_summary
+        )
+
+        self._selection: dict[KxrHeaderEntry, list[KxrHeaderEntry]] | None = None
 
         self.start_time: float | None = None
+        self.files_unpacked: int = 0
         self.data_unpacked: int = 0
 
     async def unpack(self):
@@ -39,67 +66,71 @@ class KxrUnpacker:
 
             self.start_time = asyncio.get_running_loop().time()
 
+            if self.entry_filter is not None:
+                self._selection = self.entry_filter.select(self.kxr_file.root)
+
+            self._publish(EventType.BEGIN)
+
             await self._recursive_unpack(self.kxr_file.root, self.output_dir)
 
+            self._publish(EventType.END)
+
             formatted_elapsed_time = format_time(asyncio.get_running_loop().time() - self.start_time)
             self.logger.info(f"Time elapsed: {formatted_elapsed_time}")
 
+            if self.metrics is not None:
+                for line in self.metrics.generate_metrics_block().split("\n"):
+                    self.logger.info(line)
+
             for line in end_block_lines:
                 self.logger.info(line)
 
     async def _recursive_unpack(self, entries: KxrHeaderEntry, output_dir: KFile):
-        for child in entries.children.values():
+        children = entries.children.values() if self._selection is None else self._selection.get(entries, [])
+
+        for child in children:
             await self._process_entry(child, output_dir)
 
     async def _process_entry(self, entry: KxrHeaderEntry, output_dir: KFile):
         if not entry.is_dir:
             await self._unpack_file(entry, output_dir)
+
+            if self.events.active:
+                self._publish(EventType.FILE_PROCESSED, entry.path, entry.offset, entry.size, entry.zipped)
         else:
             subdir = KFile(os.path.join(output_dir.path, entry.name))
             subdir.makedirs()
 
             await self._recursive_unpack(entry, subdir)
 
-        self.logger.info(
-            f"Processed \"{entry.path}\": "
-            f"offset={entry.offset} "
-            f"size={entry.size} "
-            f"unzipped={entry.zipped}"
-        )
+            if self.events.active:
+                self._publish(EventType.DIR_PROCESSED, entry.path, entry.offset, entry.size, entry.zipped)
 
     async def _unpack_file(self, entry: KxrHeaderEntry, output_dir_: KFile):
-        self._update_progress(next(self.progress_generator))
-
         bbuf = await entry.get_content()
 
-        output_file = KFile(os.path.join(output_dir_.path, entry.name))
-
-        async with output_file.open("wb"):
-            await output_file.write(bbuf)
-
-        self.data_unpacked += bbuf.size
-
-    def _update_progress(self, current: float):
-        if current * self.total_files == 1:
-            print()
+        restored_path = self.name_map.get(entry.relative_path.replace("\\", "/")) if self.name_map else None
 
-        megabytes = self.data_unpacked / (1024 ** 2)
+        if restored_path is not None:
+            output_file = KFile(os.path.join(self.output_dir.path, *restored_path.split("/")))
+            KFile(os.path.dirname(output_file.path)).makedirs()
+        else:
+            output_file = KFile(os.path.join(output_dir_.path, entry.name))
 
-        formatted_elapsed_time = format_time(asyncio.get_running_loop().time() - self.start_time)
+        metrics = self.metrics
+        start = perf_counter() if metrics is not None else 0.0
 
-        bar = generate_progress_bar(current)
+        async with output_file.open("wb"):
+            await output_file.write(bbuf)
 
-        progress_string = (
-            f"\rUnpacking file: ({int(current * self.total_files)}/{self.total_files}) | "
-            f"Data unpacked: {megabytes:.2f}MB | "
-            f"Time elapsed: {formatted_elapsed_time} | "
-            f"{bar} {round(current * 100, 2)}%"
-        )
+        if metrics is not None:
+            metrics.record(Stage.OUTPUT_WRITE, start, bbuf.size, entry.type)
 
-        print(progress_string, end="", flush=True)
+        self.files_unpacked += 1
+        self.data_unpacked += bbuf.size
 
-        if current * self.total_files == self.total_files:
-            print()
+    def _publish(self, event_type: EventType, path: str | None = None, offset: int | None = None, size: int | None = None, zipped: bool | None = None):
+        self.events.publish(Event(event_type, "unpack", path, offset, size, zipped, self.files_unpacked, self.total_files, self.data_unpacked, perf_counter()))
 
     @property
     def total_files(self) -> int:
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from kxrlib.io import KxrFile, KxrBlob
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+HEADER_SIZE = 48
+CHUNK_BYTES = 8 * 1024 ** 2
+CHUNK_ENTRIES = 512
+
+
+class KxrVerifier:
+    """
+    [Hash sidecar format]
+     - JSON file next to the archive: "<archive>.hashes"
+     - algorithm:   "crc32" or "xxh64"
+     - passhash, datasize, headersize:  archive fields the hashes were taken from
+     - entries:     {relative path: hex digest of the stored (still encrypted/compressed) blob}
+    """
+
+    def __init__(self, kxr_file: KxrFile, max_workers: int | None = None, hashes_path: str | None = None):
+        self.kxr_file = kxr_file
+        self.max_workers = max_workers
+        self.hashes_path = hashes_path if hashes_path is not None else f"{kxr_file.path}.hashes"
+
+        self.algorithm = "xxh64" if xxhash is not None else "crc32"
+
+    async def verify(self, use_hashes: bool = True, write_hashes: bool = False) -> dict[str, int | bool | list]:
+        async with self.kxr_file.open("rb"):
+            blobs = self.kxr_file.blobs()
+            file_size = os.path.getsize(self.kxr_file.path)
+
+            layout_errors = self.check_layout(blobs, file_size)
+
+            expected = self.load_hashes() if use_hashes else None
+
+            results = await self._check_blobs(blobs, expected)
+
+        corrupt = [(path, error) for path, error, _ in results if error is not None]
+
+        if write_hashes and not corrupt and not layout_errors:
+            self.save_hashes({path: digest for path, _, digest in results})
+
+        return {
+            "entries": len(blobs),
+            "layout_errors": layout_errors,
+            "corrupt": corrupt,
+            "used_hashes": expected is not None
+        }
+
+    def check_layout(self, blobs: list[KxrBlob], file_size: int) -> list[str]:
+        errors = []
+        datasize = self.kxr_file.datasize
+
+        if datasize + self.kxr_file.headersize > file_size:
+            errors.append(f"Header region (datasize={datasize}, headersize={self.kxr_file.headersize}) exceeds file size {file_size}")
+
+        previous: KxrBlob | None = None
+
+        for blob in sorted(blobs, key=lambda item: (item.offset, item.size)):
+            if blob.size < 0:
+                errors.append(f"\"{blob.path}\": negative size {blob.size}")
+            elif blob.offset < HEADER_SIZE or blob.offset + blob.size > datasize:
+                errors.append(f"\"{blob.path}\": blob [{blob.offset}, {blob.offset + blob.size}) is outside the data region [{HEADER_SIZE}, {datasize})")
+
+            if previous is not None and blob.offset < previous.offset + previous.size:
+                errors.append(f"\"{blob.path}\": blob at {blob.offset} overlaps \"{previous.path}\" [{previous.offset}, {previous.offset + previous.size})")
+
+            if previous is None or blob.offset + blob.size > previous.offset + previous.size:
+                previous = blob
+
+        return errors
+
+    def load_hashes(self) -> dict[str, str] | None:
+        """The sidecar's digests, or None (full decode) when it is missing, unreadable, malformed or stale."""
+        if not os.path.isfile(self.hashes_path):
+            return None
+
+        try:
+            with open(self.hashes_path, "r", encoding="utf-8") as file:
+                sidecar = json.load(file)
+
+            if not isinstance(sidecar, dict) or (
+                sidecar.get("algorithm") != self.algorithm or
+                sidecar.get("passhash") != self.kxr_file.passhash or
+                sidecar.get("datasize") != self.kxr_file.datasize or
+                sidecar.get("headersize") != self.kxr_file.headersize
+            ):
+                return None
+
+            entries = sidecar["entries"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return entries if isinstance(entries, dict) else None
+
+    def save_hashes(self, digests: dict[str, str]):
+        sidecar = {
+            "algorithm": self.algorithm,
+            "passhash": self.kxr_file.passhash,
+            "datasize": self.kxr_file.datasize,
+            "headersize": self.kxr_file.headersize,
+            "entries": digests
+        }
+
+        with open(self.hashes_path, "w", encoding="utf-8") as file:
+            json.dump(sidecar, file, separators=(",", ":"))
+
+    async def _check_blobs(self, blobs: list[KxrBlob], expected: dict[str, str] | None) -> list[tuple[str, str | None, str | None]]:
+        loop = asyncio.get_running_loop()
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                loop.run_in_executor(
+                    executor,
+                    verify_blobs,
+                    self.kxr_file.path,
+                    self.kxr_file.passhash,
+                    chunk,
+                    self.algorithm,
+                    {blob.path: expected.get(blob.path) for blob in chunk} if expected is not None else None
+                )
+                for chunk in self._chunk(blobs)
+            ]
+
+            results = []
+
+            for chunk_results in await asyncio.gather(*futures):
+                results.extend(chunk_results)
+
+        return results
+
+    @staticmethod
+    def _chunk(blobs: list[KxrBlob]) -> list[list[KxrBlob]]:
+        chunks = []
+        chunk = []
+        chunk_bytes = 0
+
+        for blob in sorted(blobs, key=lambda item: item.offset):
+            chunk.append(blob)
+            chunk_bytes += max(blob.size, 0)
+
+            if chunk_bytes >= CHUNK_BYTES or len(chunk) >= CHUNK_ENTRIES:
+                chunks.append(chunk)
+                chunk = []
+                chunk_bytes = 0
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+
+def hash_bytes(data: bytes, algorithm: str) -> str:
+    if algorithm == "xxh64":
+        return xxhash.xxh64_hexdigest(data)
+    else:
+        return f"{zlib.crc32(data):08x}"
+
+
+def verify_blobs(kxr_path: str, passhash: int, blobs: list[KxrBlob], algorithm: str, expected: dict[str, str | None] | None) -> list[tuple[str, str | None, str | None]]:
+    results = []
+
+    with open(kxr_path, "rb") as file:
+        for blob in blobs:
+            error = None
+            digest = None
+
+            try:
+                data = blob.read(file)
+                digest = hash_bytes(data, algorithm)
+
+                if expected is None or expected.get(blob.path) is None:
+                    blob.decode(data, passhash)
+                elif expected[blob.path] != digest:
+                    error = f"Hash mismatch: expected {expected[blob.path]}, got {digest}"
+            except (OSError, EOFError, ValueError, zlib.error) as e:
+                error = f"{type(e).__name__}: {e}"
+
+            results.append((blob.path, error, digest))
+
+    return results
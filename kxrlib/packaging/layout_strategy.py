@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class LayoutStrategy(Enum):
+    FILESYSTEM = "filesystem"
+    DIRECTORY = "directory"
+    FILE_TYPE = "type"
+    TRACE = "trace"
+
+    def __str__(self) -> str:
+        return self.value
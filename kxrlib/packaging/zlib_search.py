@@ -0,0 +1,35 @@
+import zlib
+
+DEFAULT_LEVEL = 5
+
+# (level, wbits, memLevel, strategy); the first candidate is what ByteBuffer.compress produces
+CANDIDATES: list[tuple[int, int, int, int]] = [
+    (DEFAULT_LEVEL, zlib.MAX_WBITS, 8, zlib.Z_DEFAULT_STRATEGY),
+    (6, zlib.MAX_WBITS, 9, zlib.Z_DEFAULT_STRATEGY),
+    (9, zlib.MAX_WBITS, 8, zlib.Z_DEFAULT_STRATEGY),
+    (9, zlib.MAX_WBITS, 9, zlib.Z_DEFAULT_STRATEGY),
+    (9, zlib.MAX_WBITS, 9, zlib.Z_FILTERED),
+    (9, 14, 9, zlib.Z_DEFAULT_STRATEGY),
+    (9, zlib.MAX_WBITS, 9, zlib.Z_RLE),
+    (9, zlib.MAX_WBITS, 9, zlib.Z_HUFFMAN_ONLY)
+]
+
+
+def compress_with(data: bytes, level: int, wbits: int, mem_level: int, strategy: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, wbits, mem_level, strategy)
+
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_smallest(data: bytes) -> tuple[bytes, int]:
+    """Returns the smallest stream over all candidates that decompresses back to data, and the size of the default stream."""
+    default = compress_with(data, *CANDIDATES[0])
+    best = default
+
+    for candidate in CANDIDATES[1:]:
+        stream = compress_with(data, *candidate)
+
+        if len(stream) < len(best) and zlib.decompress(stream) == data:
+            best = stream
+
+    return best, len(default)
@@ -0,0 +1,9 @@
+from .subsystem import Subsystem
+from .stack_sampler import StackSampler
+from .kxr_profiler import KxrProfiler
+
+__all__ = [
+    "Subsystem",
+    "StackSampler",
+    "KxrProfiler"
+]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Iterator
+
+from kxrlib.console import generate_statistics_block
+from .stack_sampler import StackSampler
+from .subsystem import Subsystem
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+@dataclass(slots=True)
+class PhaseRecord:
+    name: str
+    elapsed: float
+    peak: int | None
+
+
+@dataclass(slots=True)
+class FunctionRecord:
+    subsystem: Subsystem
+    label: str
+    calls: int
+    own_time: float
+    cumulative_time: float
+
+
+class KxrProfiler:
+    """
+    [Profiler]
+     - profile:         cProfile of the calling thread while a phase is running
+     - sampler:         collapsed call stacks of the same thread, sampled every interval seconds
+     - trace_memory:    trace allocations with tracemalloc and report the peak of each phase
+                        (otherwise the process' resident high-water mark at the end of each phase)
+     - phases:          name, elapsed time and peak memory of every phase, in order
+    """
+
+    def __init__(self, trace_memory: bool = False, interval: float = 0.001):
+        self.trace_memory = trace_memory
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler(interval)
+        self.phases: list[PhaseRecord] = []
+
+        self._stats: pstats.Stats | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+            tracemalloc.reset_peak()
+
+        self._stats = None
+        self.sampler.start()
+        start = perf_counter()
+        self.profile.enable()
+
+        try:
+            yield
+        finally:
+            self.profile.disable()
+            elapsed = perf_counter() - start
+            self.sampler.stop()
+
+            self.phases.append(PhaseRecord(name, elapsed, self._peak_memory()))
+
+    def close(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _peak_memory(self) -> int | None:
+        if self.trace_memory:
+            return tracemalloc.get_traced_memory()[1]
+
+        if resource is not None:
+            # ru_maxrss is in kilobytes on Linux
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+        return None
+
+    @property
+    def stats(self) -> pstats.Stats:
+        if self._stats is None:
+            self._stats = pstats.Stats(self.profile)
+
+        return self._stats
+
+    def functions(self) -> list[FunctionRecord]:
+        """
+        Every profiled function with its own time. Functions outside kxrlib that belong to no subsystem
+        by name (int.from_bytes, struct.unpack, enum lookups, ...) are attributed to their busiest caller's.
+        """
+        raw_stats = self.stats.stats
+        records = []
+
+        for (filename, lineno, function), (_, calls, own_time, cumulative_time, callers) in raw_stats.items():
+            subsystem = Subsystem.classify(filename, function)
+
+            if subsystem is Subsystem.OTHER and callers:
+                caller_filename, _, caller_function = max(callers.items(), key=lambda item: item[1][2])[0]
+                subsystem = Subsystem.classify(caller_filename, caller_function)
+
+            label = function if filename == "~" else f"{function} ({os.path.basename(filename)}:{lineno})"
+
+            records.append(FunctionRecord(subsystem, label, calls, own_time, cumulative_time))
+
+        records.sort(key=lambda record: record.own_time, reverse=True)
+
+        return records
+
+    def subsystem_times(self) -> dict[Subsystem, float]:
+        times = dict.fromkeys(Subsystem, 0.0)
+
+        for record in self.functions():
+            times[record.subsystem] += record.own_time
+
+        return times
+
+    def save_stats(self, path: str):
+        self.profile.dump_stats(path)
+
+    def save_collapsed(self, path: str):
+        self.sampler.save(path)
+
+    def generate_profile_block(self, top: int = 15) -> str:
+        subsystem_times = self.subsystem_times()
+        total_time = sum(subsystem_times.values()) or 1.0
+
+        subsystem_items = sorted(subsystem_times.items(), key=lambda item: item[1], reverse=True)
+        subsystem_block = generate_statistics_block(
+            "SUBSYSTEMS",
+            [str(subsystem) for subsystem, _ in subsystem_items],
+            [f"{seconds:.3f}s | {seconds / total_time * 100:.1f}%" for _, seconds in subsystem_items]
+        )
+
+        functions = self.functions()[:top]
+        function_block = generate_statistics_block(
+            f"TOP {len(functions)} FUNCTIONS (OWN TIME)",
+            [f"[{record.subsystem}] {self._shorten(record.label)}" for record in functions],
+            [f"{record.own_time:.3f}s | {record.calls} calls" for record in functions]
+        ) if functions else ""
+
+        phase_block = generate_statistics_block(
+            "PHASES" + (" (TRACEMALLOC PEAK)" if self.trace_memory else " (PEAK RSS)"),
+            [phase.name for phase in self.phases],
+            [f"{phase.elapsed:.3f}s | " + (f"{phase.peak / 1024 ** 2:.2f}MB" if phase.peak is not None else "n/a") for phase in self.phases]
+        ) if self.phases else ""
+
+        return "\n".join(block for block in (subsystem_block, function_block, phase_block) if block)
+
+    @staticmethod
+    def _shorten(label: str, width: int = 80) -> str:
+        return label if len(label) <= width else "..." + label[-(width - 3):]
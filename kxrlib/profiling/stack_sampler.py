@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+
+
+class StackSampler:
+    """
+    Samples the call stack of one thread from a background thread via sys._current_frames().
+
+    [Collapsed stacks]
+     - one line per distinct stack: "outermost;...;innermost count", frames as "function (file:line)"
+     - the format read by flamegraph.pl, speedscope and inferno
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: int | None = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self.stacks: Counter[str] = Counter()
+
+        self._frame_names: dict[tuple, str] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError("Stack sampler is already running")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="kxrlib-stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> StackSampler:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+
+            if frame is not None:
+                self.stacks[self._collapse(frame)] += 1
+
+    def _collapse(self, frame: FrameType | None) -> str:
+        names = []
+
+        while frame is not None:
+            code = frame.f_code
+            key = (code, frame.f_lineno)
+            name = self._frame_names.get(key)
+
+            if name is None:
+                name = self._frame_names[key] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})".replace(";", ":")
+
+            names.append(name)
+            frame = frame.f_back
+
+        return ";".join(reversed(names))
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+    @property
+    def num_samples(self) -> int:
+        return sum(self.stacks.values())
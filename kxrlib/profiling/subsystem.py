@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+from enum import Enum
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (kxrlib module relative to the package, function names or None for the whole module)
+HEADER_PARSE_FUNCTIONS = (
+    ("io/kxr_header_entry.py", {"recursive_read_entries", "read_records", "read_lazy", "_materialize", "records", "encode"}),
+    ("io/kxr_file.py", {"_read_header", "save"}),
+    ("io/kxr_header_scanner.py", None),
+    ("io/kxr_index_cache.py", None)
+)
+FILE_IO_MODULES = ("io/kfile.py", "io/kxr_read_pool.py", "io/kxr_append_writer.py", "io/resource/kresource_file.py", "io/resource/karchive_file.py")
+READER_WRITER_MODULES = ("io/byte_buffer/reader.py", "io/byte_buffer/writer.py", "io/byte_buffer/data_format.py", "io/byte_buffer/arrays.py", "io/byte_buffer/packed.py")
+FILE_IO_BUILTINS = ("_io.", "io.open", "posix.", "nt.")
+FILE_IO_STDLIB = ("tarfile.py", "zipfile.py", "shutil.py")
+
+
+class Subsystem(Enum):
+    CRYPT = "ByteBuffer crypt"
+    READER_WRITER = "Reader/Writer"
+    HEADER_PARSE = "Header parse"
+    ZLIB = "zlib"
+    FILE_IO = "File I/O"
+    KXRLIB = "Other kxrlib"
+    OTHER = "Other"
+
+    def __str__(self) -> str:
+        return self.value
+
+    @classmethod
+    def classify(cls, filename: str, function: str) -> Subsystem:
+        """Maps a cProfile (filename, function) pair to the subsystem it belongs to."""
+        if filename == "~":
+            if "zlib" in function:
+                return cls.ZLIB
+            if any(name in function for name in FILE_IO_BUILTINS):
+                return cls.FILE_IO
+
+            return cls.OTHER
+
+        filename = os.path.abspath(filename)
+
+        if not filename.startswith(PACKAGE_DIR + os.sep):
+            return cls.FILE_IO if os.path.basename(filename) in FILE_IO_STDLIB else cls.OTHER
+
+        module = os.path.relpath(filename, PACKAGE_DIR).replace(os.sep, "/")
+
+        if module == "io/byte_buffer/crypt.py" or (module == "io/byte_buffer/byte_buffer.py" and function == "crypt"):
+            return cls.CRYPT
+        if module == "io/byte_buffer/byte_buffer.py" and function in ("compress", "decompress"):
+            return cls.ZLIB
+        if module in READER_WRITER_MODULES or module == "io/byte_buffer/byte_buffer.py":
+            return cls.READER_WRITER
+        if module == "packaging/zlib_search.py":
+            return cls.ZLIB
+
+        for header_module, functions in HEADER_PARSE_FUNCTIONS:
+            if module == header_module and (functions is None or function in functions):
+                return cls.HEADER_PARSE
+
+        if module in FILE_IO_MODULES:
+            return cls.FILE_IO
+
+        return cls.KXRLIB
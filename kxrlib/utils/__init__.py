@@ -1,7 +1,27 @@
 from .pack_kxr import pack_kxr
 from .unpack_kxr import unpack_kxr
+from .pack_all_kxr import pack_all_kxr
+from .unpack_all_kxr import unpack_all_kxr
+from .seek_distance_kxr import seek_distance_kxr
+from .verify_kxr import verify_kxr
+from .diff_kxr import diff_kxr
+from .match_names_kxr import match_names_kxr
+from .sniff_kxr import sniff_kxr
+from .unpack_tar_kxr import unpack_tar_kxr
+from .ls_kxr import ls_kxr
+from .profile_kxr import profile_kxr
 
 __all__ = [
     "pack_kxr",
-    "unpack_kxr"
+    "unpack_kxr",
+    "pack_all_kxr",
+    "unpack_all_kxr",
+    "seek_distance_kxr",
+    "verify_kxr",
+    "diff_kxr",
+    "match_names_kxr",
+    "sniff_kxr",
+    "unpack_tar_kxr",
+    "ls_kxr",
+    "profile_kxr"
 ]
@@ -0,0 +1,75 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from kxrlib.console import generate_statistics_block, format_time
+
+# async (source path, output path) -> summary block; must be a module-level function so it can be pickled
+BatchOperation = Callable[[str, str], Awaitable[str]]
+
+
+def run_batch(
+        title: str,
+        operation: BatchOperation,
+        jobs_list: list[tuple[str, str, str]],
+        skipped: list[tuple[str, str]] | None = None,
+        jobs: int | None = None
+) -> bool:
+    """
+    Runs operation once per (name, source path, output path) in worker processes, printing progress as
+    archives finish and a summary at the end. skipped holds (name, reason) pairs that are reported but not run.
+    Returns True if no archive failed.
+    """
+    skipped = skipped or []
+
+    for name, reason in skipped:
+        print(f"Skipping {name}: {reason}")
+
+    results = []
+    start = perf_counter()
+
+    if jobs_list:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_run_one, operation, name, src_path, output_path) for name, src_path, output_path in jobs_list]
+
+            for i, future in enumerate(as_completed(futures)):
+                result = future.result()
+                results.append(result)
+
+                status = "OK" if result["error"] is None else f"FAILED ({result['error']})"
+                print(f"[{i + 1}/{len(futures)}] {result['name']}: {status} in {format_time(result['elapsed'])}")
+
+    wall_time = perf_counter() - start
+
+    results.sort(key=lambda item: item["name"])
+
+    for result in results:
+        if result["summary_block"]:
+            print(result["summary_block"])
+
+    print(generate_statistics_block(
+        title,
+        [result["name"] for result in results] + [name for name, _ in skipped] + ["Wall time"],
+        [
+            *[f"{format_time(result['elapsed'])} {'OK' if result['error'] is None else 'FAILED'}" for result in results],
+            *["SKIPPED" for _ in skipped],
+            format_time(wall_time)
+        ]
+    ))
+
+    return all(result["error"] is None for result in results)
+
+
+def _run_one(operation: BatchOperation, name: str, src_path: str, output_path: str) -> dict[str, str | float | None]:
+    start = perf_counter()
+    result = {"name": name, "summary_block": "", "error": None}
+
+    try:
+        result["summary_block"] = asyncio.run(operation(src_path, output_path))
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["elapsed"] = perf_counter() - start
+
+    return result
@@ -0,0 +1,34 @@
+import os
+import sys
+import json
+import asyncio
+
+from kxrlib.io import KxrFile
+from kxrlib.packaging import KxrDiffer
+
+
+def diff_kxr(old_kxr_path: str, new_kxr_path: str, output_path: str | None = None, jobs: int | None = None, size_only: bool = False) -> dict:
+    if not isinstance(old_kxr_path, str):
+        raise TypeError(f"Argument 'old_kxr_path' must be {str}, not {type(old_kxr_path)}")
+    if not isinstance(new_kxr_path, str):
+        raise TypeError(f"Argument 'new_kxr_path' must be {str}, not {type(new_kxr_path)}")
+    if not isinstance(output_path, str) and output_path is not None:
+        raise TypeError(f"Argument 'output_path' must be {str}, not {type(output_path)}")
+
+    old_kxr_path = os.path.abspath(old_kxr_path)
+    new_kxr_path = os.path.abspath(new_kxr_path)
+
+    for kxr_path in (old_kxr_path, new_kxr_path):
+        if not os.path.isfile(kxr_path):
+            raise FileNotFoundError(f"File not found: '{kxr_path}'")
+
+    report = asyncio.run(KxrDiffer(KxrFile(old_kxr_path), KxrFile(new_kxr_path), max_workers=jobs, size_only=size_only).diff())
+
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    return report
@@ -0,0 +1,51 @@
+import os
+import sys
+import csv
+import json
+
+from kxrlib.io import iter_manifest
+from kxrlib.io.kxr_manifest import MANIFEST_FIELDS
+
+FORMATS = ("jsonl", "csv")
+
+
+def ls_kxr(kxr_paths: list[str], output_format: str = "jsonl", output_path: str | None = None) -> int:
+    """Streams one manifest row per file entry of every archive; returns the number of rows written."""
+    if not isinstance(kxr_paths, list):
+        raise TypeError(f"Argument 'kxr_paths' must be {list}, not {type(kxr_paths)}")
+    if output_format not in FORMATS:
+        raise ValueError(f"Argument 'output_format' must be one of {FORMATS}, not '{output_format}'")
+
+    kxr_paths = [os.path.abspath(kxr_path) for kxr_path in kxr_paths]
+
+    for kxr_path in kxr_paths:
+        if not os.path.isfile(kxr_path):
+            raise FileNotFoundError(f"File not found: '{kxr_path}'")
+
+    file = open(output_path, "w", encoding="utf-8", newline="") if output_path else sys.stdout
+    fields = ("archive", *MANIFEST_FIELDS)
+    num_rows = 0
+
+    try:
+        if output_format == "csv":
+            writer = csv.writer(file)
+            writer.writerow(fields)
+            write_row = writer.writerow
+        else:
+            def write_row(row):
+                file.write(json.dumps(dict(zip(fields, row)), separators=(",", ":")))
+                file.write("\n")
+
+        for kxr_path in kxr_paths:
+            archive = os.path.basename(kxr_path)
+
+            for row in iter_manifest(kxr_path):
+                write_row((archive, *row))
+                num_rows += 1
+    finally:
+        if output_path:
+            file.close()
+        else:
+            file.flush()
+
+    return num_rows
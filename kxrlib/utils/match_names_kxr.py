@@ -0,0 +1,81 @@
+import os
+import asyncio
+
+from kxrlib.console import generate_statistics_block, format_time
+from kxrlib.io import KxrFile
+from kxrlib.matching import FingerprintIndex
+from kxrlib.packaging import KxrNameMatcher
+
+
+def match_names_kxr(
+        kxr_path: str,
+        reference_path: str,
+        output_path: str | None = None,
+        jobs: int | None = None,
+        max_distance: int = 6,
+        index_path: str | None = None
+) -> dict[str, str]:
+    if not isinstance(kxr_path, str):
+        raise TypeError(f"Argument 'kxr_path' must be {str}, not {type(kxr_path)}")
+    if not isinstance(reference_path, str):
+        raise TypeError(f"Argument 'reference_path' must be {str}, not {type(reference_path)}")
+
+    kxr_path = os.path.abspath(kxr_path)
+    reference_path = os.path.abspath(reference_path)
+
+    if not os.path.isfile(kxr_path):
+        raise FileNotFoundError(f"File not found: '{kxr_path}'")
+    if not os.path.exists(reference_path):
+        raise FileNotFoundError(f"Reference not found: '{reference_path}'")
+
+    if not output_path:
+        output_path = f"{os.path.splitext(kxr_path)[0]}.names.json"
+
+    return asyncio.run(_match_names_kxr(kxr_path, reference_path, os.path.abspath(output_path), jobs, max_distance, index_path))
+
+
+async def _match_names_kxr(kxr_path: str, reference_path: str, output_path: str, jobs: int | None, max_distance: int, index_path: str | None) -> dict[str, str]:
+    start_time = asyncio.get_running_loop().time()
+
+    if os.path.isdir(reference_path):
+        index = await FingerprintIndex.from_dir(reference_path, max_distance=max_distance, max_workers=jobs)
+
+        if index_path:
+            index.save(index_path)
+    else:
+        index = FingerprintIndex.load(reference_path, max_distance=max_distance)
+
+    index_time = asyncio.get_running_loop().time()
+
+    kxr_file = KxrFile(kxr_path)
+    report = await KxrNameMatcher(kxr_file, index, max_workers=jobs).match()
+
+    KxrNameMatcher.save_name_map(report["name_map"], output_path)
+
+    end_time = asyncio.get_running_loop().time()
+
+    desc_strings = [
+        "Kxr file",
+        "Reference files",
+        "Exact matches",
+        "Similar matches",
+        "Unmatched",
+        "Index time",
+        "Match time",
+        "Name map"
+    ]
+
+    value_strings = [
+        kxr_file.name,
+        str(len(index)),
+        str(report["exact"]),
+        str(report["similar"]),
+        str(len(report["unmatched"])),
+        format_time(index_time - start_time),
+        format_time(end_time - index_time),
+        output_path
+    ]
+
+    print(generate_statistics_block("MATCH SUMMARY", desc_strings, value_strings))
+
+    return report["name_map"]
@@ -0,0 +1,68 @@
+import os
+import re
+import tempfile
+
+from kxrlib.logger import logger_setup
+from kxrlib.io import KxrFile, KResourceDir
+from kxrlib.io.kxr_file import KXR_NAME
+from kxrlib.events import EventBus, BatchedLogWriter
+from kxrlib.packaging import KxrPacker
+from .batch_runner import run_batch
+
+
+def pack_all_kxr(src_root: str, output_dir: str | None = None, jobs: int | None = None) -> bool:
+    """Packs every subdirectory of src_root into <output_dir>/<name>.kxr; output_dir defaults to '<src_root>_kxr' next to it."""
+    if not isinstance(src_root, str):
+        raise TypeError(f"Argument 'src_root' must be {str}, not {type(src_root)}")
+    if not isinstance(output_dir, str) and output_dir is not None:
+        raise TypeError(f"Argument 'output_dir' must be {str}, not {type(output_dir)}")
+
+    src_root = os.path.abspath(src_root)
+
+    if not os.path.isdir(src_root):
+        raise NotADirectoryError(f"Source root must be a directory: '{src_root}'")
+
+    output_dir = os.path.abspath(output_dir) if output_dir else f"{src_root}_kxr"
+
+    jobs_list = []
+    skipped = []
+
+    for dir_entry in sorted(os.scandir(src_root), key=lambda item: item.name):
+        if not dir_entry.is_dir():
+            continue
+
+        kxr_name = f"{dir_entry.name}.kxr"
+
+        if re.search(KXR_NAME, kxr_name):
+            jobs_list.append((kxr_name, dir_entry.path, os.path.join(output_dir, kxr_name)))
+        else:
+            skipped.append((dir_entry.name, f"'{kxr_name}' is not a valid KXR filename"))
+
+    if not jobs_list and not skipped:
+        print(f"No source directories found in: '{src_root}'")
+        return True
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    return run_batch("BATCH PACK SUMMARY", _pack_one, jobs_list, skipped, jobs)
+
+
+async def _pack_one(src_path: str, output_path: str) -> str:
+    name = os.path.basename(output_path)
+
+    # One log file per archive: workers appending to one shared file would interleave their lines
+    logger = logger_setup(f"{__name__}.pack_all_{os.path.splitext(name)[0]}")
+
+    # Packed next to the output and moved over it on success, so a failed pack keeps the previous archive
+    with tempfile.TemporaryDirectory(prefix=".pack_all_", dir=os.path.dirname(output_path)) as temp_dir:
+        kxr_file = KxrFile(os.path.join(temp_dir, name))
+
+        resource_dir = KResourceDir.from_dir_recursion(src_path)
+
+        kxr_packer = KxrPacker(kxr_file, resource_dir, logger=logger, events=EventBus([BatchedLogWriter(logger)]))
+
+        await kxr_packer.pack()
+
+        os.replace(kxr_file.path, output_path)
+
+    return resource_dir.generate_resource_summary_block(kxr_packer.resource_summary)
@@ -1,17 +1,32 @@
 import os
 import re
 import asyncio
+import tarfile
+import zipfile
 
 from kxrlib.logger import logger_setup
 from kxrlib.console import get_yes_no_input
-from kxrlib.io import KxrFile, KFile, KResourceDir
+from kxrlib.io import KxrFile, KFile, KResourceDir, AccessTrace
 from kxrlib.io.kxr_file import KXR_NAME
-from kxrlib.packaging import KxrPacker
-
-logger = logger_setup(__name__)
-
-
-def pack_kxr(src_path: str, output_path: str | None = None):
+from kxrlib.metrics import StageMetrics
+from kxrlib.events import EventBus, ProgressRenderer, BatchedLogWriter, JsonLinesSink
+from kxrlib.packaging import KxrPacker, LayoutStrategy
+
+
+def pack_kxr(
+        src_path: str,
+        output_path: str | None = None,
+        metrics: bool = False,
+        progress: bool = True,
+        log: bool = True,
+        events_path: str | None = None,
+        layout: str = "filesystem",
+        trace_path: str | None = None,
+        confirm: bool = True,
+        preallocate: bool = False,
+        optimize_size: bool = False,
+        jobs: int | None = None
+):
     if not isinstance(src_path, str):
         raise TypeError(f"Argument 'kxr_file' must be {str}, not {type(src_path)}")
     if not isinstance(output_path, str) and output_path is not None:
@@ -21,8 +36,8 @@ def pack_kxr(src_path: str, output_path: str | None = None):
 
     if not os.path.exists(src_path):
         raise FileNotFoundError(f"Directory not found: '{src_path}'")
-    if not os.path.isdir(src_path):
-        raise NotADirectoryError(f"Source directory must be a directory: '{src_path}'")
+    if not os.path.isdir(src_path) and not (tarfile.is_tarfile(src_path) or zipfile.is_zipfile(src_path)):
+        raise NotADirectoryError(f"Source must be a directory or a tar/zip archive: '{src_path}'")
 
     if output_path:
         output_path = os.path.abspath(output_path)
@@ -32,29 +47,79 @@ def pack_kxr(src_path: str, output_path: str | None = None):
         if not re.search(KXR_NAME, os.path.basename(output_path)):
             raise ValueError(f"Output file is not a valid KXR filename: '{os.path.basename(output_path)}'")
 
-    asyncio.run(_pack_kxr(src_path, output_path))
+    layout = LayoutStrategy(layout)
+
+    if trace_path:
+        trace_path = os.path.abspath(trace_path)
+
+        if not os.path.isfile(trace_path):
+            raise FileNotFoundError(f"Trace file not found: '{trace_path}'")
+    elif layout is LayoutStrategy.TRACE:
+        raise ValueError(f"A trace file is required for layout strategy '{layout}'")
+
+    asyncio.run(_pack_kxr(src_path, output_path, metrics, progress, log, events_path, layout, trace_path, confirm, preallocate, optimize_size, jobs))
+
 
+async def _pack_kxr(
+        src_path: str,
+        output_path: str | None = None,
+        metrics: bool = False,
+        progress: bool = True,
+        log: bool = True,
+        events_path: str | None = None,
+        layout: LayoutStrategy = LayoutStrategy.FILESYSTEM,
+        trace_path: str | None = None,
+        confirm: bool = True,
+        preallocate: bool = False,
+        optimize_size: bool = False,
+        jobs: int | None = None
+):
+    logger = logger_setup(__name__)
 
-async def _pack_kxr(src_path: str, output_path: str | None = None):
     src_dir = KFile(src_path)
 
+    resource_dir = KResourceDir.from_dir_recursion(src_dir) if src_dir.is_dir else KResourceDir.from_archive(src_dir)
+
     if not output_path:
-        output_path = os.path.join(src_dir.dirname, src_dir.name + ".kxr")
+        output_path = os.path.join(src_dir.dirname, resource_dir.name + ".kxr")
 
     kxr_file = KxrFile(output_path)
 
-    resource_dir = KResourceDir.from_dir_recursion(src_dir)
+    stage_metrics = StageMetrics() if metrics else None
+
+    event_bus = EventBus()
+
+    if progress:
+        event_bus.subscribe(ProgressRenderer())
+    if log:
+        event_bus.subscribe(BatchedLogWriter(logger))
+
+    trace = AccessTrace.load(trace_path) if trace_path else None
 
-    kxr_packer = KxrPacker(kxr_file, resource_dir, logger=logger)
+    kxr_packer = KxrPacker(kxr_file, resource_dir, logger=logger, metrics=stage_metrics, events=event_bus, layout=layout, trace=trace, preallocate=preallocate, optimize_size=optimize_size, max_workers=jobs)
 
     print(resource_dir.generate_resource_summary_block())
 
-    if not get_yes_no_input(f"Packing to: '{kxr_file.path}'\nProceed?{' (Overwrite existing file)' if kxr_file.exists else ''}", "y"):
+    if confirm and not get_yes_no_input(f"Packing to: '{kxr_file.path}'\nProceed?{' (Overwrite existing file)' if kxr_file.exists else ''}", "y"):
+        resource_dir.close()
         return
 
     if kxr_file.exists:
         await kxr_file.delete()
 
-    await kxr_packer.pack()
+    if events_path:
+        event_bus.subscribe(JsonLinesSink(events_path))
+
+    try:
+        await kxr_packer.pack()
+    finally:
+        event_bus.close()
+        resource_dir.close()
+
+    if stage_metrics is not None:
+        print(stage_metrics.generate_metrics_block())
+
+    if optimize_size:
+        print(f"\nBytes saved vs. default compression: {kxr_packer.bytes_saved} ({kxr_packer.bytes_saved / 1024 ** 2:.2f}MB)")
 
     print("\nDone!")
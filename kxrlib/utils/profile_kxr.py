@@ -0,0 +1,121 @@
+import os
+import re
+import asyncio
+import tarfile
+import tempfile
+import zipfile
+
+from kxrlib.console import get_yes_no_input
+from kxrlib.io import KxrFile, KFile, KResourceDir
+from kxrlib.io.kxr_file import KXR_NAME
+from kxrlib.events import EventBus
+from kxrlib.packaging import KxrPacker, KxrUnpacker
+from kxrlib.profiling import KxrProfiler
+
+OPERATIONS = ("pack", "unpack")
+
+
+def profile_kxr(
+        operation: str,
+        src_path: str,
+        output_path: str | None = None,
+        stats_prefix: str | None = None,
+        trace_memory: bool = False,
+        top: int = 15,
+        interval: float = 0.001,
+        confirm: bool = True
+) -> KxrProfiler | None:
+    """
+    Runs a pack or unpack under cProfile and a stack sampler, then prints hot functions by subsystem
+    and peak memory by phase, and writes <stats_prefix>.pstats and <stats_prefix>.collapsed.
+    Without output_path the result goes to a temporary directory that is removed afterwards;
+    an existing output_path is only overwritten after confirmation (or with confirm=False).
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"Argument 'operation' must be one of {OPERATIONS}, not '{operation}'")
+    if not isinstance(src_path, str):
+        raise TypeError(f"Argument 'src_path' must be {str}, not {type(src_path)}")
+
+    src_path = os.path.abspath(src_path)
+
+    if not os.path.exists(src_path):
+        raise FileNotFoundError(f"Source not found: '{src_path}'")
+    if operation == "unpack" and not os.path.isfile(src_path):
+        raise IsADirectoryError(f"Kxr file must not be a directory: '{src_path}'")
+    if operation == "pack" and not os.path.isdir(src_path) and not (tarfile.is_tarfile(src_path) or zipfile.is_zipfile(src_path)):
+        raise NotADirectoryError(f"Source must be a directory or a tar/zip archive: '{src_path}'")
+
+    if output_path:
+        output_path = os.path.abspath(output_path)
+
+        if operation == "pack":
+            if os.path.isdir(output_path):
+                raise IsADirectoryError(f"Output path must not be a directory: '{output_path}'")
+            if not re.search(KXR_NAME, os.path.basename(output_path)):
+                raise ValueError(f"Output file is not a valid KXR filename: '{os.path.basename(output_path)}'")
+
+        if os.path.exists(output_path) and confirm and not get_yes_no_input(f"Profiling to: '{output_path}'\nProceed? (Overwrite existing {'file' if operation == 'pack' else 'directory contents'})", "n"):
+            return None
+
+    name = os.path.splitext(os.path.basename(src_path))[0]
+
+    if not stats_prefix:
+        os.makedirs("profiles", exist_ok=True)
+        stats_prefix = os.path.join("profiles", f"{name}.{operation}")
+
+    profiler = KxrProfiler(trace_memory=trace_memory, interval=interval)
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            if operation == "pack":
+                asyncio.run(_profile_pack(src_path, output_path, temp_dir, profiler))
+            else:
+                asyncio.run(_profile_unpack(src_path, output_path or os.path.join(temp_dir, name), profiler))
+    finally:
+        # Keep what was collected when the operation itself fails
+        profiler.close()
+        profiler.save_stats(f"{stats_prefix}.pstats")
+        profiler.save_collapsed(f"{stats_prefix}.collapsed")
+
+    print(profiler.generate_profile_block(top))
+
+    print(f"\nStats: '{os.path.abspath(stats_prefix)}.pstats' (python -m pstats)")
+    print(f"Collapsed stacks: '{os.path.abspath(stats_prefix)}.collapsed' ({profiler.sampler.num_samples} samples, flamegraph.pl/speedscope)")
+
+    return profiler
+
+
+def _kxr_filename(name: str) -> str:
+    """A filename matching KXR_NAME for an arbitrary resource name, e.g. 'my-src.v2' -> 'my_src_v2.kxr'."""
+    return (re.sub(r"[^a-zA-Z0-9_]", "_", name) or "profile") + ".kxr"
+
+
+async def _profile_pack(src_path: str, output_path: str | None, temp_dir: str, profiler: KxrProfiler):
+    src_dir = KFile(src_path)
+
+    with profiler.phase("source scan"):
+        resource_dir = KResourceDir.from_dir_recursion(src_dir) if src_dir.is_dir else KResourceDir.from_archive(src_dir)
+
+    kxr_file = KxrFile(output_path or os.path.join(temp_dir, _kxr_filename(resource_dir.name)))
+
+    try:
+        if kxr_file.exists:
+            await kxr_file.delete()
+
+        with profiler.phase("pack"):
+            await KxrPacker(kxr_file, resource_dir, events=EventBus()).pack()
+    finally:
+        resource_dir.close()
+
+
+async def _profile_unpack(kxr_path: str, output_path: str, profiler: KxrProfiler):
+    kxr_file = KxrFile(kxr_path)
+
+    with profiler.phase("header"):
+        async with kxr_file.open():
+            pass
+
+    kxr_unpacker = KxrUnpacker(kxr_file, KFile(output_path), events=EventBus())
+
+    with profiler.phase("unpack"):
+        await kxr_unpacker.unpack()
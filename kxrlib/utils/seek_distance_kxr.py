@@ -0,0 +1,52 @@
+import os
+import asyncio
+
+from kxrlib.console import generate_statistics_block
+from kxrlib.io import KxrFile, AccessTrace
+
+
+def seek_distance_kxr(trace_path: str, kxr_path: str) -> dict[str, int]:
+    if not isinstance(trace_path, str):
+        raise TypeError(f"Argument 'trace_path' must be {str}, not {type(trace_path)}")
+    if not isinstance(kxr_path, str):
+        raise TypeError(f"Argument 'kxr_path' must be {str}, not {type(kxr_path)}")
+
+    trace_path = os.path.abspath(trace_path)
+    kxr_path = os.path.abspath(kxr_path)
+
+    if not os.path.isfile(trace_path):
+        raise FileNotFoundError(f"File not found: '{trace_path}'")
+    if not os.path.isfile(kxr_path):
+        raise FileNotFoundError(f"File not found: '{kxr_path}'")
+
+    return asyncio.run(_seek_distance_kxr(trace_path, kxr_path))
+
+
+async def _seek_distance_kxr(trace_path: str, kxr_path: str) -> dict[str, int]:
+    trace = AccessTrace.load(trace_path)
+    kxr_file = KxrFile(kxr_path)
+
+    async with kxr_file.open():
+        stats = trace.seek_distance(kxr_file)
+
+    desc_strings = [
+        "Kxr file",
+        "Trace",
+        "Reads",
+        "Seeks",
+        "Seek distance",
+        "Missing entries"
+    ]
+
+    value_strings = [
+        kxr_file.name,
+        os.path.basename(trace_path),
+        str(stats["reads"]),
+        str(stats["seeks"]),
+        f"{stats['seek_distance'] / (1024 ** 2):.2f}MB",
+        str(stats["missing"])
+    ]
+
+    print(generate_statistics_block("SEEK DISTANCE", desc_strings, value_strings))
+
+    return stats
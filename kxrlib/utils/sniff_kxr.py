@@ -0,0 +1,65 @@
+import os
+import json
+import asyncio
+from collections import Counter
+
+from kxrlib.console import generate_statistics_block, format_time
+from kxrlib.io import KxrFile, FileType
+from kxrlib.packaging import KxrSniffer
+
+
+def sniff_kxr(kxr_path: str, output_path: str | None = None, jobs: int | None = None) -> dict[str, FileType]:
+    if not isinstance(kxr_path, str):
+        raise TypeError(f"Argument 'kxr_path' must be {str}, not {type(kxr_path)}")
+    if not isinstance(output_path, str) and output_path is not None:
+        raise TypeError(f"Argument 'output_path' must be {str}, not {type(output_path)}")
+
+    kxr_path = os.path.abspath(kxr_path)
+
+    if not os.path.exists(kxr_path):
+        raise FileNotFoundError(f"File not found: '{kxr_path}'")
+    if not os.path.isfile(kxr_path):
+        raise IsADirectoryError(f"Kxr file must not be a directory: '{kxr_path}'")
+
+    return asyncio.run(_sniff_kxr(kxr_path, output_path, jobs))
+
+
+async def _sniff_kxr(kxr_path: str, output_path: str | None, jobs: int | None) -> dict[str, FileType]:
+    kxr_file = KxrFile(kxr_path)
+
+    start_time = asyncio.get_running_loop().time()
+
+    kxr_sniffer = KxrSniffer(kxr_file, max_workers=jobs)
+    types = await kxr_sniffer.sniff()
+
+    elapsed_time = asyncio.get_running_loop().time() - start_time
+
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as file:
+            json.dump({path: file_type.value or "unknown" for path, file_type in types.items()}, file, indent=2)
+
+    counts = Counter(types.values()).most_common()
+    mismatched = sum(
+        1 for path, file_type in types.items()
+        if file_type is not FileType.UNKNOWN and FileType.from_extension(os.path.splitext(path)[1].lstrip(".")) is not file_type
+    )
+
+    desc_strings = [
+        "Kxr file",
+        *[f"{file_type.value.upper() or 'Unknown'} files" for file_type, _ in counts],
+        "Extension mismatches",
+        "Decode errors",
+        "Time elapsed"
+    ]
+
+    value_strings = [
+        kxr_file.name,
+        *[str(count) for _, count in counts],
+        str(mismatched),
+        str(len(kxr_sniffer.errors)),
+        format_time(elapsed_time)
+    ]
+
+    print(generate_statistics_block("SNIFF SUMMARY", desc_strings, value_strings))
+
+    return types
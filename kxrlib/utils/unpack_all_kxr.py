@@ -0,0 +1,49 @@
+import os
+
+from kxrlib.logger import logger_setup
+from kxrlib.io import KxrFile, KFile
+from kxrlib.events import EventBus, BatchedLogWriter
+from kxrlib.packaging import KxrUnpacker
+from .batch_runner import run_batch
+
+
+def unpack_all_kxr(src_dir: str, output_dir: str | None = None, jobs: int | None = None) -> bool:
+    if not isinstance(src_dir, str):
+        raise TypeError(f"Argument 'src_dir' must be {str}, not {type(src_dir)}")
+    if not isinstance(output_dir, str) and output_dir is not None:
+        raise TypeError(f"Argument 'output_dir' must be {str}, not {type(output_dir)}")
+
+    src_dir = os.path.abspath(src_dir)
+
+    if not os.path.isdir(src_dir):
+        raise NotADirectoryError(f"Source must be a directory of Kxr files: '{src_dir}'")
+
+    output_dir = os.path.abspath(output_dir) if output_dir else src_dir
+
+    jobs_list = [
+        (dir_entry.name, dir_entry.path, os.path.join(output_dir, os.path.splitext(dir_entry.name)[0]))
+        for dir_entry in sorted(os.scandir(src_dir), key=lambda item: item.name)
+        if dir_entry.is_file() and dir_entry.name.lower().endswith(".kxr")
+    ]
+
+    if not jobs_list:
+        print(f"No Kxr files found in: '{src_dir}'")
+        return True
+
+    return run_batch("BATCH UNPACK SUMMARY", _unpack_one, jobs_list, jobs=jobs)
+
+
+async def _unpack_one(kxr_path: str, output_path: str) -> str:
+    # One log file per archive: workers appending to one shared file would interleave their lines
+    logger = logger_setup(f"{__name__}.unpack_all_{os.path.splitext(os.path.basename(kxr_path))[0].replace('.', '_')}")
+
+    kxr_file = KxrFile(kxr_path)
+
+    async with kxr_file.open():
+        pass
+
+    kxr_unpacker = KxrUnpacker(kxr_file, KFile(output_path), logger=logger, events=EventBus([BatchedLogWriter(logger)]))
+
+    await kxr_unpacker.unpack()
+
+    return kxr_file.generate_header_summary_block(kxr_unpacker.header_summary)
@@ -4,11 +4,24 @@ import asyncio
 from kxrlib.logger import logger_setup
 from kxrlib.console import get_yes_no_input
 from kxrlib import KxrFile, KFile, KxrUnpacker
-
-logger = logger_setup(__name__)
-
-
-def unpack_kxr(kxr_path: str, output_path: str | None = None):
+from kxrlib.packaging import KxrNameMatcher
+from kxrlib.io import EntryFilter
+from kxrlib.metrics import StageMetrics
+from kxrlib.events import EventBus, ProgressRenderer, BatchedLogWriter, JsonLinesSink
+
+
+def unpack_kxr(
+        kxr_path: str,
+        output_path: str | None = None,
+        metrics: bool = False,
+        progress: bool = True,
+        log: bool = True,
+        events_path: str | None = None,
+        confirm: bool = True,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        name_map_path: str | None = None
+):
     if not isinstance(kxr_path, str):
         raise TypeError(f"Argument 'kxr_file' must be {str}, not {type(kxr_path)}")
     if not isinstance(output_path, str) and output_path is not None:
@@ -24,10 +37,23 @@ def unpack_kxr(kxr_path: str, output_path: str | None = None):
     if output_path:
         output_path = os.path.abspath(output_path)
 
-    asyncio.run(_unpack_kxr(kxr_path, output_path))
+    asyncio.run(_unpack_kxr(kxr_path, output_path, metrics, progress, log, events_path, confirm, include, exclude, name_map_path))
 
 
-async def _unpack_kxr(kxr_path: str, output_path: str | None = None):
+async def _unpack_kxr(
+        kxr_path: str,
+        output_path: str | None = None,
+        metrics: bool = False,
+        progress: bool = True,
+        log: bool = True,
+        events_path: str | None = None,
+        confirm: bool = True,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        name_map_path: str | None = None
+):
+    logger = logger_setup(__name__)
+
     kxr_file = KxrFile(kxr_path)
 
     async with kxr_file.open():
@@ -41,13 +67,35 @@ async def _unpack_kxr(kxr_path: str, output_path: str | None = None):
 
     output_dir = KFile(output_path)
 
-    kxr_unpacker = KxrUnpacker(kxr_file, output_dir, logger=logger)
+    stage_metrics = StageMetrics() if metrics else None
+
+    event_bus = EventBus()
+
+    if progress:
+        event_bus.subscribe(ProgressRenderer())
+    if log:
+        event_bus.subscribe(BatchedLogWriter(logger))
+
+    entry_filter = EntryFilter(include, exclude)
+
+    name_map = KxrNameMatcher.load_name_map(name_map_path) if name_map_path else None
+
+    kxr_unpacker = KxrUnpacker(kxr_file, output_dir, logger=logger, metrics=stage_metrics, events=event_bus, entry_filter=entry_filter, name_map=name_map)
 
     print(kxr_file.generate_header_summary_block(kxr_unpacker.header_summary))
 
-    if not get_yes_no_input(f"Unpacking to: '{output_dir.path}'\nProceed?", "y"):
+    if confirm and not get_yes_no_input(f"Unpacking to: '{output_dir.path}'\nProceed?", "y"):
         return
 
-    await kxr_unpacker.unpack()
+    if events_path:
+        event_bus.subscribe(JsonLinesSink(events_path))
+
+    try:
+        await kxr_unpacker.unpack()
+    finally:
+        event_bus.close()
+
+    if stage_metrics is not None:
+        print(stage_metrics.generate_metrics_block())
 
     print("\nDone!")
@@ -0,0 +1,112 @@
+import os
+import sys
+import asyncio
+
+from kxrlib.logger import logger_setup
+from kxrlib.console import get_yes_no_input
+from kxrlib import KxrFile
+from kxrlib.packaging import KxrTarStreamer, KxrNameMatcher
+from kxrlib.io import EntryFilter
+from kxrlib.metrics import StageMetrics
+from kxrlib.events import EventBus, ProgressRenderer, BatchedLogWriter, JsonLinesSink
+
+STDOUT = "-"
+
+
+def unpack_tar_kxr(
+        kxr_path: str,
+        output_path: str | None = None,
+        metrics: bool = False,
+        progress: bool = True,
+        log: bool = True,
+        events_path: str | None = None,
+        confirm: bool = True,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        name_map_path: str | None = None
+):
+    """Writes the KXR as a tar stream to output_path, or to stdout when output_path is "-"."""
+    if not isinstance(kxr_path, str):
+        raise TypeError(f"Argument 'kxr_path' must be {str}, not {type(kxr_path)}")
+    if not isinstance(output_path, str) and output_path is not None:
+        raise TypeError(f"Argument 'output_path' must be {str}, not {type(output_path)}")
+
+    kxr_path = os.path.abspath(kxr_path)
+
+    if not os.path.exists(kxr_path):
+        raise FileNotFoundError(f"File not found: '{kxr_path}'")
+    if not os.path.isfile(kxr_path):
+        raise IsADirectoryError(f"Kxr file must not be a directory: '{kxr_path}'")
+
+    if output_path and output_path != STDOUT:
+        output_path = os.path.abspath(output_path)
+
+    asyncio.run(_unpack_tar_kxr(kxr_path, output_path, metrics, progress, log, events_path, confirm, include, exclude, name_map_path))
+
+
+async def _unpack_tar_kxr(
+        kxr_path: str,
+        output_path: str | None = None,
+        metrics: bool = False,
+        progress: bool = True,
+        log: bool = True,
+        events_path: str | None = None,
+        confirm: bool = True,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        name_map_path: str | None = None
+):
+    logger = logger_setup(__name__)
+
+    to_stdout = output_path == STDOUT
+    console = sys.stderr if to_stdout else sys.stdout
+
+    kxr_file = KxrFile(kxr_path)
+
+    async with kxr_file.open():
+        kxr_name = kxr_file.root.name if kxr_file.root.name else kxr_file.matched_name
+
+    if not output_path:
+        output_path = os.path.join(os.path.dirname(kxr_path), kxr_name + ".tar")
+
+    stage_metrics = StageMetrics() if metrics else None
+
+    event_bus = EventBus()
+
+    if progress:
+        event_bus.subscribe(ProgressRenderer(stream=console))
+    if log:
+        event_bus.subscribe(BatchedLogWriter(logger))
+
+    entry_filter = EntryFilter(include, exclude)
+
+    name_map = KxrNameMatcher.load_name_map(name_map_path) if name_map_path else None
+
+    print(kxr_file.generate_header_summary_block(
+        entry_filter.summarize(entry_filter.select(kxr_file.root)) if entry_filter.active else None
+    ), file=console)
+
+    if not to_stdout and confirm and not get_yes_no_input(f"Unpacking to: '{output_path}'\nProceed?", "y"):
+        return
+
+    if events_path:
+        event_bus.subscribe(JsonLinesSink(events_path))
+
+    fileobj = sys.stdout.buffer if to_stdout else open(output_path, "wb")
+
+    try:
+        tar_streamer = KxrTarStreamer(kxr_file, fileobj, logger=logger, metrics=stage_metrics, events=event_bus, entry_filter=entry_filter, name_map=name_map)
+
+        await tar_streamer.stream()
+    finally:
+        event_bus.close()
+
+        if to_stdout:
+            fileobj.flush()
+        else:
+            fileobj.close()
+
+    if stage_metrics is not None:
+        print(stage_metrics.generate_metrics_block(), file=console)
+
+    print("\nDone!", file=console)
@@ -0,0 +1,59 @@
+import os
+import asyncio
+
+from kxrlib.console import generate_statistics_block, format_time
+from kxrlib.io import KxrFile
+from kxrlib.packaging import KxrVerifier
+
+
+def verify_kxr(kxr_path: str, jobs: int | None = None, use_hashes: bool = True, write_hashes: bool = False) -> bool:
+    if not isinstance(kxr_path, str):
+        raise TypeError(f"Argument 'kxr_path' must be {str}, not {type(kxr_path)}")
+
+    kxr_path = os.path.abspath(kxr_path)
+
+    if not os.path.exists(kxr_path):
+        raise FileNotFoundError(f"File not found: '{kxr_path}'")
+    if not os.path.isfile(kxr_path):
+        raise IsADirectoryError(f"Kxr file must not be a directory: '{kxr_path}'")
+
+    return asyncio.run(_verify_kxr(kxr_path, jobs, use_hashes, write_hashes))
+
+
+async def _verify_kxr(kxr_path: str, jobs: int | None = None, use_hashes: bool = True, write_hashes: bool = False) -> bool:
+    kxr_file = KxrFile(kxr_path)
+    kxr_verifier = KxrVerifier(kxr_file, max_workers=jobs)
+
+    start_time = asyncio.get_running_loop().time()
+
+    report = await kxr_verifier.verify(use_hashes=use_hashes, write_hashes=write_hashes)
+
+    elapsed_time = asyncio.get_running_loop().time() - start_time
+
+    for error in report["layout_errors"]:
+        print(f"LAYOUT  {error}")
+
+    for path, error in report["corrupt"]:
+        print(f"CORRUPT \"{path}\": {error}")
+
+    desc_strings = [
+        "Kxr file",
+        "Entries",
+        "Layout errors",
+        "Corrupt entries",
+        "Mode",
+        "Time elapsed"
+    ]
+
+    value_strings = [
+        kxr_file.name,
+        str(report["entries"]),
+        str(len(report["layout_errors"])),
+        str(len(report["corrupt"])),
+        f"{kxr_verifier.algorithm} sidecar" if report["used_hashes"] else "full decode",
+        format_time(elapsed_time)
+    ]
+
+    print(generate_statistics_block("VERIFY SUMMARY", desc_strings, value_strings))
+
+    return not report["layout_errors"] and not report["corrupt"]
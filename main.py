@@ -1,6 +1,6 @@
 import argparse
-
-from kxrlib import pack_kxr, unpack_kxr
+import os
+import sys
 
 
 def main():
@@ -12,21 +12,178 @@ def main():
     subparsers = parser.add_subparsers(title="commands", dest="command", required=True)
 
     pack_parser = subparsers.add_parser("pack", help="Pack a KXR from a source directory")
-    pack_parser.add_argument("source_dir", type=str, help="Source directory to pack")
+    pack_parser.add_argument("source_dir", type=str, help="Source directory, or tar/zip archive, to pack")
     pack_parser.add_argument("-o", "--output", help="Destination KXR to create")
+    pack_parser.add_argument("--metrics", action="store_true", help="Report per-stage timings and byte counters")
+    pack_parser.add_argument("--no-progress", action="store_true", help="Disable the progress bar")
+    pack_parser.add_argument("--no-log", action="store_true", help="Disable per-file logging")
+    pack_parser.add_argument("--events", metavar="PATH", help="Write per-file events as JSON lines to PATH")
+    pack_parser.add_argument("-y", "--yes", action="store_true", help="Do not ask for confirmation")
+    pack_parser.add_argument("--layout", choices=["filesystem", "directory", "type", "trace"], default="filesystem", help="Order in which blobs are laid out in the data region")
+    pack_parser.add_argument("--trace", metavar="PATH", help="Access trace to replay for '--layout trace'")
+    pack_parser.add_argument("--preallocate", action="store_true", help="Reserve disk space for the archive up front")
+    pack_parser.add_argument("--optimize-size", action="store_true", help="Search zlib settings per entry for the smallest archive (slow)")
+    pack_parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes for '--optimize-size' (default: CPU count)")
 
     unpack_parser = subparsers.add_parser("unpack", help="Unpack a KXR to an output directory")
     unpack_parser.add_argument("source_kxr", type=str, help="Source KXR to unpack")
-    unpack_parser.add_argument("-o", "--output", help="Destination directory to unpack to")
+    unpack_parser.add_argument("-o", "--output", help="Destination directory to unpack to (tar file for '--format tar', '-' for stdout)")
+    unpack_parser.add_argument("--format", choices=["dir", "tar"], default="dir", help="Write a directory tree or stream a tar archive")
+    unpack_parser.add_argument("--metrics", action="store_true", help="Report per-stage timings and byte counters")
+    unpack_parser.add_argument("--no-progress", action="store_true", help="Disable the progress bar")
+    unpack_parser.add_argument("--no-log", action="store_true", help="Disable per-file logging")
+    unpack_parser.add_argument("--events", metavar="PATH", help="Write per-file events as JSON lines to PATH")
+    unpack_parser.add_argument("-y", "--yes", action="store_true", help="Do not ask for confirmation")
+    unpack_parser.add_argument("-i", "--include", action="append", metavar="GLOB", help="Only extract entries matching GLOB (repeatable)")
+    unpack_parser.add_argument("-x", "--exclude", action="append", metavar="GLOB", help="Skip entries and folders matching GLOB (repeatable)")
+    unpack_parser.add_argument("--name-map", metavar="PATH", help="Write entries to the paths restored by 'match-names'")
+
+    pack_all_parser = subparsers.add_parser("pack-all", help="Pack every subdirectory of a directory into its own KXR")
+    pack_all_parser.add_argument("source_root", type=str, help="Directory whose subdirectories are packed")
+    pack_all_parser.add_argument("-o", "--output", help="Directory to write the KXRs to")
+    pack_all_parser.add_argument("-j", "--jobs", type=int, help="Number of archives to pack concurrently (default: CPU count)")
+
+    unpack_all_parser = subparsers.add_parser("unpack-all", help="Unpack every KXR in a directory")
+    unpack_all_parser.add_argument("source_dir", type=str, help="Directory containing the KXRs")
+    unpack_all_parser.add_argument("-o", "--output", help="Directory to unpack into (one subdirectory per KXR)")
+    unpack_all_parser.add_argument("-j", "--jobs", type=int, help="Number of archives to unpack concurrently (default: CPU count)")
+
+    seek_parser = subparsers.add_parser("seek-distance", help="Report the seek distance of an access trace against a KXR")
+    seek_parser.add_argument("trace", type=str, help="Access trace recorded with KxrFile(trace=AccessTrace())")
+    seek_parser.add_argument("source_kxr", type=str, help="KXR to replay the trace against")
+
+    verify_parser = subparsers.add_parser("verify", help="Check a KXR's layout and decode every entry without writing output")
+    verify_parser.add_argument("source_kxr", type=str, help="Source KXR to verify")
+    verify_parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes (default: CPU count)")
+    verify_parser.add_argument("--full", action="store_true", help="Ignore the hash sidecar and decode every entry")
+    verify_parser.add_argument("--write-hashes", action="store_true", help="Write a hash sidecar for fast re-verification when the archive is intact")
+
+    diff_parser = subparsers.add_parser("diff", help="Report added, removed and modified entries between two KXRs as JSON")
+    diff_parser.add_argument("old_kxr", type=str, help="Previous version of the KXR")
+    diff_parser.add_argument("new_kxr", type=str, help="New version of the KXR")
+    diff_parser.add_argument("-o", "--output", help="Write the JSON report to a file instead of stdout")
+    diff_parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes for content comparison (default: CPU count)")
+    diff_parser.add_argument("--size-only", action="store_true", help="Report zipped entries with a different stored size as modified without comparing content (fast, but recompressed entries show up)")
+
+    match_parser = subparsers.add_parser("match-names", help="Restore entry names by fingerprinting a KXR against a named reference")
+    match_parser.add_argument("source_kxr", type=str, help="KXR whose entries should be named")
+    match_parser.add_argument("reference", type=str, help="Previously unpacked directory with known names, or a saved fingerprint index")
+    match_parser.add_argument("-o", "--output", help="Name map to write (default: <kxr without .kxr>.names.json next to it, e.g. anon.kxr -> anon.names.json)")
+    match_parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes (default: CPU count)")
+    match_parser.add_argument("--max-distance", type=int, default=6, help="Maximum simhash distance for near matches")
+    match_parser.add_argument("--save-index", metavar="PATH", help="Save the reference directory's fingerprint index for reuse")
+
+    sniff_parser = subparsers.add_parser("sniff", help="Classify every entry of a KXR by its leading bytes")
+    sniff_parser.add_argument("source_kxr", type=str, help="Source KXR to classify")
+    sniff_parser.add_argument("-o", "--output", help="Write {path: detected type} as JSON to a file")
+    sniff_parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes (default: CPU count)")
+
+    ls_parser = subparsers.add_parser("ls", help="List path, offset, size, flags and timestamps of every entry as JSON lines or CSV")
+    ls_parser.add_argument("source_kxrs", type=str, nargs="+", help="KXRs to list")
+    ls_parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl", help="Output format")
+    ls_parser.add_argument("-o", "--output", help="Write the manifest to a file instead of stdout")
+
+    profile_parser = subparsers.add_parser("profile", help="Pack or unpack under cProfile and report hot functions by subsystem and peak memory by phase")
+    profile_parser.add_argument("operation", choices=["pack", "unpack"], help="Operation to profile")
+    profile_parser.add_argument("source", type=str, help="Source directory or tar/zip archive to pack, or KXR to unpack")
+    profile_parser.add_argument("-o", "--output", help="Keep the packed KXR or unpacked directory here (default: temporary, removed afterwards)")
+    profile_parser.add_argument("--stats", metavar="PREFIX", help="Write PREFIX.pstats and PREFIX.collapsed (default: profiles/<source>.<operation>)")
+    profile_parser.add_argument("--memory", action="store_true", help="Trace allocations with tracemalloc for per-phase peaks (slower)")
+    profile_parser.add_argument("--top", type=int, default=15, help="Number of hot functions to list")
+    profile_parser.add_argument("--interval", type=float, default=1.0, help="Stack sampling interval in milliseconds")
+    profile_parser.add_argument("-y", "--yes", action="store_true", help="Overwrite an existing output without asking")
 
     args = parser.parse_args()
 
     match args.command:
         case "pack":
-            pack_kxr(args.source_dir, args.output)
+            from kxrlib.utils import pack_kxr
+
+            pack_kxr(
+                args.source_dir,
+                args.output,
+                metrics=args.metrics,
+                progress=not args.no_progress,
+                log=not args.no_log,
+                events_path=args.events,
+                layout=args.layout,
+                trace_path=args.trace,
+                confirm=not args.yes,
+                preallocate=args.preallocate,
+                optimize_size=args.optimize_size,
+                jobs=args.jobs
+            )
 
         case "unpack":
-            unpack_kxr(args.source_kxr, args.output)
+            if args.format == "tar":
+                from kxrlib.utils import unpack_tar_kxr as unpack_kxr
+            else:
+                from kxrlib.utils import unpack_kxr
+
+            unpack_kxr(
+                args.source_kxr,
+                args.output,
+                metrics=args.metrics,
+                progress=not args.no_progress,
+                log=not args.no_log,
+                events_path=args.events,
+                confirm=not args.yes,
+                include=args.include,
+                exclude=args.exclude,
+                name_map_path=args.name_map
+            )
+
+        case "pack-all":
+            from kxrlib.utils import pack_all_kxr
+
+            if not pack_all_kxr(args.source_root, args.output, jobs=args.jobs):
+                sys.exit(1)
+
+        case "unpack-all":
+            from kxrlib.utils import unpack_all_kxr
+
+            if not unpack_all_kxr(args.source_dir, args.output, jobs=args.jobs):
+                sys.exit(1)
+
+        case "match-names":
+            from kxrlib.utils import match_names_kxr
+
+            match_names_kxr(args.source_kxr, args.reference, args.output, jobs=args.jobs, max_distance=args.max_distance, index_path=args.save_index)
+
+        case "ls":
+            from kxrlib.utils import ls_kxr
+
+            try:
+                ls_kxr(args.source_kxrs, args.format, args.output)
+            except BrokenPipeError:
+                # The reader (e.g. `head`) went away; don't let the interpreter complain on exit
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+        case "sniff":
+            from kxrlib.utils import sniff_kxr
+
+            sniff_kxr(args.source_kxr, args.output, jobs=args.jobs)
+
+        case "diff":
+            from kxrlib.utils import diff_kxr
+
+            diff_kxr(args.old_kxr, args.new_kxr, args.output, jobs=args.jobs, size_only=args.size_only)
+
+        case "profile":
+            from kxrlib.utils import profile_kxr
+
+            profile_kxr(args.operation, args.source, args.output, stats_prefix=args.stats, trace_memory=args.memory, top=args.top, interval=args.interval / 1000, confirm=not args.yes)
+
+        case "seek-distance":
+            from kxrlib.utils import seek_distance_kxr
+
+            seek_distance_kxr(args.trace, args.source_kxr)
+
+        case "verify":
+            from kxrlib.utils import verify_kxr
+
+            if not verify_kxr(args.source_kxr, jobs=args.jobs, use_hashes=not args.full, write_hashes=args.write_hashes):
+                sys.exit(1)
 
 
 if __name__ == "__main__":